@@ -0,0 +1,199 @@
+"""
+Benchmarks of Client against the local mock Cat API: requests per second of every method,
+throughput as the number of threads grows, and the cost of building the models.
+The results are printed and can be written as JSON to compare runs.
+
+Usage:
+    python benchmarks/bench_client.py [--duration 2] [--latency 0.005] [--output results.json]
+    python benchmarks/bench_client.py --compare before.json after.json
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import tempfile
+import time
+import timeit
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable
+
+import bench_convert
+from mock_server import MockCatAPI
+
+from pymeow import Client
+from pymeow.models import Breed, CatPic, UserVote
+from pymeow.utils import construct_model
+
+CONCURRENCY = (1, 2, 4, 8, 16, 32)
+
+
+def methods(client: Client, image_path: str) -> Dict[str, Callable[[], object]]:
+    return {
+        "get_cat(limit=10, has_breeds=True)": lambda: client.get_cat(limit=10, has_breeds=True),
+        "get_cat(limit=100, has_breeds=True)": lambda: client.get_cat(limit=100, has_breeds=True),
+        "get_breed_info": lambda: client.get_breed_info("breed 1"),
+        "get_all_breeds": client.get_all_breeds,
+        "get_upload_images(limit=100)": lambda: client.get_upload_images(limit=100),
+        "get_votes(limit=100)": lambda: client.get_votes(limit=100),
+        "get_vote_by_id": lambda: client.get_vote_by_id(1),
+        "get_random_fact(limit=10)": lambda: client.get_random_fact(limit=10),
+        "get_breed_fact(limit=10)": lambda: client.get_breed_fact("b001", limit=10, order="ASC"),
+        "get_version": client.get_version,
+        "vote": lambda: client.vote("up00001", "bench", 1),
+        "upload_image": lambda: client.upload_image(image_path, sub_id="bench"),
+    }
+
+
+def measure(call: Callable[[], object], duration: float) -> dict:
+    """
+    Call a function repeatedly for duration seconds and return its rate and latencies in milliseconds.
+    """
+    latencies = []
+    started = time.perf_counter()
+    while time.perf_counter() - started < duration:
+        begin = time.perf_counter()
+        call()
+        latencies.append(time.perf_counter() - begin)
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "rps": len(latencies) / elapsed,
+        "p50_ms": latencies[len(latencies) // 2] * 1000,
+        "p95_ms": latencies[int(len(latencies) * 0.95)] * 1000,
+        "mean_ms": statistics.fmean(latencies) * 1000,
+    }
+
+
+def bench_methods(client: Client, duration: float) -> Dict[str, dict]:
+    with tempfile.NamedTemporaryFile(suffix=".jpg", delete=False) as image:
+        image.write(os.urandom(64 * 1024))
+    try:
+        return {name: measure(call, duration) for name, call in methods(client, image.name).items()}
+    finally:
+        os.remove(image.name)
+
+
+def bench_concurrency(client: Client, duration: float, levels: Iterable[int] = CONCURRENCY) -> Dict[str, dict]:
+    """
+    Measure the throughput of get_cat(limit=10) with a growing number of threads sharing the client.
+    """
+    results = {}
+    for threads in levels:
+        deadline = time.perf_counter() + duration
+
+        def worker() -> int:
+            count = 0
+            while time.perf_counter() < deadline:
+                client.get_cat(limit=10, has_breeds=True)
+                count += 1
+            return count
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            requests = sum(future.result() for future in [executor.submit(worker) for _ in range(threads)])
+        results[str(threads)] = {"requests": requests, "rps": requests / (time.perf_counter() - started)}
+    return results
+
+
+def bench_models(number: int = 2000) -> Dict[str, float]:
+    """
+    Time the construction of single models, in microseconds.
+    """
+    image = {"id": "up00001", "url": "https://cdn2.thecatapi.com/images/up00001.jpg", "width": 1200, "height": 800,
+             "sub_id": "user-1", "created_at": "2024-01-01T00:00:00.000Z", "breed_ids": "abys"}
+    vote = {"id": 1, "image_id": "up00001", "sub_id": "user-1", "value": 1, "created_at": "2024-01-01T00:00:00.000Z"}
+    cases = {
+        "Breed(**data)": lambda: Breed(**bench_convert.BREED),
+        "construct_model(Breed)": lambda: construct_model(Breed, bench_convert.BREED),
+        "CatPic(**data)": lambda: CatPic(**image),
+        "construct_model(CatPic)": lambda: construct_model(CatPic, image),
+        "UserVote(**data)": lambda: UserVote(**vote),
+        "construct_model(UserVote)": lambda: construct_model(UserVote, vote),
+    }
+    return {name: min(timeit.repeat(case, repeat=5, number=number)) / number * 1e6 for name, case in cases.items()}
+
+
+def run(duration: float = 2.0, latency: float = 0.005, breeds_per_image: int = 1,
+        levels: Iterable[int] = CONCURRENCY) -> dict:
+    with MockCatAPI(latency=latency, breeds_per_image=breeds_per_image) as api:
+        client = Client(api_key="bench", pool_maxsize=max(levels))
+        client.uri = api.uri
+        with client:
+            results = {
+                "methods": bench_methods(client, duration),
+                "concurrency": bench_concurrency(client, duration, levels),
+            }
+    results["convert_ms"] = bench_convert.run()
+    results["models_us"] = bench_models()
+    results["meta"] = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "duration": duration,
+        "latency": latency,
+        "breeds_per_image": breeds_per_image,
+    }
+    return results
+
+
+def report(results: dict) -> None:
+    print(f"Requests per method (server latency {results['meta']['latency'] * 1000:g} ms)")
+    for name, stats in results["methods"].items():
+        print(f"  {name:<38} {stats['rps']:9.1f} req/s  p50 {stats['p50_ms']:7.2f} ms  p95 {stats['p95_ms']:7.2f} ms")
+    print("Concurrency scaling, get_cat(limit=10, has_breeds=True)")
+    for threads, stats in results["concurrency"].items():
+        print(f"  {threads:>3} threads {stats['rps']:9.1f} req/s")
+    print("convert_json_to_obj, 100 images with breeds")
+    for name, elapsed in results["convert_ms"].items():
+        print(f"  {name:<38} {elapsed:9.3f} ms")
+    print("Model construction")
+    for name, elapsed in results["models_us"].items():
+        print(f"  {name:<38} {elapsed:9.2f} us")
+
+
+def compare(before: dict, after: dict) -> None:
+    """
+    Print the relative change of every metric between two runs. Rates should go up and times down.
+    """
+    rows = [(f"methods/{name}", "rps", stats["rps"], after["methods"].get(name, {}).get("rps"))
+            for name, stats in before["methods"].items()]
+    rows += [(f"concurrency/{threads}", "rps", stats["rps"], after["concurrency"].get(threads, {}).get("rps"))
+             for threads, stats in before["concurrency"].items()]
+    rows += [(f"convert/{name}", "ms", value, after["convert_ms"].get(name))
+             for name, value in before["convert_ms"].items()]
+    rows += [(f"models/{name}", "us", value, after["models_us"].get(name))
+             for name, value in before["models_us"].items()]
+    for name, unit, old, new in rows:
+        if new is None:
+            continue
+        change = (new - old) / old * 100 if old else 0.0
+        print(f"{name:<50} {old:10.2f} -> {new:10.2f} {unit:<3} {change:+7.1f}%")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--duration", type=float, default=2.0, help="Seconds spent on every measurement")
+    parser.add_argument("--latency", type=float, default=0.005, help="Latency in seconds added by the server")
+    parser.add_argument("--breeds-per-image", type=int, default=1)
+    parser.add_argument("--threads", type=int, nargs="+", default=list(CONCURRENCY))
+    parser.add_argument("--output", help="Write the results to this JSON file, or to stdout with -")
+    parser.add_argument("--compare", nargs=2, metavar=("BEFORE", "AFTER"), help="Compare two JSON results and exit")
+    args = parser.parse_args()
+    if args.compare:
+        with open(args.compare[0]) as before, open(args.compare[1]) as after:
+            compare(json.load(before), json.load(after))
+        return
+    results = run(args.duration, args.latency, args.breeds_per_image, args.threads)
+    if args.output == "-":
+        print(json.dumps(results, indent=2))
+        return
+    report(results)
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Benchmarks of utils.convert_json_to_obj on a get_cat(limit=100, has_breeds=True) sized payload.
+
+Usage:
+    python benchmarks/bench_convert.py [--images 100] [--repeat 5] [--number 20]
+"""
+import argparse
+import copy
+import timeit
+
+from pymeow.utils import convert_json_to_obj
+
+BREED = {
+    "weight": {"imperial": "7  -  10", "metric": "3 - 5"}, "id": "abys", "name": "Abyssinian",
+    "cfa_url": "http://cfa.org/Breeds/BreedsAB/Abyssinian.aspx",
+    "vetstreet_url": "http://www.vetstreet.com/cats/abyssinian",
+    "vcahospitals_url": "https://vcahospitals.com/know-your-pet/cat-breeds/abyssinian",
+    "temperament": "Active, Energetic, Independent, Intelligent, Gentle", "origin": "Egypt",
+    "country_codes": "EG", "country_code": "EG",
+    "description": "The Abyssinian is easy to care for, and a joy to have in your home. "
+                   "They're affectionate cats and love both people and other animals.",
+    "life_span": "14 - 15", "indoor": 0, "lap": 1, "alt_names": "", "adaptability": 5, "affection_level": 5,
+    "child_friendly": 3, "dog_friendly": 4, "energy_level": 5, "grooming": 1, "health_issues": 2,
+    "intelligence": 5, "shedding_level": 2, "social_needs": 5, "stranger_friendly": 5, "vocalisation": 1,
+    "experimental": 0, "hairless": 0, "natural": 1, "rare": 0, "rex": 0, "suppressed_tail": 0, "short_legs": 0,
+    "wikipedia_url": "https://en.wikipedia.org/wiki/Abyssinian_(cat)", "hypoallergenic": 0,
+    "reference_image_id": "0XYvRd7oD",
+}
+
+
+def make_payload(images: int = 100) -> list:
+    """
+    Build a response of images/search with one breed per image.
+    """
+    return [{"breeds": [dict(BREED)], "id": f"img{i:05d}", "url": f"https://cdn2.thecatapi.com/images/img{i:05d}.jpg",
+             "width": 1200, "height": 800} for i in range(images)]
+
+
+def legacy_convert_json_to_obj(json_data):
+    """
+    The conversion before the fast path: it validates everything and deletes 'breeds' from the input.
+    """
+    from pymeow.models import Cat
+    from pymeow.utils import convert_breed_info, convert_pic_info
+    result_list = []
+    for i in json_data:
+        if 'breeds' in i:
+            breed_info = convert_breed_info(i['breeds'])
+            del i['breeds']
+        else:
+            breed_info = None
+        pic_info = convert_pic_info(i)
+        result_list.append(Cat(breed_info=breed_info, image_info=pic_info))
+    return result_list
+
+
+def cases(payload: list) -> dict:
+    return {
+        # The legacy path mutates its input, so it gets a fresh copy. The copy is timed separately below.
+        "legacy (validate, mutates input)": lambda: legacy_convert_json_to_obj(copy.deepcopy(payload)),
+        "input deepcopy (legacy overhead)": lambda: copy.deepcopy(payload),
+        "validate=True": lambda: convert_json_to_obj(payload),
+        "validate=False": lambda: convert_json_to_obj(payload, validate=False),
+        "validate=False, lazy=True": lambda: convert_json_to_obj(payload, validate=False, lazy=True),
+        "lazy=True, breed_info accessed": lambda: [cat.breed_info for cat in
+                                                   convert_json_to_obj(payload, validate=False, lazy=True)],
+    }
+
+
+def run(images: int = 100, repeat: int = 5, number: int = 20) -> dict:
+    """
+    Time every case and return the best time of a call in milliseconds.
+    """
+    payload = make_payload(images)
+    return {name: min(timeit.repeat(case, repeat=repeat, number=number)) / number * 1000
+            for name, case in cases(payload).items()}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--images", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--number", type=int, default=20)
+    args = parser.parse_args()
+    results = run(args.images, args.repeat, args.number)
+    baseline = results["validate=True"]
+    print(f"convert_json_to_obj, {args.images} images with breeds (speedup relative to validate=True)")
+    for name, elapsed in results.items():
+        print(f"{name:<36} {elapsed:8.3f} ms  {baseline / elapsed:6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
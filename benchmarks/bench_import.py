@@ -0,0 +1,70 @@
+"""
+Import-time budget of pymeow. Every statement runs in a fresh interpreter, several times,
+and the median time is compared to its budget. Heavy dependencies that a statement must not
+load are checked too. The exit status is 1 if a budget is exceeded, so it can run in CI.
+
+Usage:
+    python benchmarks/bench_import.py [--runs 7] [--output results.json]
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+HEAVY_MODULES = ("requests", "pydantic", "numpy", "aiohttp", "asyncio")
+
+#: (statement, budget in milliseconds, modules it must not load)
+BUDGETS = [
+    ("import pymeow", 5, HEAVY_MODULES),
+    ("from pymeow import Client", 80, HEAVY_MODULES),
+    ("from pymeow import Client; Client(records=True)", 250, ("pydantic", "numpy", "aiohttp", "asyncio")),
+    ("from pymeow import Client; Client()", 250, ("pydantic", "numpy", "aiohttp", "asyncio")),
+    ("from pymeow import Client; Client().models", 600, ("numpy", "aiohttp", "asyncio")),
+]
+
+PROBE = """
+import sys, time
+started = time.perf_counter()
+exec({statement!r})
+elapsed = time.perf_counter() - started
+print(elapsed * 1000, *[name for name in {modules!r} if name in sys.modules])
+"""
+
+
+def measure(statement: str, modules=HEAVY_MODULES, runs: int = 7) -> dict:
+    """
+    Run a statement in fresh interpreters and return the median time in milliseconds
+    and the heavy modules it loaded.
+    """
+    times, loaded = [], set()
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, "-c", PROBE.format(statement=statement, modules=tuple(modules))],
+                                check=True, capture_output=True, text=True).stdout.split()
+        times.append(float(output[0]))
+        loaded.update(output[1:])
+    return {"median_ms": statistics.median(times), "min_ms": min(times), "loaded": sorted(loaded)}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=7)
+    parser.add_argument("--output", help="Write the results to this JSON file")
+    args = parser.parse_args()
+    results, failed = {}, False
+    for statement, budget, forbidden in BUDGETS:
+        result = results[statement] = measure(statement, forbidden, args.runs)
+        result["budget_ms"] = budget
+        result["ok"] = result["median_ms"] <= budget and not result["loaded"]
+        failed |= not result["ok"]
+        loaded = f"  loaded {', '.join(result['loaded'])}" if result["loaded"] else ""
+        print(f"{'ok  ' if result['ok'] else 'FAIL'} {statement:<52} {result['median_ms']:7.1f} ms "
+              f"(budget {budget} ms){loaded}")
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2)
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,281 @@
+"""
+A local stand-in for the Cat API, for benchmarks that must not depend on thecatapi.com.
+
+It serves the endpoints used by Client with generated data, and can add latency,
+grow the payloads and fail a fraction of the requests.
+
+Usage:
+    python benchmarks/mock_server.py [--port 8080] [--latency 0.02] [--error-rate 0.01]
+
+Then point a client at it: client.uri = "http://127.0.0.1:8080/v1/"
+"""
+import argparse
+import itertools
+import json
+import random
+import threading
+import time
+from email.parser import BytesParser
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from bench_convert import BREED
+
+TRUE_VALUES = ("1", "true", "True")
+
+
+class MockCatAPI:
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency: float = 0.0, jitter: float = 0.0,
+                 error_rate: float = 0.0, error_status: int = 503, breeds: int = 67, breeds_per_image: int = 1,
+                 images: int = 500, votes: int = 1000, facts: int = 200, max_limit: int = 100, seed: int = 0) -> None:
+        """
+        :param host: The address to listen on.
+        :param port: The port to listen on (default is a free port).
+        :param latency: The delay in seconds added to every response.
+        :param jitter: A random delay in seconds added on top of latency.
+        :param error_rate: The fraction of requests that fail with error_status.
+        :param error_status: The status of the injected errors. 429 responses carry a Retry-After header.
+        :param breeds: The number of breeds in the catalog.
+        :param breeds_per_image: The number of breeds attached to every image search result.
+        :param images: The number of uploaded images already stored.
+        :param votes: The number of votes already stored.
+        :param facts: The number of facts.
+        :param max_limit: The largest page size served, like the real API.
+        :param seed: The seed of the generated data and of the error injection.
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.breeds_per_image = breeds_per_image
+        self.max_limit = max_limit
+        self.stats: Dict[str, int] = {"requests": 0, "errors": 0}
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._ids = itertools.count(votes + 1)
+        self.breeds = [dict(BREED, id=f"b{i:03d}", name=f"Breed {i}", origin=("Egypt", "Russia", "Thailand")[i % 3],
+                            energy_level=i % 5 + 1) for i in range(breeds)]
+        self.images = [{"id": f"up{i:05d}", "url": f"https://cdn2.thecatapi.com/images/up{i:05d}.jpg",
+                        "width": 1200, "height": 800, "sub_id": f"user-{i % 10}", "breed_ids": self._breed_id(i),
+                        "original_filename": f"up{i:05d}.jpg",
+                        "created_at": f"2024-01-{i % 28 + 1:02d}T00:00:{i % 60:02d}.000Z"} for i in range(images)]
+        self.votes = [{"id": i + 1, "image_id": f"up{i % max(images, 1):05d}", "sub_id": f"user-{i % 10}",
+                       "value": 1 if i % 3 else -1, "created_at": f"2024-02-{i % 28 + 1:02d}T00:00:00.000Z"}
+                      for i in range(votes)]
+        self.facts = [{"id": str(i), "fact": f"Fact number {i} about cats.", "breed_id": self._breed_id(i),
+                       "title": f"Fact {i}"} for i in range(facts)]
+        handler = type("Handler", (_Handler,), {"api": self})
+        self.server = ThreadingHTTPServer((host, port), handler)
+        self.server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def uri(self) -> str:
+        """
+        The base URI to set on a client, e.g. http://127.0.0.1:8080/v1/
+        """
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}/v1/"
+
+    def start(self) -> "MockCatAPI":
+        """
+        Serve in a background thread.
+        """
+        self._thread = threading.Thread(target=self.server.serve_forever, name="mock-cat-api", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.stop()
+
+    def _breed_id(self, index: int) -> Optional[str]:
+        return self.breeds[index % len(self.breeds)]["id"] if self.breeds else None
+
+    def _inject(self) -> bool:
+        """
+        Wait for the configured latency and decide whether the request fails.
+        """
+        with self._lock:
+            self.stats["requests"] += 1
+            delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0.0)
+            failed = self.error_rate > 0 and self._random.random() < self.error_rate
+            if failed:
+                self.stats["errors"] += 1
+        if delay:
+            time.sleep(delay)
+        return failed
+
+    def handle(self, method: str, path: str, query: Dict[str, str], body: bytes,
+               content_type: str) -> Tuple[int, object]:
+        """
+        Return the status and the JSON payload of a request.
+        """
+        segments = [segment for segment in path.split("/") if segment]
+        if segments[:1] == ["v1"]:
+            segments = segments[1:]
+        page, limit = int(query.get("page", 0)), min(int(query.get("limit", 1)), self.max_limit)
+        route = (method, *segments[:1], *(segment if segment in ("search", "upload", "facts") else "{id}"
+                                          for segment in segments[1:]))
+        if route == ("GET",):
+            return 200, {"message": "The Cat API", "version": "1.0.0"}
+        if route == ("GET", "images", "search"):
+            return 200, self._search_images(page, limit, query)
+        if route == ("GET", "images"):
+            images = sorted(self._filter(self.images, query, "sub_id", "breed_ids"),
+                            key=lambda image: image["created_at"], reverse=query.get("order", "DESC") == "DESC")
+            return 200, self._page(images, page, limit)
+        if route == ("POST", "images", "upload"):
+            return 201, self._upload(body, content_type)
+        if route == ("DELETE", "images", "{id}"):
+            with self._lock:
+                found = [image for image in self.images if image["id"] == segments[1]]
+                for image in found:
+                    self.images.remove(image)
+            return (204, None) if found else (400, {"message": "INVALID_IMAGE"})
+        if route == ("GET", "votes"):
+            return 200, self._page(self._filter(self.votes, query, "sub_id"), page, limit)
+        if route == ("POST", "votes"):
+            vote = json.loads(body or b"{}")
+            vote = {"id": next(self._ids), "image_id": vote.get("image_id"), "sub_id": vote.get("sub_id"),
+                    "value": vote.get("value"), "created_at": time.strftime("%Y-%m-%dT%H:%M:%S.000Z", time.gmtime())}
+            with self._lock:
+                self.votes.append(vote)
+            return 201, {"message": "SUCCESS", "id": vote["id"], "image_id": vote["image_id"],
+                         "sub_id": vote["sub_id"], "value": vote["value"]}
+        if route in (("GET", "votes", "{id}"), ("DELETE", "votes", "{id}")):
+            vote = next((vote for vote in self.votes if str(vote["id"]) == segments[1]), None)
+            if vote is None:
+                return 404, {"message": "NOT_FOUND"}
+            if method == "GET":
+                return 200, vote
+            with self._lock:
+                self.votes.remove(vote)
+            return 200, {"message": "SUCCESS"}
+        if route == ("GET", "breeds"):
+            return 200, self._page(self.breeds, page, limit) if "limit" in query else self.breeds
+        if route == ("GET", "breeds", "search"):
+            name = query.get("q", "").lower()
+            return 200, [breed for breed in self.breeds if name in breed["name"].lower()]
+        if route == ("GET", "facts"):
+            return 200, self._ordered(self.facts, page, limit, query)
+        if route == ("GET", "breeds", "{id}", "facts"):
+            facts = [fact for fact in self.facts if fact["breed_id"] == segments[1]]
+            return 200, self._ordered(facts, page, limit, query)
+        return 404, {"message": "NOT_FOUND"}
+
+    def _search_images(self, page: int, limit: int, query: Dict[str, str]) -> List[dict]:
+        with_breeds = query.get("has_breeds") in TRUE_VALUES or "breed_ids" in query
+        start = page * limit if query.get("order") in ("ASC", "DESC") else self._random.randrange(1 << 20)
+        results = []
+        for i in range(start, start + limit):
+            image = {"id": f"img{i:07d}", "url": f"https://cdn2.thecatapi.com/images/img{i:07d}.jpg",
+                     "width": 1200, "height": 800, "breeds": []}
+            if with_breeds:
+                image["breeds"] = [self.breeds[(i + j) % len(self.breeds)] for j in range(self.breeds_per_image)]
+            results.append(image)
+        return results
+
+    def _upload(self, body: bytes, content_type: str) -> dict:
+        message = BytesParser().parsebytes(b"Content-Type: " + content_type.encode() + b"\r\n\r\n" + body)
+        fields = {part.get_param("name", header="content-disposition"): part for part in message.get_payload()}
+        file_name = fields["file"].get_filename() if "file" in fields else None
+        image = {"id": f"up{next(self._ids):05d}", "url": "https://cdn2.thecatapi.com/images/upload.jpg",
+                 "width": 1200, "height": 800, "original_filename": file_name, "pending": 0, "approved": 1,
+                 "sub_id": fields["sub_id"].get_payload() if "sub_id" in fields else None,
+                 "breed_ids": fields["breed_ids"].get_payload() if "breed_ids" in fields else None,
+                 "created_at": time.strftime("%Y-%m-%dT%H:%M:%S.000Z", time.gmtime())}
+        with self._lock:
+            self.images.append(image)
+        return image
+
+    @staticmethod
+    def _filter(items: List[dict], query: Dict[str, str], *fields: str) -> List[dict]:
+        for name in fields:
+            if name in query:
+                items = [item for item in items if item.get(name) == query[name]]
+        return items
+
+    @staticmethod
+    def _page(items: List[dict], page: int, limit: int) -> List[dict]:
+        return items[page * limit:(page + 1) * limit]
+
+    def _ordered(self, items: List[dict], page: int, limit: int, query: Dict[str, str]) -> List[dict]:
+        if query.get("order", "RAND") == "RAND":
+            with self._lock:
+                return self._random.sample(items, min(limit, len(items)))
+        return self._page(items, page, limit)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately, Nagle's algorithm would delay the body until the client ACKs.
+    disable_nagle_algorithm = True
+    api: MockCatAPI
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+    def _serve(self, method: str) -> None:
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        if self.api._inject():
+            status = self.api.error_status
+            payload = {"message": "INJECTED_ERROR"}
+        else:
+            url = urlsplit(self.path)
+            query = {name: values[-1] for name, values in parse_qs(url.query).items()}
+            try:
+                status, payload = self.api.handle(method, url.path, query, body, self.headers.get("Content-Type", ""))
+            except (ValueError, KeyError, TypeError) as exc:
+                status, payload = 400, {"message": str(exc)}
+        data = b"" if payload is None else json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        if status == 429:
+            self.send_header("Retry-After", "1")
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self) -> None:
+        self._serve("GET")
+
+    def do_POST(self) -> None:
+        self._serve("POST")
+
+    def do_DELETE(self) -> None:
+        self._serve("DELETE")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--error-status", type=int, default=503)
+    parser.add_argument("--breeds-per-image", type=int, default=1)
+    args = parser.parse_args()
+    api = MockCatAPI(args.host, args.port, latency=args.latency, jitter=args.jitter, error_rate=args.error_rate,
+                     error_status=args.error_status, breeds_per_image=args.breeds_per_image)
+    print(f"Serving the mock Cat API at {api.uri}")
+    try:
+        api.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        api.server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1 +1,28 @@
-from .client import Client
+import importlib
+from typing import TYPE_CHECKING
+
+__all__ = ["Client", "AsyncClient"]
+
+# The clients are imported on first access (PEP 562), so that importing pymeow does not load
+# requests, pydantic or aiohttp. Import the submodules directly to use the other classes.
+_LAZY_ATTRIBUTES = {
+    "Client": "pymeow.client",
+    "AsyncClient": "pymeow.async_client",
+}
+
+if TYPE_CHECKING:
+    from .client import Client
+    from .async_client import AsyncClient
+
+
+def __getattr__(name: str):
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
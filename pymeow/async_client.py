@@ -0,0 +1,489 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from pymeow.exceptions import EmptyTokenException, RequestException
+from pymeow.hooks import RequestHook, RequestInfo
+from pymeow.models import Breed, Cat, CatPic, UserVote, Fact
+from pymeow.pagination import aiter_pages
+from pymeow.uploads import guess_content_type
+from pymeow.utils import clean_params, convert_json_to_obj, split_image_path
+from typing import AsyncIterator, Iterable
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - optional dependency
+    aiohttp = None
+
+
+class AsyncClient:
+    def __init__(self, api_key: str = None, pool_size: int = 100, pool_size_per_host: int = 0,
+                 max_concurrency: int = 100, keepalive_timeout: float = 15.0, timeout: float = 30.0,
+                 validate_models: bool = True, lazy_breeds: bool = False,
+                 hooks: Iterable[RequestHook] = None) -> None:
+        """
+        :param api_key: The API key from https://thecatapi.com. You can get it from https://thecatapi.com/signup
+        :param pool_size: The maximum number of open connections in the shared pool.
+        :param pool_size_per_host: The maximum number of open connections per host (0 means no limit).
+        :param max_concurrency: The maximum number of requests in flight at the same time.
+        :param keepalive_timeout: How long in seconds an idle connection is kept open.
+        :param timeout: Default timeout in seconds for every request.
+        :param validate_models: Whether get_cat validates the responses. Disable it to trust the API
+         and build the models several times faster.
+        :param lazy_breeds: Whether get_cat builds the breeds of a cat only when its breed_info is accessed.
+        :param hooks: RequestHook objects called before and after every request, e.g. a RequestMetrics.
+        """
+        if aiohttp is None:
+            raise ImportError("AsyncClient requires aiohttp. Install it with `pip install pymeow[async]`")
+        if api_key is not None and not isinstance(api_key, str):
+            raise TypeError("AsyncClient takes a single API key, KeyPool is only supported by Client")
+        self.uri = "https://api.thecatapi.com/v1/"
+        self.api_key = api_key
+        self.timeout = timeout
+        self.max_concurrency = max_concurrency
+        self.validate_models = validate_models
+        self.lazy_breeds = lazy_breeds
+        self.hooks = list(hooks or ())
+        self._pool_size = pool_size
+        self._pool_size_per_host = pool_size_per_host
+        self._keepalive_timeout = keepalive_timeout
+        self._session = None
+        self._semaphore = None
+
+    @property
+    def session(self) -> "aiohttp.ClientSession":
+        """
+        The shared session. It is created on first use, so it is bound to the running event loop.
+        """
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self._pool_size, limit_per_host=self._pool_size_per_host,
+                                             keepalive_timeout=self._keepalive_timeout)
+            self._session = aiohttp.ClientSession(connector=connector,
+                                                  timeout=aiohttp.ClientTimeout(total=self.timeout))
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._session
+
+    async def get_cat(self, limit: int = 1, page: int = 0, order: str = "RAND", has_breeds: bool = False,
+                      breed_ids: str = None,  sub_id: str = None) -> list[Cat] | Cat:
+        """
+        A function that retrieves cat images url with id and sizes based on the specified parameters.
+        Parameters available only if you have an API key
+
+        Parameters:
+            limit (int): The number of images to retrieve (default is 1).
+            page (int): The page number of results to retrieve (default is 0).
+            order (str): The order in which to retrieve images (default is "RAND").
+            has_breeds (int): Indicator for whether to retrieve images with breeds (default is 0).
+            breed_ids (str): The IDs of specific breeds to retrieve images for.
+            sub_id (str): The sub ID for the request.
+
+        Returns:
+            list[Cat] | Cat: A list of Cat objects, or a single Cat if only one image was returned.
+        """
+        args = locals().copy()
+        del args['self']
+        if (args['limit'] > 10 or args['has_breeds']) and not self.api_key:
+            raise EmptyTokenException("You must have an API key to get more than 10 images or use params."
+                                      "To get an API key, go to https://thecatapi.com/signup")
+        url = self.uri + "images/search"
+        response = await self._request(url=url, method="GET", params=args, headers=self._get_headers())
+        if response.status == 200:
+            r_json = await response.json(content_type=None)
+            return convert_json_to_obj(r_json, validate=self.validate_models, lazy=self.lazy_breeds)
+        else:
+            raise RequestException(response.status, await response.text())
+
+    async def get_breed_info(self, breed: str) -> Breed | list:
+        """
+        A function that retrieves information about a specific breed.
+
+        Parameters:
+            breed (str): The breed for which information is to be retrieved.(e.g. "bengal")
+
+        Returns:
+            Breed | list: A Breed object, or an empty list if nothing was found.
+        """
+        url = self.uri + "breeds/search"
+        response = await self._request(url=url, method="GET", params={"q": breed}, headers=self._get_headers())
+        if response.status == 200:
+            r_json = await response.json(content_type=None)
+            if r_json:
+                return Breed(**r_json[0])
+            else:
+                return []
+        else:
+            raise RequestException(response.status, await response.text())
+
+    async def get_all_breeds(self) -> list[Breed]:
+        """
+        A function that retrieves information about all breeds.
+
+        Returns:
+            list[Breed]: A list of Breed objects containing information about all the breeds.
+        """
+        url = self.uri + "breeds"
+        response = await self._request(url=url, method="GET", headers=self._get_headers())
+        if response.status == 200:
+            r_json = await response.json(content_type=None)
+            return [Breed(**breed) for breed in r_json]
+        else:
+            raise RequestException(response.status, await response.text())
+
+    async def upload_image(self, file_path: str, sub_id: str = None, breed_ids: str = None) -> CatPic:
+        """
+        A function that uploads an image to the specified URI.
+        Parameters:
+            file_path (str): File_path to the image.
+            sub_id (str): a string you can use to segment your images, e.g. knowing which of your own users uploaded it
+            breed_ids (str): comma separated string of breed ids contained in the image.
+        """
+        url = self.uri + "images/upload"
+        image_name, image_path = split_image_path(file_path)
+        with open(image_path, 'rb') as file:
+            data = aiohttp.FormData()
+            data.add_field('file', file, filename=image_name, content_type=guess_content_type(image_name))
+            for name, value in (("sub_id", sub_id), ("breed_ids", breed_ids)):
+                if value is not None:
+                    data.add_field(name, value)
+            response = await self._request(url=url, method="POST", data=data, headers=self._get_headers())
+        if response.status in (200, 201):
+            r_json = await response.json(content_type=None)
+            return CatPic(**r_json)
+        else:
+            raise RequestException(response.status, await response.text())
+
+    async def delete_image(self, image_id: str) -> bool:
+        """
+        A function that deletes an image from the specified URI.
+
+        Parameters:
+            image_id (str): The ID of the image to delete.
+
+        Returns:
+            bool: True if the image was deleted successfully, otherwise raise an exception.
+        """
+        if not self.api_key:
+            raise EmptyTokenException("You must have an API key to access this method. "
+                                      "To get an API key, go to https://thecatapi.com/signup")
+        url = self.uri + f"images/{image_id}"
+        response = await self._request(url=url, method="DELETE",
+                                       headers=self._get_headers({"Content-Type": "application/json"}))
+        if response.status in (200, 201, 204):
+            return True
+        else:
+            raise RequestException(response.status, await response.text())
+
+    async def get_upload_images(self, limit: int = 10, page: int = 0, order: str = "DESC",
+                                sub_id: str = None, breed_ids: str = None, category_ids: str = None,
+                                format: str = "json", original_filename: str = None,
+                                user_id: str = None) -> list[CatPic]:
+        """
+        A function that retrieves information about all images uploaded to the specified URI.
+        See Client.get_upload_images for the description of the parameters.
+
+        Returns:
+            list[CatPic]: A list of CatPic objects containing information about all the images.
+        """
+        if not self.api_key:
+            raise EmptyTokenException("You must have an API key to access this method. "
+                                      "To get an API key, go to https://thecatapi.com/signup")
+        url = self.uri + "images"
+        response = await self._request(url=url, method="GET", headers=self._get_headers(),
+                                       params={"limit": limit, "page": page, "order": order,
+                                               "sub_id": sub_id, "breed_ids": breed_ids,
+                                               "category_ids": category_ids, "format": format,
+                                               "original_filename": original_filename, "user_id": user_id})
+        if response.status == 200:
+            r_json = await response.json(content_type=None)
+            return [CatPic(**image) for image in r_json]
+        else:
+            raise RequestException(response.status, await response.text())
+
+    async def vote(self, image_id: str, sub_id: str, value: int) -> UserVote:
+        """
+        You can allow your Users to Vote on any Image, and give a score between 1 and 10.
+
+        Parameters:
+            image_id (str): The ID of the image to vote on.
+            sub_id (str): The sub ID of the image to vote on.
+            value (int): The value of the vote (1 for up vote, -1 for down vote).
+
+        Returns:
+            UserVote: A UserVote object containing information about the user vote.
+        """
+        if not self.api_key:
+            raise EmptyTokenException("You must have an API key to access this method. "
+                                      "To get an API key, go to https://thecatapi.com/signup")
+        url = self.uri + "votes"
+        response = await self._request(url=url, method="POST",
+                                       json={"image_id": image_id, "sub_id": sub_id, "value": value},
+                                       headers=self._get_headers())
+        if response.status in (200, 201):
+            r_json = await response.json(content_type=None)
+            return UserVote(**r_json)
+        else:
+            raise RequestException(response.status, await response.text())
+
+    async def get_votes(self, attach_image: int = 0, sub_id: str = None, page: int = 0,
+                        limit: int = 100, order: str = 'ASC') -> list[UserVote]:
+        """
+        Retrieve any created Votes. This can be filtered by sub_id,
+         and paginated using page and limit Query string parameters.
+
+        Parameters:
+            attach_image (int): 0 to not attach image, 1 to attach image.
+            sub_id (str): The sub ID of the image to vote on.
+            page (int): The page number of results to retrieve (default is 0).
+            limit (int): The number of results per page (default is 100).
+            order (str): The order in which to retrieve results (default is "ASC").
+
+        Returns:
+            list[UserVote]: A list of UserVote objects containing information about the retrieved votes.
+        """
+        if not self.api_key:
+            raise EmptyTokenException("You must have an API key to access this method. "
+                                      "To get an API key, go to https://thecatapi.com/signup")
+        url = self.uri + "votes"
+        response = await self._request(url=url, params={"attach_image": attach_image, "sub_id": sub_id,
+                                                        "page": page, "limit": limit, "order": order},
+                                       method="GET", headers=self._get_headers())
+        if response.status == 200:
+            r_json = await response.json(content_type=None)
+            return [UserVote(**v) for v in r_json]
+        else:
+            raise RequestException(response.status, await response.text())
+
+    async def get_vote_by_id(self, vote_id: int | str) -> UserVote:
+        """
+        Method to retrieve vote by vote_id
+
+        Parameters:
+            vote_id (int): The ID of the vote to retrieve.
+
+        Returns:
+            UserVote: A UserVote object containing information about the retrieved vote.
+        """
+        if not self.api_key:
+            raise EmptyTokenException("You must have an API key to access this method. "
+                                      "To get an API key, go to https://thecatapi.com/signup")
+        url = self.uri + f"votes/{vote_id}"
+        response = await self._request(url=url, method="GET", headers=self._get_headers())
+        if response.status == 200:
+            r_json = await response.json(content_type=None)
+            return UserVote(**r_json)
+        else:
+            raise RequestException(response.status, await response.text())
+
+    async def delete_vote(self, vote_id: int | str) -> dict:
+        """
+        Method to delete vote by vote_id
+
+        Parameters:
+            vote_id (int): The ID of the vote to delete.
+
+        Returns:
+            dict: A dictionary containing information about the deleted vote, e.g, {'message': 'SUCCESS'}
+        """
+        if not self.api_key:
+            raise EmptyTokenException("You must have an API key to access this method. "
+                                      "To get an API key, go to https://thecatapi.com/signup")
+        url = self.uri + f"votes/{vote_id}"
+        response = await self._request(url=url, method="DELETE", headers=self._get_headers())
+        if response.status == 200:
+            return await response.json(content_type=None)
+        else:
+            raise RequestException(response.status, await response.text())
+
+    async def get_random_fact(self, page: int = 0, limit: int = 1, order: str = "RAND") -> list[Fact]:
+        """
+        Retrieve random facts. This can be filtered by page and limit Query string parameters.
+
+        Parameters:
+            page (int): The page number of results to retrieve (default is 0).
+            limit (int): The number of results per page (default is 1).
+            order (str): The order in which to retrieve results (default is "RAND").
+
+        Returns:
+            list[Fact]: A list of Fact objects containing information about the retrieved facts.
+        """
+        if not self.api_key:
+            raise EmptyTokenException("You must have an API key with premium to access this method. "
+                                      "To get an API key, go to https://thecatapi.com/signup")
+        url = self.uri + "facts/"
+        response = await self._request(url=url, params={"page": page, "limit": limit, "order": order},
+                                       method="GET", headers=self._get_headers())
+        if response.status == 200:
+            r_json = await response.json(content_type=None)
+            return [Fact(**f) for f in r_json]
+        else:
+            raise RequestException(response.status, await response.text())
+
+    async def get_breed_fact(self, breed_name: str, limit: int = 1, page: int = 0,
+                             order: str = "ASC") -> list[Fact]:
+        """
+        Retrieve random facts. This can be filtered by page and limit, ordered by order Query string parameters.
+
+        Parameters:
+            breed_name (str): The name of the breed to retrieve facts for.
+            limit (int): The number of results per page (default is 1).
+            page (int): The page number of results to retrieve (default is 0).
+            order (str): The order in which to retrieve results (default is "ASC").
+
+        Returns:
+            list[Fact]: A list of Fact objects containing information about the retrieved breed.
+        """
+        if not self.api_key:
+            raise EmptyTokenException("You must have an API key with premium to access this method. "
+                                      "To get an API key, go to https://thecatapi.com/signup")
+        url = self.uri + f"breeds/{breed_name}/facts"
+        response = await self._request(url=url, method="GET", headers=self._get_headers(),
+                                       params={"limit": limit, "page": page, "order": order})
+        if response.status == 200:
+            r_json = await response.json(content_type=None)
+            return [Fact(**f) for f in r_json]
+        else:
+            raise RequestException(response.status, await response.text())
+
+    async def get_version(self) -> dict:
+        """
+        Get the current version of the API.
+
+        Returns:
+            dict: A dictionary containing information about the current version of the API.
+        """
+        response = await self._request(url=self.uri, method="GET", headers=self._get_headers())
+        if response.status == 200:
+            return await response.json(content_type=None)
+        else:
+            raise RequestException(response.status, await response.text())
+
+    def iter_upload_images(self, limit: int = 100, page: int = 0, order: str = "DESC",
+                           sub_id: str = None, breed_ids: str = None, category_ids: str = None,
+                           original_filename: str = None, user_id: str = None,
+                           prefetch: int = 1, max_pages: int = None) -> AsyncIterator[CatPic]:
+        """
+        Iterate over all uploaded images page by page. The next page is downloaded by a background task
+        while the current one is consumed.
+        See get_upload_images for the description of the filters.
+
+        Parameters:
+            limit (int): The number of images per page (default is 100).
+            page (int): The page to start from (default is 0).
+            prefetch (int): The maximum number of pages buffered ahead of the current one (default is 1).
+            max_pages (int): The maximum number of pages to fetch (default is no limit).
+
+        Returns:
+            AsyncIterator[CatPic]: CatPic objects, one at a time. Iteration stops on the first empty page.
+        """
+        return aiter_pages(lambda p: self.get_upload_images(limit=limit, page=p, order=order, sub_id=sub_id,
+                                                            breed_ids=breed_ids, category_ids=category_ids,
+                                                            original_filename=original_filename, user_id=user_id),
+                           start_page=page, prefetch=prefetch, max_pages=max_pages)
+
+    def iter_votes(self, attach_image: int = 0, sub_id: str = None, page: int = 0, limit: int = 100,
+                   order: str = 'ASC', prefetch: int = 1, max_pages: int = None) -> AsyncIterator[UserVote]:
+        """
+        Iterate over all votes page by page. The next page is downloaded by a background task
+        while the current one is consumed.
+        See get_votes for the description of the filters.
+
+        Parameters:
+            prefetch (int): The maximum number of pages buffered ahead of the current one (default is 1).
+            max_pages (int): The maximum number of pages to fetch (default is no limit).
+
+        Returns:
+            AsyncIterator[UserVote]: UserVote objects, one at a time. Iteration stops on the first empty page.
+        """
+        return aiter_pages(lambda p: self.get_votes(attach_image=attach_image, sub_id=sub_id, page=p,
+                                                    limit=limit, order=order),
+                           start_page=page, prefetch=prefetch, max_pages=max_pages)
+
+    def iter_random_facts(self, page: int = 0, limit: int = 100, order: str = "ASC",
+                          prefetch: int = 1, max_pages: int = None) -> AsyncIterator[Fact]:
+        """
+        Iterate over facts page by page. The next page is downloaded by a background task
+        while the current one is consumed.
+        See get_random_fact for the description of the filters.
+
+        Parameters:
+            prefetch (int): The maximum number of pages buffered ahead of the current one (default is 1).
+            max_pages (int): The maximum number of pages to fetch (default is no limit).
+
+        Returns:
+            AsyncIterator[Fact]: Fact objects, one at a time. Iteration stops on the first empty page.
+        """
+        return aiter_pages(lambda p: self.get_random_fact(page=p, limit=limit, order=order),
+                           start_page=page, prefetch=prefetch, max_pages=max_pages)
+
+    def iter_breed_facts(self, breed_name: str, limit: int = 100, page: int = 0, order: str = "ASC",
+                         prefetch: int = 1, max_pages: int = None) -> AsyncIterator[Fact]:
+        """
+        Iterate over facts about a breed page by page. The next page is downloaded by a background task
+        while the current one is consumed.
+        See get_breed_fact for the description of the filters.
+
+        Parameters:
+            prefetch (int): The maximum number of pages buffered ahead of the current one (default is 1).
+            max_pages (int): The maximum number of pages to fetch (default is no limit).
+
+        Returns:
+            AsyncIterator[Fact]: Fact objects, one at a time. Iteration stops on the first empty page.
+        """
+        return aiter_pages(lambda p: self.get_breed_fact(breed_name, limit=limit, page=p, order=order),
+                           start_page=page, prefetch=prefetch, max_pages=max_pages)
+
+    def _get_headers(self, *args) -> dict:
+        headers = {}
+        for arg in args:
+            headers.update(arg)
+        if self.api_key:
+            headers.update({"x-api-key": self.api_key})
+        return headers
+
+    async def _request(self, url: str, method: str, params: dict = None,
+                       data=None, json: dict = None, headers: dict = None,
+                       timeout: float = None) -> "aiohttp.ClientResponse":
+        session = self.session
+        kwargs = {"timeout": aiohttp.ClientTimeout(total=timeout)} if timeout else {}
+        hooks = self.hooks
+        async with self._semaphore:
+            if hooks:
+                info = RequestInfo(method, url, headers if headers is not None else {})
+                for hook in hooks:
+                    hook.before_request(info)
+                headers = info.headers
+                info.started = time.perf_counter()
+            try:
+                async with session.request(method=method, url=url, params=clean_params(params), data=data,
+                                           json=json, headers=headers, **kwargs) as response:
+                    # The body is read while the connection is held, so it can go back to the pool right away.
+                    body = await response.read()
+            except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
+                # Timeouts are not ClientErrors: they are wrapped like the connection errors.
+                if hooks:
+                    info.finish(error=exc)
+                    for hook in hooks:
+                        hook.after_request(info)
+                raise RequestException(exc) from exc
+            if hooks:
+                info.finish(response.status, len(body), int(response.request_info.headers.get("Content-Length") or 0))
+                for hook in hooks:
+                    hook.after_request(info)
+            return response
+
+    async def close(self) -> None:
+        """
+        Close the shared session and release all pooled connections.
+        """
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
+
+    def __repr__(self):
+        return f"AsyncClient(api_key={self.api_key}, uri={self.uri})"
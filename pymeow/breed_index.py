@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import bisect
+from itertools import islice
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Union, get_args
+
+if TYPE_CHECKING:
+    from pymeow.models import Breed
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+#: The value stored in trait columns for breeds that have no value for the trait.
+MISSING = -1
+
+_OPERATORS = {
+    "eq": lambda column, value: column == value,
+    "ne": lambda column, value: column != value,
+    "gt": lambda column, value: column > value,
+    "ge": lambda column, value: column >= value,
+    "lt": lambda column, value: column < value,
+    "le": lambda column, value: column <= value,
+}
+
+
+def _trait_fields() -> List[str]:
+    # The pydantic models are imported with the first index rather than with this module.
+    from pymeow.models import Breed
+    return [name for name, annotation in Breed.__annotations__.items() if int in get_args(annotation)]
+
+
+def _normalize(name: str) -> str:
+    return " ".join(name.lower().split())
+
+
+class BreedIndex:
+    def __init__(self, breeds: Iterable[Breed]) -> None:
+        """
+        A local index of breeds for fast trait queries and name lookups.
+        The integer traits of Breed are stored as NumPy columns, missing values are stored as MISSING.
+
+        :param breeds: Breed objects, e.g. the result of Client.get_all_breeds().
+        """
+        if np is None:
+            raise ImportError("BreedIndex requires numpy. Install it with `pip install pymeow[numpy]`")
+        self.breeds = list(breeds)
+        self.traits = _trait_fields()
+        self.columns = {trait: np.array([MISSING if getattr(breed, trait) is None else getattr(breed, trait)
+                                         for breed in self.breeds], dtype=np.int16)
+                        for trait in self.traits}
+        self._origins = {}
+        self._origin_codes = np.array([self._origins.setdefault(_normalize(breed.origin or ""), len(self._origins))
+                                       for breed in self.breeds], dtype=np.int32)
+        self._aliases = {}
+        for position, breed in enumerate(self.breeds):
+            names = [breed.id, breed.name] + (breed.alt_names or "").split(",")
+            for name in names:
+                if name and name.strip():
+                    self._aliases.setdefault(_normalize(name), position)
+        self._sorted_aliases = sorted(self._aliases)
+
+    @classmethod
+    def from_client(cls, client) -> "BreedIndex":
+        """
+        Build the index from all breeds returned by the client.
+        """
+        return cls(client.get_all_breeds())
+
+    def mask(self, origin: str = None, **conditions: int) -> "np.ndarray":
+        """
+        Build a boolean mask of the breeds matching all conditions.
+
+        Parameters:
+            origin (str): The origin of the breeds, compared case-insensitively.
+            **conditions: Trait conditions, either `trait=value` or `trait__op=value`
+             where op is one of eq, ne, gt, ge, lt, le, e.g. `hypoallergenic=1, energy_level__ge=4`.
+             Breeds with a missing trait never match a condition on that trait.
+
+        Returns:
+            np.ndarray: A boolean array aligned with the breeds attribute.
+        """
+        result = np.ones(len(self.breeds), dtype=bool)
+        if origin is not None:
+            result &= self._origin_codes == self._origins.get(_normalize(origin), -1)
+        for condition, value in conditions.items():
+            trait, _, op = condition.partition("__")
+            if trait not in self.columns:
+                raise ValueError(f"Unknown trait {trait!r}. Available traits: {', '.join(self.traits)}")
+            if (op or "eq") not in _OPERATORS:
+                raise ValueError(f"Unknown operator {op!r}. Available operators: {', '.join(_OPERATORS)}")
+            column = self.columns[trait]
+            result &= (column != MISSING) & _OPERATORS[op or "eq"](column, value)
+        return result
+
+    def filter(self, origin: str = None, **conditions: int) -> List[Breed]:
+        """
+        Return the breeds matching all conditions. See mask for the description of the conditions.
+        """
+        return [self.breeds[position] for position in np.flatnonzero(self.mask(origin, **conditions))]
+
+    def rank(self, weights: Dict[str, float], limit: int = None, origin: str = None,
+             **conditions: int) -> List[Breed]:
+        """
+        Rank the breeds matching the conditions by a weighted sum of their traits, best first.
+
+        Parameters:
+            weights (Dict[str, float]): Weight of every trait, e.g. {"affection_level": 2, "shedding_level": -1}.
+             Missing traits count as 0.
+            limit (int): The maximum number of breeds to return (default is all).
+            origin (str): The origin of the breeds, see mask.
+            **conditions: Trait conditions, see mask.
+
+        Returns:
+            List[Breed]: The matching breeds ordered by score.
+        """
+        scores = np.zeros(len(self.breeds), dtype=np.float64)
+        for trait, weight in weights.items():
+            if trait not in self.columns:
+                raise ValueError(f"Unknown trait {trait!r}. Available traits: {', '.join(self.traits)}")
+            column = self.columns[trait]
+            scores += weight * np.where(column == MISSING, 0, column)
+        candidates = np.flatnonzero(self.mask(origin, **conditions))
+        order = candidates[np.argsort(-scores[candidates], kind="stable")]
+        if limit is not None:
+            order = order[:limit]
+        return [self.breeds[position] for position in order]
+
+    def get(self, name: str) -> Optional[Breed]:
+        """
+        Find a breed by its id, name or one of its alternative names, ignoring case.
+
+        Returns:
+            Breed | None: The breed, or None if nothing was found.
+        """
+        position = self._aliases.get(_normalize(name))
+        return None if position is None else self.breeds[position]
+
+    def search(self, prefix: str, limit: int = None) -> List[Breed]:
+        """
+        Find breeds whose id, name or alternative name starts with the prefix, ignoring case.
+
+        Returns:
+            List[Breed]: Matching breeds without duplicates, ordered by the matched name.
+        """
+        prefix = _normalize(prefix)
+        start = bisect.bisect_left(self._sorted_aliases, prefix)
+        found = {}
+        for alias in islice(self._sorted_aliases, start, None):
+            if not alias.startswith(prefix) or (limit is not None and len(found) >= limit):
+                break
+            found.setdefault(self._aliases[alias], None)
+        return [self.breeds[position] for position in found]
+
+    def __getitem__(self, name: str) -> Breed:
+        breed = self.get(name)
+        if breed is None:
+            raise KeyError(name)
+        return breed
+
+    def __contains__(self, name: Union[str, Breed]) -> bool:
+        return self.get(name if isinstance(name, str) else name.id) is not None
+
+    def __len__(self) -> int:
+        return len(self.breeds)
+
+    def __repr__(self):
+        return f"BreedIndex(breeds={len(self)}, traits={len(self.traits)})"
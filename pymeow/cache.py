@@ -0,0 +1,225 @@
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, asdict
+from typing import Any, Callable, Dict, Optional
+from urllib.parse import urlencode
+
+from pymeow.utils import clean_params
+
+#: Default time to live in seconds of every cached endpoint. Endpoints that are not listed are not cached.
+DEFAULT_TTLS = {
+    "breeds": 24 * 60 * 60,
+    "breeds/search": 24 * 60 * 60,
+    "version": 60 * 60,
+}
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    revalidations: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+
+    def as_dict(self) -> Dict[str, int]:
+        return asdict(self)
+
+
+class CacheEntry:
+    """
+    A cached response: the decoded JSON payload, the objects built from it and the validators sent by the server.
+    """
+    __slots__ = ("endpoint", "payload", "value", "etag", "last_modified", "expires_at")
+
+    def __init__(self, endpoint: str, payload: Any, value: Any = None, etag: str = None,
+                 last_modified: str = None, expires_at: float = 0.0) -> None:
+        self.endpoint = endpoint
+        self.payload = payload
+        self.value = value
+        self.etag = etag
+        self.last_modified = last_modified
+        self.expires_at = expires_at
+
+    @property
+    def fresh(self) -> bool:
+        return time.time() < self.expires_at
+
+    @property
+    def validators(self) -> Dict[str, str]:
+        """
+        Headers of a conditional request that revalidates this entry.
+        """
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class SQLiteCacheBackend:
+    def __init__(self, path: str) -> None:
+        """
+        An on-disk cache backend that survives restarts.
+
+        :param path: Path to the SQLite database file.
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute("CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, endpoint TEXT, "
+                                     "payload TEXT, etag TEXT, last_modified TEXT, expires_at REAL)")
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            row = self._connection.execute("SELECT endpoint, payload, etag, last_modified, expires_at "
+                                           "FROM cache WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        endpoint, payload, etag, last_modified, expires_at = row
+        return CacheEntry(endpoint, json.loads(payload), etag=etag, last_modified=last_modified,
+                          expires_at=expires_at)
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        with self._lock, self._connection:
+            self._connection.execute("INSERT OR REPLACE INTO cache VALUES (?, ?, ?, ?, ?, ?)",
+                                     (key, entry.endpoint, json.dumps(entry.payload), entry.etag,
+                                      entry.last_modified, entry.expires_at))
+
+    def invalidate(self, endpoint: str = None) -> None:
+        with self._lock, self._connection:
+            if endpoint is None:
+                self._connection.execute("DELETE FROM cache")
+            else:
+                self._connection.execute("DELETE FROM cache WHERE endpoint = ? OR endpoint LIKE ?",
+                                         (endpoint, endpoint + "/%"))
+
+    def close(self) -> None:
+        self._connection.close()
+
+
+class ResponseCache:
+    def __init__(self, maxsize: int = 256, ttls: Dict[str, float] = None, default_ttl: float = 0,
+                 backend: SQLiteCacheBackend = None) -> None:
+        """
+        An in-memory LRU cache of GET responses with per-endpoint time to live.
+        Stale entries are revalidated with ETag/Last-Modified when the server provided them.
+        Cached objects are shared between callers, so they should be treated as read-only.
+
+        :param maxsize: The maximum number of entries kept in memory.
+        :param ttls: Time to live in seconds per endpoint, e.g. {"breeds": 3600, "votes": 10}.
+         They are merged with DEFAULT_TTLS. A TTL of 0 disables caching of the endpoint.
+        :param default_ttl: Time to live of the endpoints missing in ttls (default is 0, not cached).
+        :param backend: An optional on-disk backend, e.g. SQLiteCacheBackend("pymeow-cache.db").
+        """
+        self.maxsize = maxsize
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.default_ttl = default_ttl
+        self.backend = backend
+        self.stats = CacheStats()
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def ttl_for(self, endpoint: str) -> float:
+        return self.ttls.get(endpoint, self.default_ttl)
+
+    @staticmethod
+    def make_key(url: str, params: dict = None) -> str:
+        params = clean_params(params)
+        if not params:
+            return url
+        return url + "?" + urlencode(sorted(params.items()))
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """
+        Return the entry stored under the key, fresh or stale, or None.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry
+        if self.backend is not None:
+            entry = self.backend.get(key)
+            if entry is not None:
+                self._store(key, entry)
+        return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        self._store(key, entry)
+        if self.backend is not None:
+            self.backend.set(key, entry)
+
+    def fetch(self, endpoint: str, key: str, load: Callable[[Dict[str, str]], tuple],
+              build: Callable[[Any], Any]) -> Any:
+        """
+        Return the objects cached under the key, loading and building them on a miss.
+
+        Parameters:
+            endpoint (str): The endpoint the key belongs to. It selects the time to live.
+            key (str): The cache key, see make_key.
+            load (Callable): A function that receives the validator headers and returns
+             (status_code, payload, etag, last_modified). A status code of 304 means the entry is still valid.
+            build (Callable): A function that builds the returned objects from the payload.
+
+        Returns:
+            Any: The objects built from the cached or loaded payload.
+        """
+        ttl = self.ttl_for(endpoint)
+        entry = self.get(key)
+        if entry is not None and entry.fresh:
+            with self._lock:
+                self.stats.hits += 1
+            return self._value(entry, build)
+        status_code, payload, etag, last_modified = load(entry.validators if entry is not None else {})
+        if status_code == 304 and entry is not None:
+            entry.expires_at = time.time() + ttl
+            self.set(key, entry)
+            with self._lock:
+                self.stats.revalidations += 1
+            return self._value(entry, build)
+        with self._lock:
+            self.stats.misses += 1
+        value = build(payload)
+        self.set(key, CacheEntry(endpoint, payload, value, etag, last_modified, time.time() + ttl))
+        return value
+
+    def invalidate(self, endpoint: str = None) -> None:
+        """
+        Drop the entries of an endpoint and its sub-endpoints, or every entry if the endpoint is None.
+        """
+        with self._lock:
+            keys = [key for key, entry in self._entries.items()
+                    if endpoint is None or entry.endpoint == endpoint or entry.endpoint.startswith(endpoint + "/")]
+            for key in keys:
+                del self._entries[key]
+            self.stats.invalidations += len(keys)
+        if self.backend is not None:
+            self.backend.invalidate(endpoint)
+
+    def clear(self) -> None:
+        self.invalidate()
+
+    def _value(self, entry: CacheEntry, build: Callable[[Any], Any]) -> Any:
+        if entry.value is None:
+            entry.value = build(entry.payload)
+        return entry.value
+
+    def _store(self, key: str, entry: CacheEntry) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self):
+        return f"ResponseCache(maxsize={self.maxsize}, size={len(self)}, stats={self.stats})"
@@ -1,20 +1,136 @@
-import requests
-from requests.models import Response
-from pymeow.exceptions import EmptyTokenException, RequestException
-from pymeow.models import Breed, Cat, CatPic, UserVote, Fact
-from pymeow.utils import convert_json_to_obj, split_image_path
+from __future__ import annotations
+
+import importlib
+import random
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from types import ModuleType
+from pymeow.cache import ResponseCache
+from pymeow.hooks import RequestHook, RequestInfo
+from pymeow.pagination import iter_pages
+from pymeow.singleflight import SingleFlight
+from pymeow.utils import split_image_path
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator
+
+if TYPE_CHECKING:
+    from requests.models import Response
+    from pymeow.columnar import Table
+    from pymeow.exceptions import EmptyTokenException, RequestException
+    from pymeow.key_pool import KeyPool
+    from pymeow.models import Breed, Cat, CatPic, UserVote, Fact
+    from pymeow.scheduler import RequestScheduler
+    from pymeow.uploads import UploadResult
+
+
+# requests and the exceptions based on it are imported on first access (PEP 562) rather than with this
+# module, so that importing pymeow stays fast for short-lived processes.
+_LAZY_ATTRIBUTES = {
+    "requests": ("requests", None),
+    "HTTPAdapter": ("requests.adapters", "HTTPAdapter"),
+    "EmptyTokenException": ("pymeow.exceptions", "EmptyTokenException"),
+    "RequestException": ("pymeow.exceptions", "RequestException"),
+}
+
+
+def __getattr__(name: str):
+    target = _LAZY_ATTRIBUTES.get(name)
+    if target is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module, attribute = target
+    value = importlib.import_module(module)
+    if attribute is not None:
+        value = getattr(value, attribute)
+    globals()[name] = value
+    return value
+
+
+def _import_requests() -> None:
+    # The methods use these names as plain globals, which the module __getattr__ does not resolve.
+    for name in _LAZY_ATTRIBUTES:
+        if name not in globals():
+            __getattr__(name)
+
+
+def _rewind(data: Any) -> bool:
+    # A request body is sent again as is, unless it is a stream: only a stream that can be reset is replayable.
+    if data is None or isinstance(data, (bytes, str, dict, list, tuple)):
+        return True
+    if hasattr(data, "reset"):
+        data.reset()
+        return True
+    return False
+
+
+def _columnar() -> ModuleType:
+    # numpy is imported with pymeow.columnar, only when a columnar result is requested.
+    return importlib.import_module("pymeow.columnar")
 
 
 class Client:
-    def __init__(self, api_key: str = None) -> None:
+    def __init__(self, api_key: str | KeyPool = None, pool_connections: int = 10, pool_maxsize: int = 10,
+                 pool_block: bool = False, keep_alive: bool = True, timeout: float = 30.0,
+                 cache: ResponseCache | bool = None, scheduler: RequestScheduler = None,
+                 validate_models: bool = True, lazy_breeds: bool = False,
+                 coalesce: SingleFlight | bool = False, hooks: Iterable[RequestHook] = None,
+                 records: bool = False) -> None:
         """
         :param api_key: The API key from https://thecatapi.com. You can get it from https://thecatapi.com/signup
+         Pass a KeyPool instead to spread the requests over several keys.
+        :param pool_connections: The number of per-host connection pools to keep.
+        :param pool_maxsize: The maximum number of connections kept alive per host.
+        :param pool_block: Whether to wait for a free connection when a host pool is exhausted
+         instead of opening an extra one that is discarded afterwards.
+        :param keep_alive: Whether to reuse connections between requests.
+        :param timeout: Default timeout in seconds for every request.
+        :param cache: A ResponseCache for GET responses, or True to cache the catalog endpoints
+         (breeds, breed search and version) with the default settings.
+        :param scheduler: A RequestScheduler that rate limits, prioritizes and retries requests.
+        :param validate_models: Whether get_cat validates the responses. Disable it to trust the API
+         and build the models several times faster.
+        :param lazy_breeds: Whether get_cat builds the breeds of a cat only when its breed_info is accessed.
+        :param coalesce: A SingleFlight, or True to create one, that merges identical GET requests sent by
+         several threads at the same time into one: the callers share the result. It never applies to get_cat,
+         facts or requests that change data, whose responses are not meant to be shared.
+        :param hooks: RequestHook objects called before and after every request, e.g. a RequestMetrics.
+        :param records: Whether to return the lightweight records of pymeow.records instead of pydantic models.
+         pydantic is then never imported, and validate_models and lazy_breeds have no effect.
         """
+        _import_requests()
         self.uri = "https://api.thecatapi.com/v1/"
         self.api_key = api_key
+        self.key_pool = None if api_key is None or isinstance(api_key, str) else api_key
+        self.timeout = timeout
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=pool_block)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers["Connection"] = "keep-alive" if keep_alive else "close"
+        if isinstance(cache, bool):
+            cache = ResponseCache() if cache else None
+        self.cache = cache
+        self.scheduler = scheduler
+        self.validate_models = validate_models
+        self.lazy_breeds = lazy_breeds
+        if isinstance(coalesce, bool):
+            coalesce = SingleFlight() if coalesce else None
+        self.coalesce = coalesce
+        self.hooks = list(hooks or ())
+        self.records = records
+        self._models = None
+
+    @property
+    def models(self) -> ModuleType:
+        """
+        The module of the classes the results are built with: pymeow.models, or pymeow.records in records mode.
+        It is imported on first use.
+        """
+        if self._models is None:
+            self._models = importlib.import_module("pymeow.records" if self.records else "pymeow.models")
+        return self._models
 
     def get_cat(self, limit: int = 1, page: int = 0, order: str = "RAND", has_breeds: bool = False,
-                breed_ids: str = None,  sub_id: str = None) -> list[Cat] | Cat:
+                breed_ids: str = None,  sub_id: str = None, columnar: bool = False) -> list[Cat] | Cat | Table:
         """
         A function that retrieves cat images url with id and sizes based on the specified parameters.
         Parameters available only if you have an API key
@@ -26,12 +142,14 @@ class Client:
             has_breeds (int): Indicator for whether to retrieve images with breeds (default is 0).
             breed_ids (str): The IDs of specific breeds to retrieve images for.
             sub_id (str): The sub ID for the request.
+            columnar (bool): Whether to return a columnar Table instead of Cat objects (requires numpy).
 
         Returns:
             list[dict]: A list of dictionaries containing information about the retrieved cat images.
         """
         args = locals().copy()
         del args['self']
+        del args['columnar']
         if (args['limit'] > 10 or args['has_breeds']) and not self.api_key:
             raise EmptyTokenException("You must have an API key to get more than 10 images or use params."
                                       "To get an API key, go to https://thecatapi.com/signup")
@@ -39,7 +157,12 @@ class Client:
         response = self._request(url=url, method="GET", params=args, headers=self._get_headers())
         if response.status_code == 200:
             r_json = response.json()
-            return convert_json_to_obj(r_json)
+            if columnar:
+                return _columnar().images_to_columns(r_json)
+            if self.records:
+                return self.models.convert_json_to_obj(r_json)
+            from pymeow.utils import convert_json_to_obj
+            return convert_json_to_obj(r_json, validate=self.validate_models, lazy=self.lazy_breeds)
         else:
             raise RequestException(response.status_code, response.text)
 
@@ -53,14 +176,10 @@ class Client:
         Returns:
             list[dict]: A list of dictionaries containing information about the breed.
         """
-        url = self.uri + f"breeds/search?q={breed}"
-        response = self._request(url=url, method="GET", headers=self._get_headers())
-        if response.status_code == 200:
-            r_json = response.json()
-            if r_json:
-                return Breed(**r_json[0])
-            else:
-                return []
+        url = self.uri + "breeds/search"
+        return self._fetch("breeds/search", url,
+                           lambda r_json: self.models.Breed(**r_json[0]) if r_json else [],
+                           params={"q": breed})
 
     def get_all_breeds(self) -> list[Breed]:
         """
@@ -69,34 +188,80 @@ class Client:
             list[dict]: A list of dictionaries containing information about all the breeds.
         """
         url = self.uri + "breeds"
-        response = self._request(url=url, method="GET", headers=self._get_headers())
-        if response.status_code == 200:
-            r_json = response.json()
-            return [Breed(**breed) for breed in r_json]
+        return self._fetch("breeds", url, lambda r_json: [self.models.Breed(**breed) for breed in r_json])
 
-    def upload_image(self, file_path: str, sub_id: str = None, breed_ids: str = None) -> CatPic:
+    def upload_image(self, file_path: str, sub_id: str = None, breed_ids: str = None,
+                     content_type: str = None) -> CatPic:
         """
         A function that uploads an image to the specified URI.
         Parameters:
             file_path (str): File_path to the image.
             sub_id (str): a string you can use to segment your images, e.g. knowing which of your own users uploaded it
             breed_ids (str): comma separated string of breed ids contained in the image.
+            content_type (str): The content type of the image (default is detected from the file name).
         """
+        from pymeow.uploads import MultipartStream
+
         url = self.uri + "images/upload"
         image_name, image_path = split_image_path(file_path)
-        files = [
-            ('file', (image_name, open(image_path, 'rb'), 'image/jpeg'))
-        ]
-        response = self._request(url=url, method="POST",
-                                 data={"sub_id": sub_id, "breed_ids": breed_ids},
-                                 headers=self._get_headers(),
-                                 files=files)
+        with MultipartStream({"sub_id": sub_id, "breed_ids": breed_ids}, "file", image_name, image_path,
+                             content_type) as body:
+            response = self._request(url=url, method="POST", data=body,
+                                     headers=self._get_headers({"Content-Type": body.content_type}),
+                                     pin=f"sub_id:{sub_id or ''}")
         if response.status_code in (200, 201):
+            self._invalidate("images")
             r_json = response.json()
-            return CatPic(**r_json)
+            self._remember(f"images/{r_json['id']}", response)
+            return self.models.CatPic(**r_json)
         else:
             raise RequestException(response.status_code, response.text)
 
+    def upload_many(self, paths: str | Iterable[str], sub_id: str = None, breed_ids: str = None,
+                    max_workers: int = 4, retries: int = 2, backoff: float = 1.0) -> Iterator[UploadResult]:
+        """
+        A function that uploads many images concurrently. File bodies are streamed from disk.
+        Uploads start when the returned iterator is consumed, and at most 2 * max_workers files are in progress.
+
+        Parameters:
+            paths (str | Iterable[str]): A directory with images, or paths to the images.
+            sub_id (str): a string you can use to segment your images, e.g. knowing which of your own users uploaded it
+            breed_ids (str): comma separated string of breed ids contained in the images.
+            max_workers (int): The maximum number of concurrent uploads (default is 4).
+            retries (int): The maximum number of retries of every file after a connection error,
+             a throttled or a gateway error response (default is 2).
+            backoff (float): The base delay in seconds between retries, doubled after every attempt.
+
+        Returns:
+            Iterator[UploadResult]: The results in input order, each yielded as soon as it and all
+             the results before it are complete. Failed uploads carry the error instead of a CatPic.
+        """
+        from pymeow.uploads import iter_image_paths
+
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="pymeow-upload") as executor:
+            pending = deque()
+            for path in iter_image_paths(paths):
+                if len(pending) >= max_workers * 2:
+                    yield pending.popleft().result()
+                pending.append(executor.submit(self._upload_with_retries, path, sub_id, breed_ids, retries, backoff))
+            while pending:
+                yield pending.popleft().result()
+
+    def _upload_with_retries(self, path: str, sub_id: str, breed_ids: str, retries: int,
+                             backoff: float) -> UploadResult:
+        from pymeow.uploads import UploadResult, is_retryable
+
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                return UploadResult(path, self.upload_image(path, sub_id=sub_id, breed_ids=breed_ids),
+                                    attempts=attempt)
+            except (RequestException, OSError) as exc:
+                if attempt > retries or not is_retryable(exc):
+                    return UploadResult(path, error=exc, attempts=attempt)
+            time.sleep(random.uniform(0.5, 1.0) * backoff * 2 ** (attempt - 1))
+
     def delete_image(self, image_id: str) -> bool:
         """
         A function that deletes an image from the specified URI.
@@ -111,15 +276,18 @@ class Client:
             raise EmptyTokenException("You must have an API key to access this method. "
                                       "To get an API key, go to https://thecatapi.com/signup")
         url = self.uri + f"images/{image_id}"
-        response = self._request(url=url, method="DELETE", headers=self._get_headers({"Content-Type": "application/json"}))
+        response = self._request(url=url, method="DELETE", headers=self._get_headers({"Content-Type": "application/json"}),
+                                 pin=f"images/{image_id}")
         if response.status_code in (200, 201, 204):
+            self._invalidate("images")
             return True
         else:
             raise RequestException(response.status_code, response.text)
 
     def get_upload_images(self, limit: int = 10, page: int = 0, order: str = "DESC",
                           sub_id: str = None, breed_ids: str = None, category_ids: str = None,
-                          format: str = "json", original_filename: str = None, user_id: str = None) -> list[CatPic]:
+                          format: str = "json", original_filename: str = None, user_id: str = None,
+                          columnar: bool = False) -> list[CatPic] | Table:
         """
         A function that retrieves information about all images uploaded to the specified URI.
 
@@ -135,6 +303,7 @@ class Client:
             original_filename (str): The original filename of the image.
             user_id (str): default applied your unique user_id from welcome email,
              filter to only show images from your account that you have uploaded.
+            columnar (bool): Whether to return a columnar Table instead of CatPic objects (requires numpy).
 
         Returns:
             list[CatPic]: A list of CatPic objects containing information about all the images.
@@ -143,16 +312,14 @@ class Client:
             raise EmptyTokenException("You must have an API key to access this method. "
                                       "To get an API key, go to https://thecatapi.com/signup")
         url = self.uri + "images"
-        response = self._request(url=url, method="GET", headers=self._get_headers(),
-                                 params={"limit": limit, "page": page, "order": order,
-                                         "sub_id": sub_id, "breed_ids": breed_ids,
-                                         "category_ids": category_ids, "format": format,
-                                         "original_filename": original_filename, "user_id": user_id})
-        if response.status_code == 200:
-            r_json = response.json()
-            return [CatPic(**image) for image in r_json]
-        else:
-            raise RequestException(response.status_code, response.text)
+        build = _columnar().images_to_columns if columnar else lambda r_json: [self.models.CatPic(**image)
+                                                                               for image in r_json]
+        return self._fetch("images", url, build,
+                           params={"limit": limit, "page": page, "order": order,
+                                   "sub_id": sub_id, "breed_ids": breed_ids,
+                                   "category_ids": category_ids, "format": format,
+                                   "original_filename": original_filename, "user_id": user_id},
+                           variant="columns" if columnar else None, pin=f"sub_id:{sub_id or ''}")
 
     def vote(self, image_id: str, sub_id: str, value: int) -> UserVote:
         """
@@ -172,15 +339,17 @@ class Client:
         url = self.uri + f"votes"
         response = self._request(url=url, method="POST",
                                  json={"image_id": image_id, "sub_id": sub_id, "value": value},
-                                 headers=self._get_headers())
+                                 headers=self._get_headers(), pin=f"sub_id:{sub_id or ''}")
         if response.status_code in (200, 201):
+            self._invalidate("votes")
             r_json = response.json()
-            return UserVote(**r_json)
+            self._remember(f"votes/{r_json['id']}", response)
+            return self.models.UserVote(**r_json)
         else:
             raise RequestException(response.status_code, response.text)
 
     def get_votes(self, attach_image: int = 0, sub_id: str = None, page: int = 0,
-                  limit: int = 100, order: str = 'ASC') -> list[UserVote]:
+                  limit: int = 100, order: str = 'ASC', columnar: bool = False) -> list[UserVote] | Table:
         """
         Retrieve any created Votes. This can be filtered by sub_id,
          and paginated using page and limit Query string parameters.
@@ -191,6 +360,7 @@ class Client:
             page (int): The page number of results to retrieve (default is 0).
             limit (int): The number of results per page (default is 100).
             order (str): The order in which to retrieve results (default is "ASC").
+            columnar (bool): Whether to return a columnar Table instead of UserVote objects (requires numpy).
 
         Returns:
             list[UserVote]: A list of UserVote objects containing information about the retrieved votes.
@@ -199,14 +369,11 @@ class Client:
             raise EmptyTokenException("You must have an API key to access this method. "
                                       "To get an API key, go to https://thecatapi.com/signup")
         url = self.uri + "votes"
-        response = self._request(url=url, params={"attach_image": attach_image, "sub_id": sub_id,
-                                                  "page": page, "limit": limit, "order": order},
-                                 method="GET", headers=self._get_headers())
-        if response.status_code == 200:
-            r_json = response.json()
-            return [UserVote(**v) for v in r_json]
-        else:
-            raise RequestException(response.status_code, response.text)
+        build = _columnar().votes_to_columns if columnar else lambda r_json: [self.models.UserVote(**v) for v in r_json]
+        return self._fetch("votes", url, build,
+                           params={"attach_image": attach_image, "sub_id": sub_id,
+                                   "page": page, "limit": limit, "order": order},
+                           variant="columns" if columnar else None, pin=f"sub_id:{sub_id or ''}")
 
     def get_vote_by_id(self, vote_id: int | str) -> UserVote:
         """
@@ -222,12 +389,7 @@ class Client:
             raise EmptyTokenException("You must have an API key to access this method. "
                                       "To get an API key, go to https://thecatapi.com/signup")
         url = self.uri + f"votes/{vote_id}"
-        response = self._request(url=url, method="GET", headers=self._get_headers())
-        if response.status_code == 200:
-            r_json = response.json()
-            return UserVote(**r_json)
-        else:
-            raise RequestException(response.status_code, response.text)
+        return self._fetch("votes", url, lambda r_json: self.models.UserVote(**r_json), pin=f"votes/{vote_id}")
 
     def delete_vote(self, vote_id: int | str) -> dict:
         """
@@ -243,8 +405,9 @@ class Client:
             raise EmptyTokenException("You must have an API key to access this method. "
                                       "To get an API key, go to https://thecatapi.com/signup")
         url = self.uri + f"votes/{vote_id}"
-        response = self._request(url=url, method="DELETE", headers=self._get_headers())
+        response = self._request(url=url, method="DELETE", headers=self._get_headers(), pin=f"votes/{vote_id}")
         if response.status_code == 200:
+            self._invalidate("votes")
             return response.json()
         else:
             raise RequestException(response.status_code, response.text)
@@ -269,7 +432,7 @@ class Client:
                                  method="GET", headers=self._get_headers())
         if response.status_code == 200:
             r_json = response.json()
-            return [Fact(**f) for f in r_json]
+            return [self.models.Fact(**f) for f in r_json]
         else:
             raise RequestException(response.status_code, response.text)
 
@@ -289,12 +452,12 @@ class Client:
         if not self.api_key:
             raise EmptyTokenException("You must have an API key with premium to access this method. "
                                       "To get an API key, go to https://thecatapi.com/signup")
-        url = f'https://api.thecatapi.com/v1/breeds/{breed_name}/facts'
+        url = self.uri + f"breeds/{breed_name}/facts"
         response = self._request(url=url, method="GET", headers=self._get_headers(),
                                  params={"limit": limit, "page": page, "order": order})
         if response.status_code == 200:
             r_json = response.json()
-            return [Fact(**f) for f in r_json]
+            return [self.models.Fact(**f) for f in r_json]
         else:
             raise RequestException(response.status_code, response.text)
 
@@ -305,30 +468,303 @@ class Client:
         Returns:
             dict: A dictionary containing information about the current version of the API.
         """
-        response = self._request(url=self.uri, method="GET", headers=self._get_headers())
-        if response.status_code == 200:
-            return response.json()
+        return self._fetch("version", self.uri, lambda r_json: r_json)
+
+    def iter_upload_images(self, limit: int = 100, page: int = 0, order: str = "DESC",
+                           sub_id: str = None, breed_ids: str = None, category_ids: str = None,
+                           original_filename: str = None, user_id: str = None,
+                           prefetch: int = 1, max_pages: int = None) -> Iterator[CatPic]:
+        """
+        Iterate over all uploaded images page by page. The next page is downloaded in the background
+        while the current one is consumed.
+        See get_upload_images for the description of the filters.
+
+        Parameters:
+            limit (int): The number of images per page (default is 100).
+            page (int): The page to start from (default is 0).
+            prefetch (int): The maximum number of pages buffered ahead of the current one (default is 1).
+            max_pages (int): The maximum number of pages to fetch (default is no limit).
+
+        Returns:
+            Iterator[CatPic]: CatPic objects, one at a time. Iteration stops on the first empty page.
+        """
+        return iter_pages(lambda p: self.get_upload_images(limit=limit, page=p, order=order, sub_id=sub_id,
+                                                           breed_ids=breed_ids, category_ids=category_ids,
+                                                           original_filename=original_filename, user_id=user_id),
+                          start_page=page, prefetch=prefetch, max_pages=max_pages)
+
+    def iter_votes(self, attach_image: int = 0, sub_id: str = None, page: int = 0, limit: int = 100,
+                   order: str = 'ASC', prefetch: int = 1, max_pages: int = None) -> Iterator[UserVote]:
+        """
+        Iterate over all votes page by page. The next page is downloaded in the background
+        while the current one is consumed.
+        See get_votes for the description of the filters.
+
+        Parameters:
+            prefetch (int): The maximum number of pages buffered ahead of the current one (default is 1).
+            max_pages (int): The maximum number of pages to fetch (default is no limit).
+
+        Returns:
+            Iterator[UserVote]: UserVote objects, one at a time. Iteration stops on the first empty page.
+        """
+        return iter_pages(lambda p: self.get_votes(attach_image=attach_image, sub_id=sub_id, page=p,
+                                                   limit=limit, order=order),
+                          start_page=page, prefetch=prefetch, max_pages=max_pages)
+
+    def iter_random_facts(self, page: int = 0, limit: int = 100, order: str = "ASC",
+                          prefetch: int = 1, max_pages: int = None) -> Iterator[Fact]:
+        """
+        Iterate over facts page by page. The next page is downloaded in the background
+        while the current one is consumed.
+        See get_random_fact for the description of the filters.
+
+        Parameters:
+            prefetch (int): The maximum number of pages buffered ahead of the current one (default is 1).
+            max_pages (int): The maximum number of pages to fetch (default is no limit).
+
+        Returns:
+            Iterator[Fact]: Fact objects, one at a time. Iteration stops on the first empty page.
+        """
+        return iter_pages(lambda p: self.get_random_fact(page=p, limit=limit, order=order),
+                          start_page=page, prefetch=prefetch, max_pages=max_pages)
+
+    def iter_breed_facts(self, breed_name: str, limit: int = 100, page: int = 0, order: str = "ASC",
+                         prefetch: int = 1, max_pages: int = None) -> Iterator[Fact]:
+        """
+        Iterate over facts about a breed page by page. The next page is downloaded in the background
+        while the current one is consumed.
+        See get_breed_fact for the description of the filters.
+
+        Parameters:
+            prefetch (int): The maximum number of pages buffered ahead of the current one (default is 1).
+            max_pages (int): The maximum number of pages to fetch (default is no limit).
+
+        Returns:
+            Iterator[Fact]: Fact objects, one at a time. Iteration stops on the first empty page.
+        """
+        return iter_pages(lambda p: self.get_breed_fact(breed_name, limit=limit, page=p, order=order),
+                          start_page=page, prefetch=prefetch, max_pages=max_pages)
+
+    def stream_cats(self, limit: int = 1, page: int = 0, order: str = "RAND", has_breeds: bool = False,
+                    breed_ids: str = None, sub_id: str = None, chunk_size: int = 64 * 1024) -> Iterator[Cat]:
+        """
+        Like get_cat, but the response is parsed while it is downloaded and every cat is yielded as soon as
+        it is complete, so large responses are never held in memory as a whole.
+        See get_cat for the description of the filters.
+
+        Parameters:
+            chunk_size (int): The number of bytes read from the connection at a time.
+
+        Returns:
+            Iterator[Cat]: Cat objects, one at a time. The request is sent on the first iteration.
+        """
+        if (limit > 10 or has_breeds) and not self.api_key:
+            raise EmptyTokenException("You must have an API key to get more than 10 images or use params."
+                                      "To get an API key, go to https://thecatapi.com/signup")
+        if self.records:
+            build = lambda item: self.models.convert_json_to_obj([item])
         else:
-            raise RequestException(response.status_code, response.text)
+            from pymeow.utils import convert_cat
+            build = lambda item: convert_cat(item, validate=self.validate_models, lazy=self.lazy_breeds)
+        return self._stream(self.uri + "images/search", build, chunk_size,
+                            params={"limit": limit, "page": page, "order": order, "has_breeds": has_breeds,
+                                    "breed_ids": breed_ids, "sub_id": sub_id})
+
+    def stream_all_breeds(self, chunk_size: int = 64 * 1024) -> Iterator[Breed]:
+        """
+        Like get_all_breeds, but every breed is yielded as soon as it is parsed from the response.
+        The response cache is not used.
+
+        Parameters:
+            chunk_size (int): The number of bytes read from the connection at a time.
+
+        Returns:
+            Iterator[Breed]: Breed objects, one at a time. The request is sent on the first iteration.
+        """
+        return self._stream(self.uri + "breeds", lambda breed: self.models.Breed(**breed), chunk_size)
+
+    def stream_votes(self, attach_image: int = 0, sub_id: str = None, page: int = 0, limit: int = 100,
+                     order: str = "ASC", chunk_size: int = 64 * 1024) -> Iterator[UserVote]:
+        """
+        Like get_votes, but every vote is yielded as soon as it is parsed from the response,
+        which keeps memory flat when the images are attached. See get_votes for the description of the filters.
+
+        Parameters:
+            chunk_size (int): The number of bytes read from the connection at a time.
+
+        Returns:
+            Iterator[UserVote]: UserVote objects, one at a time. The request is sent on the first iteration.
+        """
+        if not self.api_key:
+            raise EmptyTokenException("You must have an API key to access this method. "
+                                      "To get an API key, go to https://thecatapi.com/signup")
+        return self._stream(self.uri + "votes", lambda vote: self.models.UserVote(**vote), chunk_size,
+                            params={"attach_image": attach_image, "sub_id": sub_id,
+                                    "page": page, "limit": limit, "order": order},
+                            pin=f"sub_id:{sub_id or ''}")
 
     def _get_headers(self, *args) -> dict:
         headers = {}
         for arg in args:
             headers.update(arg)
-        if self.api_key:
+        if self.api_key and self.key_pool is None:
             headers.update({"x-api-key": self.api_key})
         return headers
 
-    @staticmethod
-    def _request(url: str, method: str, params: dict = None,
+    def _remember(self, resource: str, response: Response) -> None:
+        # Later requests on a resource created with a key of the pool are sent with the same key.
+        if self.key_pool is not None:
+            self.key_pool.remember(resource, response.request.headers["x-api-key"])
+
+    def _fetch(self, endpoint: str, url: str, build: Callable[[Any], Any], params: dict = None,
+               variant: str = None, pin: str = None) -> Any:
+        """
+        Send a GET request and build the result from the JSON response, going through the cache
+        if the endpoint is cached. Results built differently from the same response are cached
+        under different variants. Identical requests in flight are merged if coalescing is enabled.
+        pin is passed to the KeyPool of the client, if any.
+        """
+        def load(validators: dict) -> tuple:
+            response = self._request(url=url, method="GET", params=params, headers=self._get_headers(validators),
+                                     pin=pin)
+            if response.status_code == 304:
+                return 304, None, None, None
+            if response.status_code != 200:
+                raise RequestException(response.status_code, response.text)
+            return 200, response.json(), response.headers.get("ETag"), response.headers.get("Last-Modified")
+
+        key = ResponseCache.make_key(url, params)
+        if variant:
+            key += "#" + variant
+
+        def fetch() -> Any:
+            if self.cache is None or not self.cache.ttl_for(endpoint):
+                return build(load({})[1])
+            return self.cache.fetch(endpoint, key, load, build)
+
+        if self.coalesce is None:
+            return fetch()
+        return self.coalesce.do(("GET", key), fetch)
+
+    def _stream(self, url: str, build: Callable[[Any], Any], chunk_size: int, params: dict = None,
+                pin: str = None) -> Iterator:
+        """
+        Send a GET request without reading the body up front, then parse the JSON array in the body chunk
+        by chunk and build every item as soon as it is complete. Compressed bodies (the session accepts
+        gzip and deflate) are decompressed chunk by chunk too. The cache and coalescing do not apply.
+        """
+        from pymeow.streaming import iter_json_array
+
+        with self._request(url=url, method="GET", params=params, headers=self._get_headers(), pin=pin,
+                           stream=True) as response:
+            received = 0
+
+            def chunks() -> Iterator[bytes]:
+                nonlocal received
+                for chunk in response.iter_content(chunk_size=chunk_size):
+                    received += len(chunk)
+                    yield chunk
+
+            try:
+                if response.status_code != 200:
+                    received = len(response.content)
+                    raise RequestException(response.status_code, response.text)
+                for item in iter_json_array(chunks(), response.encoding or "utf-8"):
+                    yield build(item)
+            finally:
+                info = getattr(response, "request_info", None)
+                if info is not None:
+                    # The decompressed size of the body, as far as it was read.
+                    info.bytes_in = received
+                    for hook in self.hooks:
+                        hook.after_body(info)
+
+    def _invalidate(self, endpoint: str) -> None:
+        if self.cache is not None:
+            self.cache.invalidate(endpoint)
+
+    def _request(self, url: str, method: str, params: dict = None,
                  data: dict = None, json: dict = None, headers: dict = None,
-                 files: list = None, timeout: float = 30.0) -> Response:
-        try:
-            response = requests.request(url=url, method=method, params=params,
-                                        headers=headers, data=data, timeout=timeout, files=files, json=json)
-            return response
-        except RequestException:
-            raise RequestException
+                 files: list = None, timeout: float = None, pin: str = None, stream: bool = False) -> Response:
+        scheduler = self.scheduler
+        hooks = self.hooks
+        keys = self.key_pool
+        attempt = switches = 0
+        while True:
+            if scheduler is not None:
+                scheduler.acquire()
+            key = keys.acquire(pin) if keys is not None else None
+            response = error = None
+            try:
+                if key is not None:
+                    headers = {**(headers or {}), "x-api-key": key}
+                if hooks:
+                    info = RequestInfo(method, url, headers if headers is not None else {}, attempt)
+                    for hook in hooks:
+                        hook.before_request(info)
+                    headers = info.headers
+                    info.started = time.perf_counter()
+                try:
+                    response = self.session.request(url=url, method=method, params=params, headers=headers,
+                                                    data=data, timeout=timeout or self.timeout, files=files,
+                                                    json=json, stream=stream)
+                except RequestException as exc:
+                    error = exc
+            finally:
+                # The key is given back whatever happens, a hook or an interrupt included.
+                rotated = key is not None and keys.release(key, response, error)
+            if error is not None:
+                delay = None if scheduler is None else scheduler.retry_delay(method, attempt - switches, error=error)
+                if delay is not None and not _rewind(data):
+                    delay = None
+                if hooks:
+                    info.finish(error=error, retried=delay is not None)
+                    for hook in hooks:
+                        hook.after_request(info)
+                if delay is None:
+                    raise error
+            else:
+                if rotated and switches < len(keys):
+                    # The key was throttled or rejected, so the request was not processed: send it again with
+                    # another key right away, or with the pinned key once it is back, without using up
+                    # the retries of the scheduler.
+                    delay = 0.0
+                    switches += 1
+                elif scheduler is not None:
+                    delay = scheduler.retry_delay(method, attempt - switches, response=response)
+                else:
+                    delay = None
+                if delay is not None and not _rewind(data):
+                    # The first attempt consumed the body: the response is returned as it is.
+                    delay = None
+                if hooks:
+                    # A streamed body is not read yet: _stream reports its size with after_body once it is.
+                    bytes_in = 0 if stream else len(response.content)
+                    info.finish(response.status_code, bytes_in,
+                                int(response.request.headers.get("Content-Length") or 0), retried=delay is not None)
+                    for hook in hooks:
+                        hook.after_request(info)
+                if delay is None:
+                    if hooks and stream:
+                        response.request_info = info
+                    return response
+                response.close()
+            time.sleep(delay)
+            attempt += 1
+
+    def close(self) -> None:
+        """
+        Close the underlying session and release all pooled connections.
+        """
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
 
     def __repr__(self):
+        if self.key_pool is not None:
+            return f"Client(key_pool={self.key_pool!r}, uri={self.uri})"
         return f"Client(api_key={self.api_key}, uri={self.uri})"
@@ -0,0 +1,228 @@
+from typing import Dict, Iterable, List, Optional, Sequence, Union
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError("The columnar mode requires numpy. Install it with `pip install pymeow[numpy]`")
+
+
+class DictColumn:
+    def __init__(self, codes: "np.ndarray", categories: "np.ndarray") -> None:
+        """
+        A dictionary-encoded string column: every value is stored as an index into categories, -1 stands for None.
+
+        :param codes: The int32 index of the value of every row.
+        :param categories: The distinct values.
+        """
+        self.codes = codes
+        self.categories = categories
+
+    @classmethod
+    def encode(cls, values: Sequence[Optional[str]]) -> "DictColumn":
+        mapping = {}
+        codes = np.fromiter((-1 if value is None else mapping.setdefault(value, len(mapping)) for value in values),
+                            dtype=np.int32, count=len(values))
+        return cls(codes, np.array(list(mapping), dtype=object))
+
+    def decode(self) -> List[Optional[str]]:
+        return [None if code < 0 else self.categories[code] for code in self.codes.tolist()]
+
+    def code_of(self, value: str) -> int:
+        """
+        Return the code of a value, or -1 if the column does not contain it.
+        """
+        matches = np.flatnonzero(self.categories == value)
+        return int(matches[0]) if len(matches) else -1
+
+    def __eq__(self, value: str) -> "np.ndarray":
+        return self.codes == self.code_of(value)
+
+    def __getitem__(self, item) -> Union["DictColumn", Optional[str]]:
+        codes = self.codes[item]
+        if np.ndim(codes) == 0:
+            return None if codes < 0 else self.categories[codes]
+        return DictColumn(codes, self.categories)
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    @property
+    def nbytes(self) -> int:
+        return self.codes.nbytes + sum(len(value) for value in self.categories) + self.categories.nbytes
+
+    def __repr__(self):
+        return f"DictColumn(rows={len(self)}, categories={len(self.categories)})"
+
+
+Column = Union["np.ndarray", DictColumn]
+
+
+def _int_column(values: Sequence[Optional[int]], dtype) -> "np.ndarray":
+    """
+    Build an integer column. Missing values are masked, so they are skipped by the aggregations.
+    """
+    if any(value is None for value in values):
+        return np.ma.masked_array([0 if value is None else value for value in values],
+                                  mask=[value is None for value in values], dtype=dtype)
+    return np.array(values, dtype=dtype)
+
+
+def _datetime_column(values: Sequence[Optional[str]]) -> "np.ndarray":
+    # numpy does not parse time zones, and the API always returns UTC timestamps ending with "Z".
+    return np.array(["NaT" if value is None else value.rstrip("Z") for value in values], dtype="datetime64[ms]")
+
+
+class Table:
+    def __init__(self, columns: Dict[str, Column]) -> None:
+        """
+        A set of columns of the same length.
+
+        :param columns: NumPy arrays or DictColumn objects by name.
+        """
+        self.columns = columns
+
+    def __getitem__(self, name: str) -> Column:
+        return self.columns[name]
+
+    def __len__(self) -> int:
+        return len(next(iter(self.columns.values()))) if self.columns else 0
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.columns
+
+    def filter(self, mask: "np.ndarray") -> "Table":
+        """
+        Return the rows where the boolean mask is True, e.g. table.filter(table["value"] > 0).
+        """
+        return Table({name: column[mask] for name, column in self.columns.items()})
+
+    def group_by(self, key: str, value: str = None, agg: str = "count") -> "Table":
+        """
+        Aggregate a column by the distinct values of another one.
+
+        Parameters:
+            key (str): The column to group by. Rows where it is missing are skipped.
+            value (str): The column to aggregate. It is not needed for count.
+            agg (str): One of count, sum, mean, min, max.
+
+        Returns:
+            Table: A table with the key column and a column named after agg.
+        """
+        codes, labels = self._group_codes(key)
+        valid = codes >= 0
+        values = None
+        if agg != "count":
+            if value is None:
+                raise ValueError(f"{agg} requires a value column")
+            values = self.columns[value]
+            valid &= ~np.ma.getmaskarray(values)
+            values = np.ma.getdata(values)[valid].astype(np.float64)
+        codes = codes[valid]
+        size = len(labels)
+        counts = np.bincount(codes, minlength=size)
+        if agg == "count":
+            result = counts
+        elif agg in ("sum", "mean"):
+            result = np.bincount(codes, weights=values, minlength=size)
+            if agg == "mean":
+                with np.errstate(invalid="ignore", divide="ignore"):
+                    result = result / counts
+        elif agg in ("min", "max"):
+            result = np.full(size, np.inf if agg == "min" else -np.inf)
+            (np.minimum if agg == "min" else np.maximum).at(result, codes, values)
+            result[counts == 0] = np.nan
+        else:
+            raise ValueError(f"Unknown aggregation {agg!r}. Available aggregations: count, sum, mean, min, max")
+        return Table({key: labels, agg: result})
+
+    def _group_codes(self, key: str) -> tuple:
+        column = self.columns[key]
+        if isinstance(column, DictColumn):
+            return column.codes, column.categories
+        data, missing = np.ma.getdata(column), np.ma.getmaskarray(column)
+        labels = np.unique(data[~missing])
+        codes = np.searchsorted(labels, data).astype(np.int32)
+        codes[missing] = -1
+        return codes, labels
+
+    def to_dicts(self) -> List[dict]:
+        """
+        Convert the table back to one dictionary per row.
+        """
+        columns = {name: column.decode() if isinstance(column, DictColumn) else column.tolist()
+                   for name, column in self.columns.items()}
+        return [dict(zip(columns, row)) for row in zip(*columns.values())]
+
+    @property
+    def nbytes(self) -> int:
+        return sum(column.nbytes for column in self.columns.values())
+
+    def __repr__(self):
+        return f"Table(rows={len(self)}, columns={list(self.columns)})"
+
+
+def votes_to_columns(json_data: Iterable[dict]) -> Table:
+    """
+    A function that converts votes returned by the API to columns:
+    id (int64), value (int32), image_id and sub_id (DictColumn) and created_at (datetime64[ms]).
+    """
+    _require_numpy()
+    rows = list(json_data)
+    return Table({
+        "id": _int_column([row.get("id") for row in rows], np.int64),
+        "value": _int_column([row.get("value") for row in rows], np.int32),
+        "image_id": DictColumn.encode([row.get("image_id") for row in rows]),
+        "sub_id": DictColumn.encode([row.get("sub_id") for row in rows]),
+        "created_at": _datetime_column([row.get("created_at") for row in rows]),
+    })
+
+
+def images_to_columns(json_data: Iterable[dict]) -> Table:
+    """
+    A function that converts uploaded images or images/search results to columns:
+    id, sub_id, breed_ids and breed_id (DictColumn), width and height (int32) and created_at (datetime64[ms]).
+    breed_id is the id of the first breed attached to an image search result.
+    """
+    _require_numpy()
+    rows = list(json_data)
+    return Table({
+        "id": DictColumn.encode([row.get("id") for row in rows]),
+        "width": _int_column([row.get("width") for row in rows], np.int32),
+        "height": _int_column([row.get("height") for row in rows], np.int32),
+        "sub_id": DictColumn.encode([row.get("sub_id") for row in rows]),
+        "breed_ids": DictColumn.encode([row.get("breed_ids") for row in rows]),
+        "breed_id": DictColumn.encode([row["breeds"][0].get("id") if row.get("breeds") else None for row in rows]),
+        "created_at": _datetime_column([row.get("created_at") for row in rows]),
+    })
+
+
+def concat(tables: Iterable[Table]) -> Table:
+    """
+    A function that concatenates tables with the same columns, e.g. the pages of a columnar result.
+    """
+    _require_numpy()
+    tables = list(tables)
+    if not tables:
+        return Table({})
+    columns = {}
+    for name, first in tables[0].columns.items():
+        parts = [table.columns[name] for table in tables]
+        if isinstance(first, DictColumn):
+            mapping = {}
+            codes = []
+            for part in parts:
+                # Map the codes of every part onto the merged categories, keeping -1 for missing values.
+                remap = np.array([mapping.setdefault(value, len(mapping)) for value in part.categories] + [-1],
+                                 dtype=np.int32)
+                codes.append(remap[part.codes])
+            columns[name] = DictColumn(np.concatenate(codes), np.array(list(mapping), dtype=object))
+        elif any(np.ma.isMaskedArray(part) for part in parts):
+            columns[name] = np.ma.concatenate(parts)
+        else:
+            columns[name] = np.concatenate(parts)
+    return Table(columns)
@@ -0,0 +1,239 @@
+import hashlib
+import math
+import os
+import struct
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Iterator, Optional, Tuple
+
+from pymeow.random_pool import MAX_LIMIT, MAX_LIMIT_WITHOUT_KEY
+
+_MAGIC = b"PMBF"
+#: Magic, version, size in bits, number of hashes, count, capacity and error rate.
+_HEADER = struct.Struct("<4sBQBQQd")
+_VERSION = 1
+
+
+class BloomFilter:
+    def __init__(self, capacity: int = 1_000_000, error_rate: float = 0.001) -> None:
+        """
+        A set of strings that takes a fixed, small amount of memory: about 1.8 bytes per item at a 0.1%
+        false positive rate, whatever the length of the items. Membership tests can be wrong in one way only:
+        an item that was never added may be reported as seen, with a probability of error_rate
+        once capacity items are added. Items that were added are always reported as seen.
+
+        :param capacity: The number of items the filter is sized for.
+        :param error_rate: The false positive rate reached at capacity.
+        """
+        if capacity <= 0 or not 0 < error_rate < 1:
+            raise ValueError("capacity must be positive and error_rate between 0 and 1")
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item: str) -> Iterator[int]:
+        # Double hashing: k positions derived from the two halves of one 128-bit digest.
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        size = self.size
+        return ((h1 + i * h2) % size for i in range(self.hashes))
+
+    def add(self, item: str) -> bool:
+        """
+        Add an item.
+
+        Returns:
+            bool: True if the item was not in the filter before, False if it was probably seen already.
+        """
+        bits = self._bits
+        new = False
+        for position in self._positions(item):
+            byte, mask = position >> 3, 1 << (position & 7)
+            if not bits[byte] & mask:
+                bits[byte] |= mask
+                new = True
+        if new:
+            self.count += 1
+        return new
+
+    def __contains__(self, item: str) -> bool:
+        bits = self._bits
+        return all(bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+    def __len__(self) -> int:
+        """
+        The number of distinct items added, not counting the ones taken for duplicates by mistake.
+        """
+        return self.count
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._bits)
+
+    @property
+    def current_error_rate(self) -> float:
+        """
+        The estimated false positive rate for the number of items added so far.
+        """
+        return (1 - math.exp(-self.hashes * self.count / self.size)) ** self.hashes
+
+    def save(self, path: str) -> None:
+        """
+        Write the filter to a file. The file is replaced atomically, so a crash never leaves a truncated filter.
+        """
+        temporary = f"{path}.tmp"
+        with open(temporary, "wb") as file:
+            file.write(_HEADER.pack(_MAGIC, _VERSION, self.size, self.hashes, self.count, self.capacity,
+                                    self.error_rate))
+            file.write(self._bits)
+        os.replace(temporary, path)
+
+    @classmethod
+    def load(cls, path: str) -> "BloomFilter":
+        with open(path, "rb") as file:
+            header = file.read(_HEADER.size)
+            if len(header) != _HEADER.size or header[:4] != _MAGIC:
+                raise ValueError(f"{path} is not a pymeow Bloom filter")
+            _, version, size, hashes, count, capacity, error_rate = _HEADER.unpack(header)
+            if version != _VERSION:
+                raise ValueError(f"{path} was saved by an unsupported version ({version})")
+            bits = bytearray(file.read())
+        if len(bits) != (size + 7) // 8:
+            raise ValueError(f"{path} is truncated")
+        bloom = cls.__new__(cls)
+        bloom.capacity, bloom.error_rate, bloom.size, bloom.hashes = capacity, error_rate, size, hashes
+        bloom.count = count
+        bloom._bits = bits
+        return bloom
+
+    @classmethod
+    def open(cls, path: str, capacity: int = 1_000_000, error_rate: float = 0.001) -> "BloomFilter":
+        """
+        Load the filter saved at path, or create an empty one if the file does not exist.
+        """
+        if os.path.exists(path):
+            return cls.load(path)
+        return cls(capacity, error_rate)
+
+    def __repr__(self):
+        return (f"BloomFilter(count={self.count}, capacity={self.capacity}, error_rate={self.error_rate}, "
+                f"nbytes={self.nbytes})")
+
+
+@dataclass
+class HarvestStats:
+    requests: int = 0
+    fetched: int = 0
+    new: int = 0
+    stopped: Optional[str] = None
+    elapsed: float = 0.0
+
+    @property
+    def duplicates(self) -> int:
+        return self.fetched - self.new
+
+    @property
+    def duplicate_rate(self) -> float:
+        return self.duplicates / self.fetched if self.fetched else 0.0
+
+
+class Harvester:
+    def __init__(self, client, seen: BloomFilter = None, min_yield: float = 0.05, window: int = 20,
+                 batch_size: int = None) -> None:
+        """
+        Collects unique random images: every image whose id was already seen is skipped.
+        Seen ids are kept in a BloomFilter, so memory stays bounded however many images are fetched;
+        the price is that a new image is skipped with the filter's false positive rate.
+        The harvest stops by itself when the last window requests yielded less than min_yield new images
+        per image fetched, which happens as the random samples run out of unseen images.
+
+        :param client: The Client used to fetch the images.
+        :param seen: The filter of the ids seen so far, e.g. BloomFilter.open("seen.bloom") to resume a harvest.
+        :param min_yield: The fraction of new images per request below which the harvest stops (0 never stops).
+        :param window: The number of last requests the yield is measured over.
+        :param batch_size: The limit of every request (default is 100 with an API key, 10 without).
+        """
+        self.client = client
+        self.seen = seen if seen is not None else BloomFilter()
+        self.min_yield = min_yield
+        self.window = window
+        self.batch_size = batch_size or (MAX_LIMIT if client.api_key else MAX_LIMIT_WITHOUT_KEY)
+        self.stats = HarvestStats()
+        self._recent: Deque[Tuple[int, int]] = deque(maxlen=window)
+
+    def harvest(self, has_breeds: bool = False, breed_ids: str = None, max_requests: int = None,
+                max_images: int = None) -> Iterator:
+        """
+        Yield random cats never seen before, until the yield drops below min_yield or a limit is reached.
+
+        Parameters:
+            has_breeds (bool): Whether to fetch only images with breed information.
+            breed_ids (str): Comma separated breed IDs to fetch images of.
+            max_requests (int): The maximum number of requests to send (default is no limit).
+            max_images (int): The maximum number of new images to yield (default is no limit).
+
+        Returns:
+            Iterator[Cat]: The new cats. stats.stopped tells why the harvest ended.
+        """
+        started = time.perf_counter()
+        requests = new_images = 0
+        self.stats.stopped = None
+        try:
+            while True:
+                if max_requests is not None and requests >= max_requests:
+                    self.stats.stopped = "max_requests"
+                    return
+                cats = self.client.get_cat(limit=self.batch_size, has_breeds=has_breeds, breed_ids=breed_ids)
+                if not isinstance(cats, list):
+                    cats = [cats]
+                requests += 1
+                examined = new = 0
+                for cat in cats:
+                    image_id = cat.image_info.id
+                    if image_id is None:
+                        # Without an id a cat cannot be told apart from the others, nor counted.
+                        continue
+                    examined += 1
+                    if self.seen.add(image_id):
+                        new += 1
+                        new_images += 1
+                        yield cat
+                        if max_images is not None and new_images >= max_images:
+                            # The rest of the batch was not looked at: it counts neither as new nor as duplicates.
+                            self._record(examined, new)
+                            self.stats.stopped = "max_images"
+                            return
+                self._record(examined, new)
+                if not cats:
+                    self.stats.stopped = "empty"
+                    return
+                if self._exhausted():
+                    self.stats.stopped = "low_yield"
+                    return
+        finally:
+            self.stats.elapsed += time.perf_counter() - started
+
+    def recent_yield(self) -> float:
+        """
+        The fraction of new images among the images fetched by the last window requests.
+        """
+        fetched = sum(count for count, _ in self._recent)
+        return sum(new for _, new in self._recent) / fetched if fetched else 1.0
+
+    def _record(self, fetched: int, new: int) -> None:
+        self.stats.requests += 1
+        self.stats.fetched += fetched
+        self.stats.new += new
+        self._recent.append((fetched, new))
+
+    def _exhausted(self) -> bool:
+        return len(self._recent) == self.window and self.recent_yield() < self.min_yield
+
+    def __repr__(self):
+        return f"Harvester(seen={self.seen!r}, stats={self.stats})"
+
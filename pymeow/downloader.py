@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Callable, Iterable, List, Optional, Tuple, Union
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+if TYPE_CHECKING:
+    from pymeow.models import Cat, CatPic
+
+
+@dataclass
+class DownloadResult:
+    image_id: str
+    url: str
+    path: str
+    status: str
+    bytes: int = 0
+    error: Optional[Exception] = None
+
+
+@dataclass
+class DownloadReport:
+    results: List[DownloadResult] = field(default_factory=list)
+    bytes: int = 0
+    elapsed: float = 0.0
+
+    def count(self, status: str) -> int:
+        return sum(1 for result in self.results if result.status == status)
+
+    @property
+    def downloaded(self) -> int:
+        return self.count("downloaded") + self.count("resumed")
+
+    @property
+    def skipped(self) -> int:
+        return self.count("skipped")
+
+    @property
+    def failed(self) -> int:
+        return self.count("failed")
+
+    @property
+    def bytes_per_second(self) -> float:
+        return self.bytes / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def images_per_second(self) -> float:
+        return self.downloaded / self.elapsed if self.elapsed else 0.0
+
+    def __repr__(self):
+        return (f"DownloadReport(downloaded={self.downloaded}, skipped={self.skipped}, failed={self.failed}, "
+                f"bytes={self.bytes}, elapsed={self.elapsed:.2f}s, throughput={self.bytes_per_second / 1024:.1f} KiB/s)")
+
+
+class ImageDownloader:
+    def __init__(self, directory: str = "images", client=None, max_workers: int = 8,
+                 chunk_size: int = 64 * 1024, timeout: float = 30.0) -> None:
+        """
+        A downloader that saves images concurrently over one shared connection pool.
+        Images are streamed to disk in chunks, interrupted downloads are resumed and images
+        already saved in the directory are skipped.
+
+        :param directory: The directory the images are saved to. It is created if it does not exist.
+        :param client: A Client whose pooled session is reused. A new session is created if it is omitted.
+        :param max_workers: The maximum number of concurrent downloads.
+        :param chunk_size: The size in bytes of the chunks written to disk.
+        :param timeout: Timeout in seconds of every request.
+        """
+        self.directory = directory
+        self.max_workers = max_workers
+        self.chunk_size = chunk_size
+        self.timeout = timeout
+        self._owns_session = client is None
+        if client is not None:
+            self.session = client.session
+        else:
+            self.session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=max_workers)
+            self.session.mount("https://", adapter)
+            self.session.mount("http://", adapter)
+
+    def download(self, images: Iterable[Union[Cat, CatPic]],
+                 callback: Callable[[DownloadResult], None] = None) -> DownloadReport:
+        """
+        Download images concurrently.
+
+        Parameters:
+            images (Iterable[Cat | CatPic]): Images to download, e.g. the result of Client.get_cat
+             or Client.get_upload_images. Models and records are both accepted.
+            callback (Callable[[DownloadResult], None]): An optional function called after every image.
+
+        Returns:
+            DownloadReport: The result of every image and the throughput of the download.
+        """
+        # Duck typing, so that the records of pymeow.records work as well as the models.
+        if hasattr(images, "image_info") or hasattr(images, "url"):
+            images = [images]
+        os.makedirs(self.directory, exist_ok=True)
+        saved = {os.path.splitext(name)[0] for name in os.listdir(self.directory) if not name.endswith(".part")}
+        report = DownloadReport()
+        started = time.monotonic()
+        queued = set()
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="pymeow-download") as executor:
+            pending = set()
+            for image in images:
+                pic = image.image_info if hasattr(image, "image_info") else image
+                image_id, path = self._target(pic)
+                if image_id in queued:
+                    # Two workers must never append to the same partial file.
+                    self._record(DownloadResult(image_id, pic.url, path, "skipped"), report, callback)
+                    continue
+                queued.add(image_id)
+                if len(pending) >= self.max_workers * 2:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    self._collect(done, report, callback)
+                pending.add(executor.submit(self.download_one, pic, saved))
+            self._collect(pending, report, callback)
+        report.elapsed = time.monotonic() - started
+        return report
+
+    def download_one(self, pic: CatPic, saved: set = None) -> DownloadResult:
+        """
+        Download a single image, resuming a partial download if there is one.
+
+        Parameters:
+            pic (CatPic): The image to download.
+            saved (set): Ids of the images already saved in the directory. The directory is checked if it is omitted.
+
+        Returns:
+            DownloadResult: The result of the download.
+        """
+        image_id, path = self._target(pic)
+        if (image_id in saved) if saved is not None else os.path.exists(path):
+            return DownloadResult(image_id, pic.url, path, "skipped")
+        part_path = path + ".part"
+        offset = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+        headers = {"Range": f"bytes={offset}-"} if offset else {}
+        try:
+            with self.session.get(pic.url, headers=headers, stream=True, timeout=self.timeout) as response:
+                if response.status_code == 416:
+                    if _range_total(response) != offset:
+                        # The partial file does not match the image on the server, start over.
+                        os.remove(part_path)
+                        return self.download_one(pic, saved)
+                    # The partial file is already complete.
+                    os.replace(part_path, path)
+                    return DownloadResult(image_id, pic.url, path, "resumed")
+                response.raise_for_status()
+                resumed = response.status_code == 206
+                written = 0
+                with open(part_path, "ab" if resumed else "wb") as file:
+                    for chunk in response.iter_content(chunk_size=self.chunk_size):
+                        file.write(chunk)
+                        written += len(chunk)
+            os.replace(part_path, path)
+            return DownloadResult(image_id, pic.url, path, "resumed" if resumed else "downloaded", written)
+        except (requests.RequestException, OSError) as exc:
+            return DownloadResult(image_id, pic.url, path, "failed", error=exc)
+
+    def _target(self, pic: CatPic) -> Tuple[str, str]:
+        """
+        Return the id of an image and the path it is saved to.
+        """
+        stem, extension = os.path.splitext(os.path.basename(urlparse(pic.url).path))
+        image_id = pic.id or stem
+        return image_id, os.path.join(self.directory, image_id + (extension or ".jpg"))
+
+    def _collect(self, futures: set, report: DownloadReport,
+                 callback: Optional[Callable[[DownloadResult], None]]) -> None:
+        for future in futures:
+            self._record(future.result(), report, callback)
+
+    @staticmethod
+    def _record(result: DownloadResult, report: DownloadReport,
+                callback: Optional[Callable[[DownloadResult], None]]) -> None:
+        report.results.append(result)
+        report.bytes += result.bytes
+        if callback is not None:
+            callback(result)
+
+    def close(self) -> None:
+        """
+        Close the session of the downloader unless it is shared with a client.
+        """
+        if self._owns_session:
+            self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def __repr__(self):
+        return f"ImageDownloader(directory={self.directory}, max_workers={self.max_workers})"
+
+
+def _range_total(response) -> Optional[int]:
+    """
+    Return the full size of the resource from the Content-Range header of a 416 response, e.g. "bytes */1234".
+    """
+    total = response.headers.get("Content-Range", "").rpartition("/")[2]
+    return int(total) if total.isdigit() else None
@@ -0,0 +1,231 @@
+import bisect
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+#: Upper bounds in seconds of the latency histogram buckets, the last bucket is unbounded.
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.15, 0.25, 0.35, 0.5, 0.75,
+                   1.0, 1.5, 2.5, 5.0, 7.5, 10.0, 30.0, 60.0)
+
+#: Path segments that name an action rather than a resource ID.
+STATIC_SEGMENTS = frozenset({"search", "upload", "facts"})
+
+_VERSION_SEGMENT = re.compile(r"v\d+$")
+
+
+def endpoint_of(url: str) -> str:
+    """
+    A function that turns a request URL into a low-cardinality endpoint label:
+    the API version and the query are dropped and resource IDs are replaced with {id},
+    e.g. https://api.thecatapi.com/v1/votes/123 becomes votes/{id}.
+    """
+    segments = [segment for segment in urlsplit(url).path.split("/") if segment]
+    if segments and _VERSION_SEGMENT.match(segments[0]):
+        segments = segments[1:]
+    if not segments:
+        return "/"
+    return "/".join([segments[0]] + [segment if segment in STATIC_SEGMENTS else "{id}" for segment in segments[1:]])
+
+
+@dataclass
+class RequestInfo:
+    """
+    A request attempt seen by the hooks. before_request may change the headers, which are sent as is.
+    status, bytes_in, elapsed, error and retried are filled in before after_request is called.
+    bytes_in is the decompressed size of the body. The body of the streamed responses of the stream_* methods
+    is read after after_request is called: bytes_in is 0 there and elapsed ends with the headers, and bytes_in
+    is filled in before after_body is called.
+    """
+    method: str
+    url: str
+    headers: dict
+    attempt: int = 0
+    bytes_out: int = 0
+    started: float = field(default_factory=time.perf_counter)
+    status: Optional[int] = None
+    bytes_in: int = 0
+    elapsed: float = 0.0
+    error: Optional[Exception] = None
+    retried: bool = False
+
+    @property
+    def endpoint(self) -> str:
+        return endpoint_of(self.url)
+
+    @property
+    def failed(self) -> bool:
+        return self.error is not None or (self.status is not None and self.status >= 400)
+
+    def finish(self, status: int = None, bytes_in: int = 0, bytes_out: int = None, error: Exception = None,
+               retried: bool = False) -> None:
+        self.elapsed = time.perf_counter() - self.started
+        self.status = status
+        self.bytes_in = bytes_in
+        if bytes_out is not None:
+            self.bytes_out = bytes_out
+        self.error = error
+        self.retried = retried
+
+
+class RequestHook:
+    """
+    The base class of the hooks passed to a client. before_request and after_request are called for every
+    attempt of every request, including the attempts that are retried, from the thread that sends the request.
+    after_body is only called for the streamed responses, once their body is read or the stream is closed.
+    """
+
+    def before_request(self, info: RequestInfo) -> None:
+        pass
+
+    def after_request(self, info: RequestInfo) -> None:
+        pass
+
+    def after_body(self, info: RequestInfo) -> None:
+        pass
+
+
+class Histogram:
+    def __init__(self, buckets: Tuple[float, ...] = LATENCY_BUCKETS) -> None:
+        """
+        A fixed-bucket histogram. It takes constant memory, and percentiles are interpolated within a bucket.
+
+        :param buckets: The sorted upper bounds of the buckets.
+        """
+        self.buckets = buckets
+        self.counts: List[int] = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        if value > self.max:
+            self.max = value
+
+    def percentile(self, q: float) -> float:
+        """
+        Estimate the value below which a fraction q of the observations fall, e.g. 0.95 for p95.
+        """
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        cumulative = 0
+        for index, count in enumerate(self.counts):
+            if count and cumulative + count >= rank:
+                lower = self.buckets[index - 1] if index else 0.0
+                upper = self.buckets[index] if index < len(self.buckets) else self.max
+                return min(lower + (upper - lower) * (rank - cumulative) / count, self.max)
+            cumulative += count
+        return self.max
+
+    @property
+    def mean(self) -> float:
+        return self.sum / self.count if self.count else 0.0
+
+
+class EndpointStats:
+    __slots__ = ("latency", "bytes_in", "bytes_out", "errors", "retries")
+
+    def __init__(self) -> None:
+        self.latency = Histogram()
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.errors: Dict[str, int] = {}
+        self.retries = 0
+
+
+class RequestMetrics(RequestHook):
+    def __init__(self) -> None:
+        """
+        A hook that keeps per-endpoint latency histograms, bytes received and sent, errors by status
+        (or by exception name for connection errors) and retries.
+        Endpoints are labeled by method and endpoint_of the URL, e.g. "GET images/search".
+        """
+        self._endpoints: Dict[Tuple[str, str], EndpointStats] = {}
+        self._lock = threading.Lock()
+
+    def after_request(self, info: RequestInfo) -> None:
+        key = (info.method.upper(), info.endpoint)
+        with self._lock:
+            stats = self._endpoints.get(key)
+            if stats is None:
+                stats = self._endpoints[key] = EndpointStats()
+            stats.latency.observe(info.elapsed)
+            stats.bytes_in += info.bytes_in
+            stats.bytes_out += info.bytes_out
+            if info.failed:
+                status = str(info.status) if info.error is None else type(info.error).__name__
+                stats.errors[status] = stats.errors.get(status, 0) + 1
+            if info.retried:
+                stats.retries += 1
+
+    def after_body(self, info: RequestInfo) -> None:
+        key = (info.method.upper(), info.endpoint)
+        with self._lock:
+            stats = self._endpoints.get(key)
+            if stats is None:
+                stats = self._endpoints[key] = EndpointStats()
+            stats.bytes_in += info.bytes_in
+
+    def stats(self) -> Dict[str, dict]:
+        """
+        Return the metrics of every endpoint, latencies in seconds.
+        """
+        with self._lock:
+            return {f"{method} {endpoint}": {
+                "count": stats.latency.count,
+                "p50": stats.latency.percentile(0.5),
+                "p95": stats.latency.percentile(0.95),
+                "p99": stats.latency.percentile(0.99),
+                "mean": stats.latency.mean,
+                "max": stats.latency.max,
+                "bytes_in": stats.bytes_in,
+                "bytes_out": stats.bytes_out,
+                "errors": dict(stats.errors),
+                "retries": stats.retries,
+            } for (method, endpoint), stats in sorted(self._endpoints.items())}
+
+    def to_prometheus(self, prefix: str = "pymeow") -> str:
+        """
+        Export the metrics in the Prometheus text exposition format.
+        """
+        lines = [
+            f"# HELP {prefix}_request_duration_seconds Duration of the requests to the API.",
+            f"# TYPE {prefix}_request_duration_seconds histogram",
+        ]
+        counters = {"bytes_received": [], "bytes_sent": [], "errors": [], "retries": []}
+        with self._lock:
+            for (method, endpoint), stats in sorted(self._endpoints.items()):
+                labels = f'method="{method}",endpoint="{endpoint}"'
+                histogram = stats.latency
+                cumulative = 0
+                for bound, count in zip(histogram.buckets + (float("inf"),), histogram.counts):
+                    cumulative += count
+                    le = "+Inf" if bound == float("inf") else repr(bound)
+                    lines.append(f'{prefix}_request_duration_seconds_bucket{{{labels},le="{le}"}} {cumulative}')
+                lines.append(f"{prefix}_request_duration_seconds_sum{{{labels}}} {histogram.sum}")
+                lines.append(f"{prefix}_request_duration_seconds_count{{{labels}}} {histogram.count}")
+                counters["bytes_received"].append(f"{{{labels}}} {stats.bytes_in}")
+                counters["bytes_sent"].append(f"{{{labels}}} {stats.bytes_out}")
+                counters["errors"].extend(f'{{{labels},status="{status}"}} {count}'
+                                          for status, count in sorted(stats.errors.items()))
+                counters["retries"].append(f"{{{labels}}} {stats.retries}")
+        descriptions = {"bytes_received": "Bytes of the response bodies.", "bytes_sent": "Bytes of the request bodies.",
+                        "errors": "Failed requests by status.", "retries": "Requests that were retried."}
+        for name, samples in counters.items():
+            lines.append(f"# HELP {prefix}_request_{name}_total {descriptions[name]}")
+            lines.append(f"# TYPE {prefix}_request_{name}_total counter")
+            lines.extend(f"{prefix}_request_{name}_total{sample}" for sample in samples)
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        with self._lock:
+            self._endpoints.clear()
+
+    def __repr__(self):
+        return f"RequestMetrics(endpoints={len(self._endpoints)})"
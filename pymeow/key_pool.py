@@ -0,0 +1,198 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional
+
+from pymeow.exceptions import RequestException
+from pymeow.scheduler import TokenBucket, parse_retry_after
+
+
+@dataclass
+class KeyStats:
+    requests: int = 0
+    throttled: int = 0
+    auth_errors: int = 0
+    errors: int = 0
+
+
+class _Key:
+    __slots__ = ("key", "bucket", "quota_used", "quota_reset", "benched_until", "disabled", "in_flight", "stats")
+
+    def __init__(self, key: str, bucket: Optional[TokenBucket]) -> None:
+        self.key = key
+        self.bucket = bucket
+        self.quota_used = 0
+        self.quota_reset = 0.0
+        self.benched_until = 0.0
+        self.disabled = False
+        self.in_flight = 0
+        self.stats = KeyStats()
+
+
+def mask(key: str) -> str:
+    """
+    A function that hides all but the last 4 characters of an API key, for logs and metrics.
+    """
+    return "*" * max(len(key) - 4, 0) + key[-4:]
+
+
+class KeyPool:
+    def __init__(self, keys: Iterable[str], rate: float = None, burst: float = None, quota: int = None,
+                 quota_period: float = 24 * 60 * 60, bench_time: float = 60.0, max_owners: int = 100_000) -> None:
+        """
+        A pool of API keys for a Client, passed instead of a single key: Client(api_key=KeyPool([...])).
+        Every request takes the key with the fewest requests in flight among the keys within their budget.
+        A key answered with 429 is benched for the Retry-After delay (or bench_time), and a key answered
+        with 401 is taken out of rotation for good.
+        Requests for the data of an account (votes, uploads) are pinned instead: a sub_id always maps to the
+        same key, and a vote or an image created with a key is deleted with that key.
+
+        :param keys: The API keys.
+        :param rate: The maximum number of requests per second of every key (default is no limit).
+        :param burst: The maximum number of requests a key sends at once after an idle period.
+        :param quota: The maximum number of requests of every key per quota_period (default is no limit).
+        :param quota_period: The length in seconds of the quota window (default is a day).
+        :param bench_time: How long in seconds a throttled key stays out of rotation without a Retry-After header.
+        :param max_owners: The number of created resources whose key is remembered.
+        """
+        self._keys: List[_Key] = [_Key(key, TokenBucket(rate, burst) if rate else None) for key in dict.fromkeys(keys)]
+        if not self._keys:
+            raise ValueError("KeyPool needs at least one API key")
+        self.quota = quota
+        self.quota_period = quota_period
+        self.bench_time = bench_time
+        self.max_owners = max_owners
+        self._by_key = {state.key: state for state in self._keys}
+        self._owners: "OrderedDict[str, str]" = OrderedDict()
+        self._next = 0
+        self._condition = threading.Condition()
+
+    def acquire(self, pin: str = None, timeout: float = None) -> str:
+        """
+        Wait for a key that is within its rate and quota budget and take it.
+
+        Parameters:
+            pin (str): Requests with the same pin always use the same key, e.g. "sub_id:user-1". A pin
+             registered with remember maps to the key given there.
+            timeout (float): The maximum time in seconds to wait (default is no limit).
+
+        Returns:
+            str: The key. Pass it to release once the response is received.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            while True:
+                now = time.monotonic()
+                candidates = [self._pinned(pin)] if pin is not None else [k for k in self._keys if not k.disabled]
+                if not candidates:
+                    raise RequestException("Every API key of the pool was rejected")
+                ready_at = {state.key: self._ready_at(state, now) for state in candidates}
+                ready = [state for state in candidates if ready_at[state.key] <= now]
+                if ready:
+                    # Fewest requests in flight first, then round robin among equals.
+                    start = self._next
+                    state = min(ready, key=lambda s: (s.in_flight, (self._keys.index(s) - start) % len(self._keys)))
+                    self._next = (self._keys.index(state) + 1) % len(self._keys)
+                    self._take(state, now)
+                    return state.key
+                wait = min(ready_at.values()) - now
+                if deadline is not None:
+                    if deadline <= now:
+                        raise TimeoutError("No API key became available in time")
+                    wait = min(wait, deadline - now)
+                self._condition.wait(wait)
+
+    def release(self, key: str, response=None, error: Exception = None) -> bool:
+        """
+        Give a key back with the outcome of its request.
+
+        Returns:
+            bool: True if the key was taken out of rotation, so the request can be sent again with another key.
+        """
+        with self._condition:
+            state = self._by_key[key]
+            state.in_flight -= 1
+            self._condition.notify_all()
+            if response is None:
+                if error is not None:
+                    state.stats.errors += 1
+                return False
+            status = response.status_code
+            if status == 401:
+                state.stats.auth_errors += 1
+                state.disabled = True
+                return True
+            if status == 429:
+                state.stats.throttled += 1
+                delay = parse_retry_after(response.headers.get("Retry-After"))
+                state.benched_until = time.monotonic() + (self.bench_time if delay is None else delay)
+                return True
+            if response.headers.get("X-RateLimit-Remaining") == "0":
+                delay = parse_retry_after(response.headers.get("X-RateLimit-Reset"))
+                if delay is not None and delay > 10 ** 9:
+                    # The reset time is a Unix timestamp rather than a number of seconds.
+                    delay = max(delay - time.time(), 0.0)
+                state.benched_until = time.monotonic() + (self.bench_time if delay is None else delay)
+            return False
+
+    def remember(self, resource: str, key: str) -> None:
+        """
+        Pin a resource to the key that created it, e.g. remember("votes/123", key),
+        so that acquire(pin="votes/123") returns that key.
+        """
+        with self._condition:
+            self._owners[resource] = key
+            self._owners.move_to_end(resource)
+            while len(self._owners) > self.max_owners:
+                self._owners.popitem(last=False)
+
+    def stats(self) -> Dict[str, dict]:
+        """
+        Return the counters and the state of every key, by masked key.
+        """
+        with self._condition:
+            now = time.monotonic()
+            return {mask(state.key): {
+                **vars(state.stats),
+                "in_flight": state.in_flight,
+                "quota_used": state.quota_used,
+                "benched_for": max(state.benched_until - now, 0.0),
+                "disabled": state.disabled,
+            } for state in self._keys}
+
+    def _pinned(self, pin: str) -> _Key:
+        owner = self._owners.get(pin)
+        if owner is not None and not self._by_key[owner].disabled:
+            return self._by_key[owner]
+        # Rendezvous hashing: the mapping only changes for the pins of a key that is disabled.
+        usable = [state for state in self._keys if not state.disabled]
+        if not usable:
+            raise RequestException("Every API key of the pool was rejected")
+        return max(usable, key=lambda state: hashlib.blake2b(f"{pin}\0{state.key}".encode(), digest_size=8).digest())
+
+    def _ready_at(self, state: _Key, now: float) -> float:
+        ready_at = state.benched_until
+        if self.quota is not None and state.quota_used >= self.quota and now < state.quota_reset:
+            ready_at = max(ready_at, state.quota_reset)
+        if state.bucket is not None:
+            ready_at = max(ready_at, now + state.bucket.delay(now))
+        return ready_at
+
+    def _take(self, state: _Key, now: float) -> None:
+        if self.quota is not None:
+            if now >= state.quota_reset:
+                state.quota_used = 0
+                state.quota_reset = now + self.quota_period
+            state.quota_used += 1
+        if state.bucket is not None:
+            state.bucket.consume()
+        state.in_flight += 1
+        state.stats.requests += 1
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __repr__(self):
+        return f"KeyPool(keys={[mask(state.key) for state in self._keys]})"
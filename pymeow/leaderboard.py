@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import heapq
+import itertools
+import threading
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from pymeow.models import UserVote
+
+
+class Score:
+    __slots__ = ("score", "count")
+
+    def __init__(self, score: int = 0, count: int = 0) -> None:
+        self.score = score
+        self.count = count
+
+    @property
+    def mean(self) -> float:
+        return self.score / self.count if self.count else 0.0
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, Score) and (self.score, self.count) == (other.score, other.count)
+
+    def __repr__(self):
+        return f"Score(score={self.score}, count={self.count}, mean={self.mean:.2f})"
+
+
+class VoteLeaderboard:
+    def __init__(self, client=None) -> None:
+        """
+        An incremental aggregator of votes. It keeps the score (sum of values), count and mean of votes
+        per image and per sub_id, and a heap of images by score, so that new and deleted votes are applied
+        as deltas and the top images are found without rescanning all votes.
+
+        :param client: The Client used by load, vote and delete_vote.
+        """
+        self.client = client
+        self._images: Dict[str, Score] = {}
+        self._users: Dict[str, Score] = {}
+        self._votes: Dict[int, Tuple[str, str, int]] = {}
+        self._versions: Dict[str, int] = {}
+        self._heap: List[Tuple[int, int, str, int]] = []
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+
+    def load(self, sub_id: str = None, prefetch: int = 1) -> int:
+        """
+        Consume the history of votes once, page by page.
+
+        Parameters:
+            sub_id (str): Only load the votes of this sub_id (default is all votes).
+            prefetch (int): The maximum number of pages downloaded ahead, see Client.iter_votes.
+
+        Returns:
+            int: The number of votes applied.
+        """
+        return self.apply_many(self.client.iter_votes(sub_id=sub_id, prefetch=prefetch))
+
+    def vote(self, image_id: str, sub_id: str, value: int) -> UserVote:
+        """
+        Send a vote with the client and apply it.
+        """
+        vote = self.client.vote(image_id, sub_id, value)
+        if vote.image_id is None:
+            vote = vote.model_copy(update={"image_id": image_id, "sub_id": sub_id, "value": value})
+        self.apply(vote)
+        return vote
+
+    def delete_vote(self, vote_id: int | str) -> dict:
+        """
+        Delete a vote with the client and remove it from the scores.
+        """
+        result = self.client.delete_vote(vote_id)
+        self.remove(vote_id)
+        return result
+
+    def apply(self, vote: UserVote) -> bool:
+        """
+        Add a vote to the scores. Votes already applied are ignored.
+
+        Returns:
+            bool: True if the vote was applied.
+        """
+        with self._lock:
+            return self._apply(vote)
+
+    def apply_many(self, votes: Iterable[UserVote]) -> int:
+        applied = 0
+        for vote in votes:
+            applied += self.apply(vote)
+        return applied
+
+    def remove(self, vote_id: int | str) -> bool:
+        """
+        Remove a vote applied before from the scores.
+
+        Returns:
+            bool: True if the vote was known and removed.
+        """
+        with self._lock:
+            known = self._votes.pop(int(vote_id), None)
+            if known is None:
+                return False
+            image_id, sub_id, value = known
+            self._update(image_id, sub_id, -value, -1)
+            return True
+
+    def image(self, image_id: str) -> Score:
+        with self._lock:
+            score = self._images.get(image_id)
+            return Score(score.score, score.count) if score else Score()
+
+    def user(self, sub_id: str) -> Score:
+        with self._lock:
+            score = self._users.get(sub_id)
+            return Score(score.score, score.count) if score else Score()
+
+    def top_images(self, k: int = 10) -> List[Tuple[str, Score]]:
+        """
+        Return the k images with the highest score, ties broken by the number of votes.
+        """
+        with self._lock:
+            top, popped = [], []
+            while self._heap and len(top) < k:
+                entry = heapq.heappop(self._heap)
+                image_id, version = entry[2], entry[3]
+                if self._versions.get(image_id) != version:
+                    # The entry is stale: the image was voted on after it was pushed.
+                    continue
+                popped.append(entry)
+                score = self._images[image_id]
+                top.append((image_id, Score(score.score, score.count)))
+            for entry in popped:
+                heapq.heappush(self._heap, entry)
+            return top
+
+    def _apply(self, vote: UserVote) -> bool:
+        if vote.image_id is None or vote.value is None:
+            return False
+        if vote.id is not None:
+            if vote.id in self._votes:
+                return False
+            self._votes[vote.id] = (vote.image_id, vote.sub_id, vote.value)
+        self._update(vote.image_id, vote.sub_id, vote.value, 1)
+        return True
+
+    def _update(self, image_id: str, sub_id: Optional[str], value: int, count: int) -> None:
+        score = self._images.setdefault(image_id, Score())
+        score.score += value
+        score.count += count
+        if sub_id is not None:
+            user = self._users.setdefault(sub_id, Score())
+            user.score += value
+            user.count += count
+            if not user.count:
+                del self._users[sub_id]
+        if score.count:
+            version = self._versions[image_id] = next(self._counter)
+            heapq.heappush(self._heap, (-score.score, -score.count, image_id, version))
+        else:
+            del self._images[image_id]
+            self._versions.pop(image_id, None)
+        if len(self._heap) > 2 * len(self._images) + 64:
+            self._compact()
+
+    def _compact(self) -> None:
+        self._heap = [(-score.score, -score.count, image_id, self._versions[image_id])
+                      for image_id, score in self._images.items()]
+        heapq.heapify(self._heap)
+
+    def __len__(self) -> int:
+        return len(self._images)
+
+    def __repr__(self):
+        return f"VoteLeaderboard(images={len(self._images)}, users={len(self._users)}, votes={len(self._votes)})"
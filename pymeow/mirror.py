@@ -0,0 +1,272 @@
+import importlib
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional
+
+#: The CatPic fields stored in the mirror, in column order.
+COLUMNS = ("id", "url", "width", "height", "sub_id", "breed_ids", "created_at", "original_filename")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS images (
+    id TEXT PRIMARY KEY, url TEXT, width INTEGER, height INTEGER, sub_id TEXT, breed_ids TEXT,
+    created_at TEXT, original_filename TEXT, synced_at REAL
+);
+CREATE INDEX IF NOT EXISTS images_sub_id ON images (sub_id);
+CREATE INDEX IF NOT EXISTS images_breed_ids ON images (breed_ids);
+CREATE INDEX IF NOT EXISTS images_created_at ON images (created_at);
+CREATE TABLE IF NOT EXISTS image_breeds (
+    image_id TEXT REFERENCES images (id) ON DELETE CASCADE, breed_id TEXT, PRIMARY KEY (breed_id, image_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS sync_state (key TEXT PRIMARY KEY, value TEXT);
+"""
+
+
+@dataclass
+class SyncReport:
+    fetched: int = 0
+    inserted: int = 0
+    updated: int = 0
+    deleted: int = 0
+    checkpoint: Optional[str] = None
+    elapsed: float = 0.0
+
+
+class UploadMirror:
+    def __init__(self, path: str, client=None, page_size: int = 100) -> None:
+        """
+        A local SQLite copy of the images uploaded to the account, indexed by sub_id, breed and created_at.
+        sync downloads only the images uploaded since the last run, check_deletions removes
+        the images deleted from the account, and query answers from the local copy without the API.
+
+        :param path: Path to the SQLite database file.
+        :param client: The Client used by sync and check_deletions.
+        :param page_size: The number of images requested per page.
+        """
+        self.path = path
+        self.client = client
+        self.page_size = page_size
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute("PRAGMA foreign_keys = ON")
+        with self._connection:
+            self._connection.executescript(_SCHEMA)
+
+    @property
+    def checkpoint(self) -> Optional[str]:
+        """
+        The created_at of the newest image synced so far.
+        """
+        return self._get_state("checkpoint")
+
+    def sync(self, prefetch: int = 1) -> SyncReport:
+        """
+        Download the images uploaded since the last checkpoint, newest first, and store them.
+        The first sync downloads everything. Images with the same created_at as the checkpoint are
+        fetched again, so uploads made in the same second as the previous sync are not missed.
+
+        Parameters:
+            prefetch (int): The maximum number of pages downloaded ahead, see Client.iter_upload_images.
+
+        Returns:
+            SyncReport: The number of images fetched, inserted and updated and the new checkpoint.
+        """
+        started = time.perf_counter()
+        checkpoint = self.checkpoint
+        report = SyncReport(checkpoint=checkpoint)
+        images = self.client.iter_upload_images(limit=self.page_size, order="DESC", prefetch=prefetch)
+        if checkpoint is not None:
+            images = _until(images, checkpoint)
+        for batch in _batches(images, self.page_size):
+            report.fetched += len(batch)
+            inserted = self._store(batch)
+            report.inserted += inserted
+            report.updated += len(batch) - inserted
+            newest = max((image.created_at for image in batch if image.created_at), default=None)
+            if newest is not None and (report.checkpoint is None or newest > report.checkpoint):
+                report.checkpoint = newest
+        if report.checkpoint != checkpoint:
+            self._set_state("checkpoint", report.checkpoint)
+        report.elapsed = time.perf_counter() - started
+        return report
+
+    def check_deletions(self, pages: int = None) -> SyncReport:
+        """
+        Compare a window of pages of the account with the local copy and delete the images missing from
+        the account. Every call continues where the previous one stopped and wraps around at the end,
+        so a few pages per run cover the whole account over time. Only the images between the newest and
+        the oldest created_at of the window are compared, since pages shift as images are uploaded or deleted.
+        A window starts with the last page of the previous one, so that the images between two windows are
+        compared as well when deletions shift the pages up in the meantime.
+
+        Parameters:
+            pages (int): The number of pages to compare (default is all of them).
+
+        Returns:
+            SyncReport: The number of images fetched and deleted.
+        """
+        started = time.perf_counter()
+        report = SyncReport(checkpoint=self.checkpoint)
+        start_page = int(self._get_state("deletion_cursor") or 0) if pages is not None else 0
+        # The oldest created_at of the previous window: the images up to it were not compared yet.
+        bound = self._get_state("deletion_bound") if start_page else None
+        overlap = 1 if start_page else 0
+        remote = {}
+        for image in self.client.iter_upload_images(limit=self.page_size, order="DESC", page=start_page - overlap,
+                                                    max_pages=None if pages is None else pages + overlap,
+                                                    prefetch=0):
+            report.fetched += 1
+            remote[image.id] = image.created_at
+        # The end of the account is a short page, counted with duplicates: an upload during the scan pushes
+        # an image to the next page as well, which must not be taken for the end.
+        reached_end = pages is None or report.fetched < (pages + overlap) * self.page_size
+        dates = [created_at for created_at in remote.values() if created_at]
+        oldest = min(dates) if dates and not reached_end else None
+        self._set_state("deletion_cursor", str(0 if reached_end else start_page + pages))
+        self._set_state("deletion_bound", oldest)
+        if not dates and (start_page or not reached_end):
+            # The window is past the end of the account, or cannot be placed among the local images without
+            # dates: comparing it to the whole table would delete everything outside of it.
+            report.elapsed = time.perf_counter() - started
+            return report
+        newest = max(dates) if start_page else None
+        conditions, params = [], []
+        if newest is not None and bound is not None and newest > bound:
+            # The window reaches back over the previous one, so nothing was left out between them.
+            conditions.append("created_at <= ?")
+            params.append(bound)
+        elif newest is not None:
+            # Deletions shifted the pages up by more than the overlap: the images between the two windows
+            # may still exist, they are compared in a later pass over the account.
+            conditions.append("created_at < ?")
+            params.append(newest)
+        if oldest is not None:
+            conditions.append("created_at > ?")
+            params.append(oldest)
+        where = " WHERE " + " AND ".join(conditions) if conditions else ""
+        with self._lock:
+            local = [row[0] for row in self._connection.execute(f"SELECT id FROM images{where}", params)]
+            deleted = [(image_id,) for image_id in local if image_id not in remote]
+            with self._connection:
+                self._connection.executemany("DELETE FROM images WHERE id = ?", deleted)
+        report.deleted = len(deleted)
+        report.elapsed = time.perf_counter() - started
+        return report
+
+    def query(self, sub_id: str = None, breed_id: str = None, since: str = None, until: str = None,
+              limit: int = None, order: str = "DESC") -> list:
+        """
+        Return the stored images matching all the given filters. The API is not called.
+
+        Parameters:
+            sub_id (str): Only images uploaded with this sub_id.
+            breed_id (str): Only images tagged with this breed.
+            since (str): Only images created at or after this ISO 8601 time, e.g. "2024-01-01".
+            until (str): Only images created before this ISO 8601 time.
+            limit (int): The maximum number of images to return (default is all of them).
+            order (str): "DESC" for the newest images first, "ASC" for the oldest first.
+
+        Returns:
+            list[CatPic]: The images, as the models of the client (records if it is in records mode).
+        """
+        where, params = self._where(sub_id, breed_id, since, until)
+        sql = f"SELECT {', '.join(COLUMNS)} FROM images{where} ORDER BY created_at {_order(order)}, id"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            rows = self._connection.execute(sql, params).fetchall()
+        models = self.client.models if self.client is not None else importlib.import_module("pymeow.models")
+        return [models.CatPic(**dict(zip(COLUMNS, row))) for row in rows]
+
+    def count(self, sub_id: str = None, breed_id: str = None, since: str = None, until: str = None) -> int:
+        """
+        Return the number of stored images matching the filters, see query.
+        """
+        where, params = self._where(sub_id, breed_id, since, until)
+        with self._lock:
+            return self._connection.execute(f"SELECT COUNT(*) FROM images{where}", params).fetchone()[0]
+
+    def _where(self, sub_id: str, breed_id: str, since: str, until: str) -> tuple:
+        conditions, params = [], []
+        if sub_id is not None:
+            conditions.append("sub_id = ?")
+            params.append(sub_id)
+        if breed_id is not None:
+            conditions.append("id IN (SELECT image_id FROM image_breeds WHERE breed_id = ?)")
+            params.append(breed_id)
+        if since is not None:
+            conditions.append("created_at >= ?")
+            params.append(since)
+        if until is not None:
+            conditions.append("created_at < ?")
+            params.append(until)
+        return (" WHERE " + " AND ".join(conditions) if conditions else ""), params
+
+    def _store(self, images: List) -> int:
+        """
+        Insert or update a batch of images and return the number of new ones.
+        """
+        now = time.time()
+        rows = [tuple(getattr(image, column) for column in COLUMNS) + (now,) for image in images]
+        ids = [row[0] for row in rows]
+        breeds = [(image.id, breed_id.strip()) for image in images if image.breed_ids
+                  for breed_id in image.breed_ids.split(",") if breed_id.strip()]
+        with self._lock, self._connection:
+            existing = self._connection.execute(f"SELECT COUNT(*) FROM images WHERE id IN "
+                                                f"({', '.join('?' * len(ids))})", ids).fetchone()[0]
+            self._connection.executemany(
+                f"INSERT INTO images ({', '.join(COLUMNS)}, synced_at) VALUES ({', '.join('?' * (len(COLUMNS) + 1))}) "
+                f"ON CONFLICT (id) DO UPDATE SET {', '.join(f'{c} = excluded.{c}' for c in COLUMNS[1:])}, "
+                f"synced_at = excluded.synced_at", rows)
+            self._connection.executemany("DELETE FROM image_breeds WHERE image_id = ?", [(i,) for i in ids])
+            self._connection.executemany("INSERT OR IGNORE INTO image_breeds VALUES (?, ?)", breeds)
+        return len(ids) - existing
+
+    def _get_state(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._connection.execute("SELECT value FROM sync_state WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_state(self, key: str, value: Optional[str]) -> None:
+        with self._lock, self._connection:
+            self._connection.execute("INSERT OR REPLACE INTO sync_state VALUES (?, ?)", (key, value))
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self.count()
+
+    def __repr__(self):
+        return f"UploadMirror(path={self.path!r}, images={len(self)}, checkpoint={self.checkpoint!r})"
+
+
+def _until(images: Iterable, checkpoint: str) -> Iterator:
+    """
+    Yield images, newest first, until one is older than the checkpoint.
+    """
+    for image in images:
+        if image.created_at is not None and image.created_at < checkpoint:
+            return
+        yield image
+
+
+def _batches(items: Iterable, size: int) -> Iterator[list]:
+    iterator = iter(items)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def _order(order: str) -> str:
+    if order.upper() not in ("ASC", "DESC"):
+        raise ValueError(f"order must be ASC or DESC, not {order!r}")
+    return order.upper()
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr
 from typing import Optional, Union
 
 
@@ -59,6 +59,26 @@ class Cat(BaseModel):
     breed_info: Union[list[Breed], Breed] = None
 
 
+class LazyCat(Cat):
+    """
+    A Cat whose breed_info is built from the raw JSON the first time it is accessed.
+    """
+    _raw_breeds: Optional[list] = PrivateAttr(default=None)
+    _validate_breeds: bool = PrivateAttr(default=True)
+
+    def __getattribute__(self, item):
+        # pydantic reads the fields through __dict__, so materializing it there covers dumps, copies and comparisons.
+        if item == "breed_info" or item == "__dict__":
+            values = object.__getattribute__(self, "__dict__")
+            if "breed_info" not in values:
+                from pymeow.utils import convert_breed_info
+                private = object.__getattribute__(self, "__pydantic_private__")
+                raw_breeds = private["_raw_breeds"]
+                values["breed_info"] = (None if raw_breeds is None
+                                        else convert_breed_info(raw_breeds, validate=private["_validate_breeds"]))
+        return super().__getattribute__(item)
+
+
 class UserVote(BaseModel):
     id: Optional[int] = None
     image_id: Optional[str] = None
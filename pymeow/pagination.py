@@ -0,0 +1,85 @@
+import contextvars
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, Awaitable, Callable, Iterator, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+def iter_pages(fetch_page: Callable[[int], List[T]], start_page: int = 0, prefetch: int = 1,
+               max_pages: Optional[int] = None) -> Iterator[T]:
+    """
+    A generator that walks through paginated results and yields items one at a time.
+    While the caller works through the current page, the next pages are downloaded in background threads.
+
+    Parameters:
+        fetch_page (Callable[[int], List]): A function that returns the items of the given page.
+        start_page (int): The first page to fetch (default is 0).
+        prefetch (int): The maximum number of pages downloaded ahead of the current one (default is 1).
+         0 disables the background download.
+        max_pages (int): The maximum number of pages to fetch (default is no limit).
+
+    Returns:
+        Iterator: Items of all pages. Iteration stops on the first empty page.
+    """
+    if prefetch < 0:
+        raise ValueError("prefetch must be greater than or equal to 0")
+    last_page = None if max_pages is None else start_page + max_pages
+    executor = ThreadPoolExecutor(max_workers=max(prefetch, 1), thread_name_prefix="pymeow-prefetch")
+    pending = deque()
+    next_page = start_page
+    try:
+        while True:
+            while len(pending) <= prefetch and (last_page is None or next_page < last_page):
+                # The context is copied so that the pages inherit the request priority of the caller.
+                pending.append(executor.submit(contextvars.copy_context().run, fetch_page, next_page))
+                next_page += 1
+            if not pending:
+                return
+            items = pending.popleft().result()
+            if not items:
+                return
+            yield from items
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+async def aiter_pages(fetch_page: Callable[[int], Awaitable[List[T]]], start_page: int = 0, prefetch: int = 1,
+                      max_pages: Optional[int] = None) -> AsyncIterator[T]:
+    """
+    An asynchronous version of iter_pages. The next pages are downloaded by tasks on the running event loop.
+
+    Parameters:
+        fetch_page (Callable[[int], Awaitable[List]]): A coroutine function that returns the items of the given page.
+        start_page (int): The first page to fetch (default is 0).
+        prefetch (int): The maximum number of pages downloaded ahead of the current one (default is 1).
+        max_pages (int): The maximum number of pages to fetch (default is no limit).
+
+    Returns:
+        AsyncIterator: Items of all pages. Iteration stops on the first empty page.
+    """
+    # asyncio takes tens of milliseconds to import, only the async callers pay for it.
+    import asyncio
+
+    if prefetch < 0:
+        raise ValueError("prefetch must be greater than or equal to 0")
+    last_page = None if max_pages is None else start_page + max_pages
+    pending = deque()
+    next_page = start_page
+    try:
+        while True:
+            while len(pending) <= prefetch and (last_page is None or next_page < last_page):
+                pending.append(asyncio.ensure_future(fetch_page(next_page)))
+                next_page += 1
+            if not pending:
+                return
+            items = await pending.popleft()
+            if not items:
+                return
+            for item in items:
+                yield item
+    finally:
+        for task in pending:
+            task.cancel()
@@ -0,0 +1,231 @@
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Deque, Dict, Optional, Tuple
+
+from pymeow.scheduler import Priority, priority
+
+#: The largest limit of images/search with an API key, and without one.
+MAX_LIMIT = 100
+MAX_LIMIT_WITHOUT_KEY = 10
+
+
+@dataclass
+class PoolStats:
+    hits: int = 0
+    misses: int = 0
+    refills: int = 0
+    batches: int = 0
+    fetched: int = 0
+    expired: int = 0
+    errors: int = 0
+    empty_batches: int = 0
+    served_age_total: float = 0.0
+    served_age_max: float = 0.0
+
+    @property
+    def served(self) -> int:
+        return self.hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        The fraction of get calls served from memory without waiting for the API.
+        """
+        return self.hits / self.served if self.served else 0.0
+
+    @property
+    def mean_age(self) -> float:
+        """
+        The mean time in seconds served cats spent in the pool since they were fetched.
+        """
+        return self.served_age_total / self.served if self.served else 0.0
+
+
+class _Pool:
+    __slots__ = ("items", "refilling", "error", "empty_until", "stats")
+
+    def __init__(self) -> None:
+        self.items: Deque[Tuple[object, float]] = deque()
+        self.refilling = False
+        self.error: Optional[Exception] = None
+        self.empty_until = 0.0
+        self.stats = PoolStats()
+
+
+class RandomCatPool:
+    def __init__(self, client, capacity: int = 200, low_watermark: int = None, batch_size: int = None,
+                 max_age: float = None, max_workers: int = 2, empty_backoff: float = 60.0) -> None:
+        """
+        A buffer of random cats fetched in the background, so get returns right away from memory.
+        Every filter (has_breeds and breed_ids) has its own pool, created on first use. When a pool drops
+        to the low watermark, it is refilled up to capacity with batches of the largest limit the key allows.
+        Refills are sent with the BULK priority, so they wait behind interactive requests
+        when the client has a RequestScheduler.
+
+        :param client: The Client used to fetch the cats.
+        :param capacity: The number of cats a pool holds when it is full (the high watermark).
+        :param low_watermark: The number of cats left that triggers a refill (default is a quarter of capacity).
+        :param batch_size: The limit of every request (default is 100 with an API key, 10 without).
+        :param max_age: Cats older than this in seconds are dropped instead of served (default is no limit).
+        :param max_workers: The maximum number of pools refilled at the same time.
+        :param empty_backoff: How long in seconds a pool waits before asking again after the API returned no cat
+         for its filter, e.g. for unknown breed_ids.
+        """
+        self.client = client
+        self.capacity = capacity
+        self.low_watermark = capacity // 4 if low_watermark is None else low_watermark
+        self.batch_size = batch_size or (MAX_LIMIT if client.api_key else MAX_LIMIT_WITHOUT_KEY)
+        self.max_age = max_age
+        self.empty_backoff = empty_backoff
+        self._pools: Dict[Tuple[bool, Optional[str]], _Pool] = {}
+        self._condition = threading.Condition()
+        self._closed = False
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="pymeow-random-pool")
+
+    def get(self, has_breeds: bool = False, breed_ids: str = None, block: bool = True, timeout: float = None):
+        """
+        Return a random cat. It comes from memory unless the pool is empty, in which case
+        the call waits for the refill.
+
+        Parameters:
+            has_breeds (bool): Whether the cat must have breed information.
+            breed_ids (str): Comma separated breed IDs the cat must be one of.
+            block (bool): Whether to wait for the refill when the pool is empty.
+            timeout (float): The maximum time in seconds to wait.
+
+        Returns:
+            Cat: A random cat, or None if the pool is empty and block is False, the timeout expired or the API
+             returned no cat for the filter less than empty_backoff seconds ago.
+             If the refill failed, its exception is raised instead.
+        """
+        key = (has_breeds, breed_ids)
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("RandomCatPool is closed")
+            pool = self._pool(key)
+            item = self._pop(pool)
+            if item is None:
+                pool.stats.misses += 1
+                self._refill(key, pool)
+                if block:
+                    deadline = None if timeout is None else time.monotonic() + timeout
+                    while item is None and pool.error is None and not self._closed:
+                        if not pool.refilling and time.monotonic() < pool.empty_until:
+                            # The API has no cat for this filter: waiting would not bring any.
+                            break
+                        remaining = None if deadline is None else deadline - time.monotonic()
+                        if remaining is not None and remaining <= 0:
+                            break
+                        self._condition.wait(remaining)
+                        item = self._pop(pool)
+                        if item is None and pool.error is None:
+                            # Other callers took the cats of the last refill.
+                            self._refill(key, pool)
+                if item is None and pool.error is not None:
+                    error, pool.error = pool.error, None
+                    raise error
+            else:
+                pool.stats.hits += 1
+            if item is None:
+                return None
+            if len(pool.items) <= self.low_watermark:
+                self._refill(key, pool)
+            cat, fetched_at = item
+            age = time.monotonic() - fetched_at
+            pool.stats.served_age_total += age
+            pool.stats.served_age_max = max(pool.stats.served_age_max, age)
+            return cat
+
+    def warm(self, has_breeds: bool = False, breed_ids: str = None) -> None:
+        """
+        Start filling the pool of a filter before the first get.
+        """
+        key = (has_breeds, breed_ids)
+        with self._condition:
+            self._refill(key, self._pool(key))
+
+    def stats(self, has_breeds: bool = False, breed_ids: str = None) -> PoolStats:
+        with self._condition:
+            pool = self._pools.get((has_breeds, breed_ids))
+            return PoolStats(**vars(pool.stats)) if pool is not None else PoolStats()
+
+    def size(self, has_breeds: bool = False, breed_ids: str = None) -> int:
+        with self._condition:
+            pool = self._pools.get((has_breeds, breed_ids))
+            return len(pool.items) if pool is not None else 0
+
+    def close(self) -> None:
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._executor.shutdown(wait=True)
+
+    def _pool(self, key: Tuple[bool, Optional[str]]) -> _Pool:
+        pool = self._pools.get(key)
+        if pool is None:
+            pool = self._pools[key] = _Pool()
+        return pool
+
+    def _pop(self, pool: _Pool) -> Optional[Tuple[object, float]]:
+        while pool.items:
+            item = pool.items.popleft()
+            if self.max_age is None or time.monotonic() - item[1] <= self.max_age:
+                return item
+            pool.stats.expired += 1
+        return None
+
+    def _refill(self, key: Tuple[bool, Optional[str]], pool: _Pool) -> None:
+        # Called with the condition held. One refill per pool is in flight at a time.
+        if pool.refilling or self._closed or time.monotonic() < pool.empty_until:
+            return
+        pool.refilling = True
+        pool.error = None
+        pool.stats.refills += 1
+        self._executor.submit(self._fill, key, pool)
+
+    def _fill(self, key: Tuple[bool, Optional[str]], pool: _Pool) -> None:
+        has_breeds, breed_ids = key
+        try:
+            while True:
+                with self._condition:
+                    missing = self.capacity - len(pool.items)
+                    if missing <= 0 or self._closed:
+                        return
+                with priority(Priority.BULK):
+                    cats = self.client.get_cat(limit=min(self.batch_size, missing), has_breeds=has_breeds,
+                                               breed_ids=breed_ids)
+                if not isinstance(cats, list):
+                    cats = [cats]
+                now = time.monotonic()
+                with self._condition:
+                    pool.items.extend((cat, now) for cat in cats)
+                    pool.stats.batches += 1
+                    pool.stats.fetched += len(cats)
+                    if not cats:
+                        pool.stats.empty_batches += 1
+                        pool.empty_until = now + self.empty_backoff
+                    self._condition.notify_all()
+                if not cats:
+                    return
+        except Exception as exc:
+            with self._condition:
+                pool.error = exc
+                pool.stats.errors += 1
+                self._condition.notify_all()
+        finally:
+            with self._condition:
+                pool.refilling = False
+                self._condition.notify_all()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def __repr__(self):
+        return (f"RandomCatPool(capacity={self.capacity}, low_watermark={self.low_watermark}, "
+                f"batch_size={self.batch_size}, pools={len(self._pools)})")
@@ -0,0 +1,95 @@
+from typing import Any, Dict, List, Optional, Union
+
+
+class Record:
+    """
+    A lightweight, unvalidated stand-in for the pydantic models of pymeow.models, with the same fields.
+    Records are returned by a Client created with records=True, which never imports pydantic.
+    Unknown keys are ignored and missing fields are None. Like the models, records are compared by value
+    and are not hashable. The fields are kept in sync with the models by tests/test_records.py.
+    """
+    __slots__ = ()
+
+    def __init__(self, **data) -> None:
+        for name in self.__slots__:
+            setattr(self, name, data.get(name))
+
+    def model_dump(self) -> Dict[str, Any]:
+        """
+        Return the fields as a dictionary, nested records included, like BaseModel.model_dump.
+        """
+        return {name: _dump(getattr(self, name)) for name in self.__slots__}
+
+    def model_copy(self, update: dict = None) -> "Record":
+        """
+        Return a shallow copy with some fields replaced, like BaseModel.model_copy.
+        """
+        values = {name: getattr(self, name) for name in self.__slots__}
+        if update:
+            values.update(update)
+        return type(self)(**values)
+
+    def __eq__(self, other) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+
+def _dump(value: Any) -> Any:
+    if isinstance(value, Record):
+        return value.model_dump()
+    if isinstance(value, list):
+        return [_dump(item) for item in value]
+    return value
+
+
+class CatPic(Record):
+    __slots__ = ("id", "url", "width", "height", "breeds", "sub_id", "created_at", "original_filename", "breed_ids")
+
+
+class Breed(Record):
+    __slots__ = ("weight", "id", "name", "cfa_url", "vetstreet_url", "vcahospitals_url", "temperament", "origin",
+                 "country_codes", "country_code", "description", "life_span", "indoor", "lap", "alt_names",
+                 "adaptability", "affection_level", "child_friendly", "dog_friendly", "energy_level", "grooming",
+                 "health_issues", "intelligence", "shedding_level", "social_needs", "stranger_friendly",
+                 "vocalisation", "experimental", "hairless", "natural", "rare", "rex", "suppressed_tail",
+                 "short_legs", "wikipedia_url", "hypoallergenic", "reference_image_id")
+
+
+class Cat(Record):
+    __slots__ = ("image_info", "breed_info")
+
+
+class UserVote(Record):
+    __slots__ = ("id", "image_id", "sub_id", "value", "created_at", "image")
+
+
+class Fact(Record):
+    __slots__ = ("id", "fact", "breed_id", "title")
+
+
+def convert_json_to_obj(json_data: List[dict]) -> Union[List[Cat], Cat]:
+    """
+    A function that converts a list of dictionaries to Cat records, see utils.convert_json_to_obj.
+
+    Parameters:
+        json_data (List[dict]): A list of dictionaries containing information about the cat images.
+
+    Returns:
+        List[Cat] | Cat: A list of Cat records, or a single Cat if the list contains one image.
+    """
+    cats = [Cat(image_info=CatPic(**dict(cat_info, breeds=None)), breed_info=_breed_info(cat_info.get("breeds")))
+            for cat_info in json_data]
+    return cats[0] if len(cats) == 1 else cats
+
+
+def _breed_info(breeds: Optional[List[dict]]) -> Union[List[Breed], Breed, None]:
+    if breeds is None:
+        return None
+    if len(breeds) == 1:
+        return Breed(**breeds[0])
+    return [Breed(**breed) for breed in breeds]
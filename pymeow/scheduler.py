@@ -0,0 +1,241 @@
+import contextvars
+import heapq
+import itertools
+import random
+import threading
+import time
+from contextlib import contextmanager
+from email.utils import parsedate_to_datetime
+from enum import IntEnum
+from typing import Dict, Iterator, Optional
+
+from requests.models import Response
+
+
+class Priority(IntEnum):
+    """
+    Priority classes of requests. Lower values are sent first.
+    """
+    INTERACTIVE = 0
+    DEFAULT = 1
+    BULK = 2
+
+
+_current_priority = contextvars.ContextVar("pymeow_priority", default=Priority.DEFAULT)
+
+
+@contextmanager
+def priority(level: Priority) -> Iterator[None]:
+    """
+    A context manager that sets the priority of all requests sent inside it, e.g.
+
+        with priority(Priority.BULK):
+            client.get_votes(limit=100)
+    """
+    token = _current_priority.set(level)
+    try:
+        yield
+    finally:
+        _current_priority.reset(token)
+
+
+def current_priority() -> Priority:
+    return _current_priority.get()
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header, given either in seconds or as an HTTP date, into seconds from now.
+    """
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+class TokenBucket:
+    def __init__(self, rate: float, burst: float = None) -> None:
+        """
+        :param rate: The number of tokens added per second.
+        :param burst: The maximum number of tokens in the bucket (default is max(rate, 1)).
+        """
+        self.rate = rate
+        self.burst = burst if burst is not None else max(rate, 1.0)
+        self.tokens = self.burst
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def delay(self, now: float) -> float:
+        """
+        Seconds until a token is available.
+        """
+        self._refill(now)
+        return 0.0 if self.tokens >= 1 else (1 - self.tokens) / self.rate
+
+    def consume(self) -> None:
+        self._refill(time.monotonic())
+        self.tokens -= 1
+
+
+class RequestScheduler:
+    IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+    RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+    def __init__(self, rate: float = None, burst: float = None, max_retries: int = 3,
+                 backoff_base: float = 0.5, backoff_max: float = 30.0, min_rate: float = None,
+                 retry_statuses: frozenset = None, retry_methods: frozenset = None) -> None:
+        """
+        A scheduler that paces requests with a token bucket, serves them by priority and retries
+        throttled or failed idempotent requests with jittered exponential backoff.
+
+        :param rate: The maximum number of requests per second (default is no limit).
+        :param burst: The maximum number of requests sent at once after an idle period.
+        :param max_retries: The maximum number of retries of a request.
+        :param backoff_base: The base delay in seconds of the exponential backoff.
+        :param backoff_max: The maximum delay in seconds between two attempts.
+        :param min_rate: The lowest rate the scheduler slows down to after 429 responses (default is rate / 8).
+        :param retry_statuses: Status codes that are retried (default is 429 and 5xx gateway errors).
+        :param retry_methods: HTTP methods that are retried (default is idempotent methods only).
+        """
+        self.rate = rate
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.min_rate = min_rate if min_rate is not None else (rate / 8 if rate else None)
+        self.retry_statuses = retry_statuses if retry_statuses is not None else self.RETRY_STATUSES
+        self.retry_methods = retry_methods if retry_methods is not None else self.IDEMPOTENT_METHODS
+        self._bucket = TokenBucket(rate, burst) if rate else None
+        self._blocked_until = 0.0
+        self._condition = threading.Condition()
+        self._waiting = []
+        self._counter = itertools.count()
+        self._metrics = {"requests": 0, "retries": 0, "throttled": 0, "max_queue_depth": 0,
+                         "wait_time_total": 0.0, "wait_time_max": 0.0}
+        self._waits_by_priority = {level.name.lower(): [0, 0.0] for level in Priority}
+
+    def acquire(self, level: Priority = None) -> float:
+        """
+        Block until the request may be sent. Requests with a higher priority go first,
+        requests with the same priority are served in order of arrival.
+
+        Returns:
+            float: The time in seconds the request waited.
+        """
+        level = Priority(current_priority() if level is None else level)
+        started = time.monotonic()
+        with self._condition:
+            entry = (int(level), next(self._counter))
+            heapq.heappush(self._waiting, entry)
+            self._metrics["max_queue_depth"] = max(self._metrics["max_queue_depth"], len(self._waiting))
+            self._condition.notify_all()
+            try:
+                while True:
+                    if self._waiting[0] != entry:
+                        self._condition.wait()
+                        continue
+                    delay = self._delay(time.monotonic())
+                    if delay <= 0:
+                        break
+                    self._condition.wait(delay)
+            except BaseException:
+                self._waiting.remove(entry)
+                heapq.heapify(self._waiting)
+                self._condition.notify_all()
+                raise
+            heapq.heappop(self._waiting)
+            if self._bucket is not None:
+                self._bucket.consume()
+            waited = time.monotonic() - started
+            self._metrics["requests"] += 1
+            self._metrics["wait_time_total"] += waited
+            self._metrics["wait_time_max"] = max(self._metrics["wait_time_max"], waited)
+            waits = self._waits_by_priority[level.name.lower()]
+            waits[0] += 1
+            waits[1] += waited
+            self._condition.notify_all()
+        return waited
+
+    def retry_delay(self, method: str, attempt: int, response: Response = None,
+                    error: Exception = None) -> Optional[float]:
+        """
+        Record the outcome of an attempt and decide whether the request should be retried.
+
+        Parameters:
+            method (str): The HTTP method of the request.
+            attempt (int): The number of the attempt, starting from 0.
+            response (Response): The response, if one was received.
+            error (Exception): The connection error, if no response was received.
+
+        Returns:
+            float | None: The delay in seconds before the next attempt, or None if the request should not be retried.
+        """
+        retry_after = None
+        if response is not None:
+            retry_after = self.observe(response)
+            if response.status_code not in self.retry_statuses:
+                return None
+        elif error is None:
+            return None
+        if method.upper() not in self.retry_methods or attempt >= self.max_retries:
+            return None
+        with self._condition:
+            self._metrics["retries"] += 1
+        backoff = random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+        return max(backoff, retry_after or 0.0)
+
+    def observe(self, response: Response) -> Optional[float]:
+        """
+        Adapt the pace of the scheduler to the rate-limit headers of a response.
+
+        Returns:
+            float | None: The delay requested by the server, if any.
+        """
+        headers = response.headers
+        delay = parse_retry_after(headers.get("Retry-After"))
+        if delay is None and headers.get("X-RateLimit-Remaining") == "0":
+            delay = parse_retry_after(headers.get("X-RateLimit-Reset"))
+            if delay is not None and delay > 10 ** 9:
+                # The reset time is a Unix timestamp rather than a number of seconds.
+                delay = max(delay - time.time(), 0.0)
+        with self._condition:
+            if response.status_code == 429:
+                self._metrics["throttled"] += 1
+                if self._bucket is not None:
+                    self._bucket.rate = max(self.min_rate, self._bucket.rate / 2)
+            elif self._bucket is not None and self._bucket.rate < self.rate:
+                self._bucket.rate = min(self.rate, self._bucket.rate + self.rate / 20)
+            if delay:
+                self._blocked_until = max(self._blocked_until, time.monotonic() + delay)
+                self._condition.notify_all()
+        return delay
+
+    def metrics(self) -> Dict[str, float]:
+        """
+        Return the queue depth, the wait times and the retry counters of the scheduler.
+        """
+        with self._condition:
+            metrics = dict(self._metrics)
+            metrics["queue_depth"] = len(self._waiting)
+            metrics["wait_time_mean"] = metrics["wait_time_total"] / metrics["requests"] if metrics["requests"] else 0.0
+            metrics["current_rate"] = self._bucket.rate if self._bucket is not None else None
+            for name, (count, total) in self._waits_by_priority.items():
+                metrics[f"wait_time_mean_{name}"] = total / count if count else 0.0
+        return metrics
+
+    def _delay(self, now: float) -> float:
+        delay = self._blocked_until - now
+        if self._bucket is not None:
+            delay = max(delay, self._bucket.delay(now))
+        return delay
+
+    def __repr__(self):
+        return f"RequestScheduler(rate={self.rate}, max_retries={self.max_retries})"
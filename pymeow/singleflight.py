@@ -0,0 +1,58 @@
+import threading
+from typing import Any, Callable, Dict, Hashable
+
+
+class _Call:
+    __slots__ = ("event", "result", "error", "callers")
+
+    def __init__(self) -> None:
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+        self.callers = 1
+
+
+class SingleFlight:
+    def __init__(self) -> None:
+        """
+        Merges concurrent calls with the same key: the first caller runs the function,
+        the others wait for it and get the same result or exception.
+        """
+        self.stats: Dict[str, int] = {"executed": 0, "shared": 0}
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """
+        Run fn, unless a call with the same key is already in flight, in which case wait for its result.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.stats["executed"] += 1
+            else:
+                call.callers += 1
+                self.stats["shared"] += 1
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    def __repr__(self):
+        return f"SingleFlight(in_flight={len(self)}, stats={self.stats})"
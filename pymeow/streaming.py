@@ -0,0 +1,85 @@
+import codecs
+import json
+from typing import Any, Iterable, Iterator
+
+_WHITESPACE = " \t\r\n"
+#: Characters that may continue a number, e.g. "1." or "1e" cut by the end of a chunk.
+_NUMBER_CONTINUATION = "0123456789.eE+-"
+
+
+def iter_json_array(chunks: Iterable[bytes], encoding: str = "utf-8") -> Iterator[Any]:
+    """
+    A generator that parses a JSON array from chunks of bytes and yields every item as soon as it is complete,
+    so a large response is never held in memory as a whole, neither as text nor as parsed objects.
+
+    Parameters:
+        chunks (Iterable[bytes]): The body, e.g. response.iter_content(chunk_size=65536).
+        encoding (str): The encoding of the body (default is UTF-8).
+
+    Returns:
+        Iterator: The items of the array, decoded like json.loads would.
+         json.JSONDecodeError is raised if the body is not a JSON array.
+    """
+    decoder = json.JSONDecoder()
+    text = codecs.getincrementaldecoder(encoding)()
+    chunks = iter(chunks)
+    buffer, position, finished = "", 0, False
+    # What the parser expects next: "[" to open the array, an item, or "," / "]" after an item.
+    expect = "["
+
+    def fill() -> bool:
+        nonlocal buffer, position, finished
+        if finished:
+            return False
+        chunk = next(chunks, None)
+        if chunk is None:
+            finished = True
+            buffer = buffer[position:] + text.decode(b"", final=True)
+        else:
+            buffer = buffer[position:] + text.decode(chunk)
+        position = 0
+        return True
+
+    while True:
+        while position < len(buffer) and buffer[position] in _WHITESPACE:
+            position += 1
+        if position == len(buffer):
+            if fill():
+                continue
+            raise json.JSONDecodeError("Unexpected end of the JSON array", buffer, position)
+        if expect == "[":
+            if buffer[position] != "[":
+                raise json.JSONDecodeError("Expecting '['", buffer, position)
+            position += 1
+            expect = "item or ]"
+        elif expect == "," and buffer[position] == ",":
+            position += 1
+            expect = "item"
+        elif expect != "item" and buffer[position] == "]":
+            position += 1
+            # Only whitespace may follow the array, like json.loads.
+            while True:
+                while position < len(buffer) and buffer[position] in _WHITESPACE:
+                    position += 1
+                if position < len(buffer):
+                    raise json.JSONDecodeError("Extra data", buffer, position)
+                if not fill():
+                    return
+        elif expect == ",":
+            raise json.JSONDecodeError("Expecting ',' delimiter", buffer, position)
+        else:
+            try:
+                item, end = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                # The item is incomplete, or invalid: decode it again with more data or give up at the end.
+                if fill():
+                    continue
+                raise
+            if end == len(buffer) or (isinstance(item, (int, float)) and buffer[end] in _NUMBER_CONTINUATION):
+                # A number cut by the end of a chunk decodes too, as "1" for "1.5" or "1.5" for "1.5e3":
+                # it is accepted only once a character that cannot continue it is seen, or at the end.
+                if fill():
+                    continue
+            position = end
+            expect = ","
+            yield item
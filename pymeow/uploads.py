@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import io
+import mimetypes
+import os
+import uuid
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Union
+
+import requests
+
+if TYPE_CHECKING:
+    from pymeow.models import CatPic
+
+#: Status codes of failed uploads that are worth retrying.
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+def guess_content_type(file_name: str) -> str:
+    """
+    A function that detects the content type of a file by its name.
+    """
+    return mimetypes.guess_type(file_name)[0] or "application/octet-stream"
+
+
+def iter_image_paths(paths: Union[str, os.PathLike, Iterable[Union[str, os.PathLike]]]) -> Iterator[str]:
+    """
+    A function that expands a directory into the paths of the images it contains, sorted by name.
+    Any other path, or an iterable of paths, is returned as is.
+    """
+    if isinstance(paths, (str, os.PathLike)):
+        if not os.path.isdir(paths):
+            yield os.fspath(paths)
+            return
+        for name in sorted(os.listdir(paths)):
+            path = os.path.join(paths, name)
+            if os.path.isfile(path) and guess_content_type(name).startswith("image/"):
+                yield path
+        return
+    for path in paths:
+        yield os.fspath(path)
+
+
+def is_retryable(error: Exception) -> bool:
+    """
+    A function that checks whether a failed upload can be retried: connection errors,
+    timeouts and throttled or gateway error responses are retryable.
+    """
+    if isinstance(error, (requests.ConnectionError, requests.Timeout)):
+        return True
+    return isinstance(error, requests.RequestException) and bool(error.args) and error.args[0] in RETRY_STATUSES
+
+
+@dataclass
+class UploadResult:
+    path: str
+    image: Optional[CatPic] = None
+    error: Optional[Exception] = None
+    attempts: int = 1
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class MultipartStream:
+    def __init__(self, fields: Dict[str, Optional[str]], file_field: str, file_name: str, file_path: str,
+                 content_type: str = None, chunk_size: int = 64 * 1024) -> None:
+        """
+        A multipart/form-data body that streams the file from disk instead of reading it into memory.
+        It knows its length, so it is sent with a Content-Length header rather than chunked.
+
+        :param fields: Form fields sent before the file. None values are skipped.
+        :param file_field: The name of the file field.
+        :param file_name: The file name sent to the server.
+        :param file_path: Path to the file.
+        :param content_type: The content type of the file (default is detected from the file name).
+        :param chunk_size: The size in bytes of the chunks read when the body is iterated.
+        """
+        self.boundary = uuid.uuid4().hex
+        self.content_type = f"multipart/form-data; boundary={self.boundary}"
+        self.chunk_size = chunk_size
+        quoted_name = file_name.replace('"', "%22")
+        head = b"".join(f'--{self.boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n{value}\r\n'
+                        .encode() for name, value in fields.items() if value is not None)
+        head += (f'--{self.boundary}\r\nContent-Disposition: form-data; name="{file_field}"; '
+                 f'filename="{quoted_name}"\r\nContent-Type: {content_type or guess_content_type(file_name)}'
+                 f'\r\n\r\n').encode()
+        tail = f"\r\n--{self.boundary}--\r\n".encode()
+        self._head, self._tail = head, tail
+        self._file = open(file_path, "rb")
+        self._length = len(head) + os.fstat(self._file.fileno()).st_size + len(tail)
+        self._parts: List = []
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Rewind the body to its start, so that the request can be sent again.
+        """
+        self._file.seek(0)
+        self._parts = [io.BytesIO(self._head), self._file, io.BytesIO(self._tail)]
+
+    def read(self, size: int = -1) -> bytes:
+        chunks = []
+        while self._parts and (size < 0 or size > 0):
+            chunk = self._parts[0].read(size)
+            if not chunk:
+                self._parts.pop(0)
+                continue
+            chunks.append(chunk)
+            if size > 0:
+                size -= len(chunk)
+        return b"".join(chunks)
+
+    def __iter__(self) -> Iterator[bytes]:
+        while True:
+            chunk = self.read(self.chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+    def __len__(self) -> int:
+        return self._length
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
@@ -1,17 +1,66 @@
-from pymeow.models import CatPic, Breed, Cat
-from typing import List, Union
+from __future__ import annotations
 
+import os
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Type, TypeVar, Union
 
-def convert_breed_info(breeds: List[dict]) -> Union[List[Breed], Breed]:
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+    from pymeow.models import CatPic, Breed, Cat
+
+# The models, and pydantic with them, are imported by the functions that build them,
+# so that the helpers of this module can be used without loading pydantic.
+M = TypeVar("M", bound="BaseModel")
+
+
+_MODEL_DEFAULTS = {}
+
+
+def construct_model(model: Type[M], data: dict, **overrides) -> M:
+    """
+    A function that builds a model from trusted data without validation.
+    It does what BaseModel.model_construct does, without its per-field Python loop:
+    the values are merged into a single new dict, so the input is never modified or shared.
+
+    Parameters:
+        model (Type[BaseModel]): The model class.
+        data (dict): Field values, e.g. a JSON object returned by the API. Unknown keys are ignored.
+        **overrides: Field values that replace the ones in data.
+
+    Returns:
+        BaseModel: The model instance.
+    """
+    defaults = _MODEL_DEFAULTS.get(model)
+    if defaults is None:
+        defaults = _MODEL_DEFAULTS[model] = {name: field.get_default(call_default_factory=True)
+                                             for name, field in model.model_fields.items()}
+    if data.keys() <= defaults.keys():
+        values = {**defaults, **data, **overrides}
+    else:
+        values = {**defaults, **{key: value for key, value in data.items() if key in defaults}, **overrides}
+    obj = model.__new__(model)
+    object.__setattr__(obj, "__dict__", values)
+    object.__setattr__(obj, "__pydantic_fields_set__", (data.keys() | overrides.keys()) & defaults.keys())
+    object.__setattr__(obj, "__pydantic_extra__", None)
+    object.__setattr__(obj, "__pydantic_private__", None)
+    return obj
+
+
+def convert_breed_info(breeds: List[dict], validate: bool = True) -> Union[List[Breed], Breed]:
     """
     A function that converts a list of dictionaries to a list of Breed objects.
 
     Parameters:
         breeds (List[dict]): A list of dictionaries containing information about the breed.
+        validate (bool): Whether to validate the data. Pass False for trusted data, e.g. API responses.
 
     Returns:
         List[Breed]: A list of Breed objects containing information about the breed.
     """
+    from pymeow.models import Breed
+    if not validate:
+        if len(breeds) == 1:
+            return construct_model(Breed, breeds[0])
+        return [construct_model(Breed, breed) for breed in breeds]
     if len(breeds) == 1:
         breed_info = {field: breeds[0].get(field, None) for field in Breed.__annotations__}
         return Breed(**breed_info)
@@ -32,36 +81,84 @@ def convert_pic_info(pic_info: dict) -> CatPic:
     Returns:
         CatPic: A CatPic object containing information about the cat image.
     """
+    from pymeow.models import CatPic
     pic_info = {field: pic_info.get(field, None) for field in CatPic.__annotations__}
     return CatPic(**pic_info)
 
 
-def convert_json_to_obj(json_data: dict) -> Union[List[Cat], Cat]:
+def convert_cat(cat_info: dict, validate: bool = True, lazy: bool = False) -> Cat:
     """
-    A function that converts a dictionary to a list of CatPic objects.
+    A function that converts a dictionary to a Cat object. The dictionary is not modified.
 
     Parameters:
-        json_data (dict): A dictionary containing information about the cat images.
+        cat_info (dict): A dictionary containing information about the cat image and its breeds.
+        validate (bool): Whether to validate the data. Pass False for trusted data, e.g. API responses.
+        lazy (bool): Whether to build the breeds only when breed_info is accessed.
 
     Returns:
-        List[CatPic]: A list of CatPic objects containing information about the cat images.
+        Cat: A Cat object, or a LazyCat if lazy is True.
     """
-    if len(json_data) == 1:
-        json_data = json_data[0]
-        if 'breeds' in json_data:
-            breed_info = convert_breed_info(json_data['breeds'])
-            del json_data['breeds']
-        else:
-            breed_info = None
-        pic_info = convert_pic_info(json_data)
+    from pymeow.models import Cat, CatPic, LazyCat
+    breeds = cat_info.get('breeds')
+    if validate:
+        pic_info = convert_pic_info({**cat_info, 'breeds': None} if breeds is not None else cat_info)
+    else:
+        pic_info = construct_model(CatPic, cat_info, breeds=None)
+    if lazy:
+        cat = construct_model(LazyCat, {'image_info': pic_info})
+        del cat.__dict__['breed_info']
+        object.__setattr__(cat, "__pydantic_private__", {'_raw_breeds': breeds, '_validate_breeds': validate})
+        return cat
+    breed_info = convert_breed_info(breeds, validate) if breeds is not None else None
+    if validate:
         return Cat(breed_info=breed_info, image_info=pic_info)
-    result_list = []
-    for i in json_data:
-        if 'breeds' in i:
-            breed_info = convert_breed_info(i['breeds'])
-            del i['breeds']
-        else:
-            breed_info = None
-        pic_info = convert_pic_info(i)
-        result_list.append(Cat(breed_info=breed_info, image_info=pic_info))
-    return result_list
+    return construct_model(Cat, {'image_info': pic_info, 'breed_info': breed_info})
+
+
+def convert_json_to_obj(json_data: List[dict], validate: bool = True,
+                        lazy: bool = False) -> Union[List[Cat], Cat]:
+    """
+    A function that converts a list of dictionaries to Cat objects. The input is not modified.
+
+    Parameters:
+        json_data (List[dict]): A list of dictionaries containing information about the cat images.
+        validate (bool): Whether to validate the data. Pass False for trusted data, e.g. API responses,
+         to skip pydantic validation.
+        lazy (bool): Whether to build the breeds of every cat only when its breed_info is accessed.
+
+    Returns:
+        List[Cat] | Cat: A list of Cat objects, or a single Cat if the list contains one image.
+    """
+    if len(json_data) == 1:
+        return convert_cat(json_data[0], validate, lazy)
+    return [convert_cat(i, validate, lazy) for i in json_data]
+
+
+def split_image_path(file_path: str) -> Tuple[str, str]:
+    """
+    A function that splits a path to an image into the file name and the normalized path.
+
+    Parameters:
+        file_path (str): A path to the image.
+
+    Returns:
+        Tuple[str, str]: The image file name and the absolute path to the image.
+    """
+    image_path = os.path.abspath(os.path.expanduser(file_path))
+    return os.path.basename(image_path), image_path
+
+
+def clean_params(params: Optional[dict]) -> Optional[Dict[str, str]]:
+    """
+    A function that prepares query parameters the same way requests does: None values are dropped
+    and everything else is converted to a string.
+
+    Parameters:
+        params (dict): Query parameters of the request.
+
+    Returns:
+        Dict[str, str]: Query parameters that can be passed to any HTTP client.
+    """
+    if params is None:
+        return None
+    return {key: str(value) for key, value in params.items() if value is not None}
@@ -0,0 +1,182 @@
+import queue
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import TYPE_CHECKING, Dict, List, Tuple
+
+if TYPE_CHECKING:
+    from pymeow.models import UserVote
+
+
+class _PendingVote:
+    __slots__ = ("image_id", "sub_id", "value", "futures", "queued_at")
+
+    def __init__(self, image_id: str, sub_id: str, value: int) -> None:
+        self.image_id = image_id
+        self.sub_id = sub_id
+        self.value = value
+        self.futures: List[Future] = []
+        self.queued_at = time.monotonic()
+
+
+class VoteBatcher:
+    def __init__(self, client, max_batch: int = 50, flush_interval: float = 0.5, max_workers: int = 8,
+                 max_pending: int = 10000) -> None:
+        """
+        A batcher that accepts votes without waiting for the API and sends them concurrently in the background.
+        A batch is flushed when max_batch votes are queued or when the oldest vote has waited flush_interval.
+        Repeated votes of the same sub_id on the same image_id that are still queued are merged:
+        only the last value is sent and all their futures resolve to the same UserVote.
+
+        :param client: The Client used to send the votes.
+        :param max_batch: The number of queued votes that triggers a flush.
+        :param flush_interval: The maximum time in seconds a vote stays queued.
+        :param max_workers: The maximum number of votes sent at the same time.
+        :param max_pending: The maximum number of votes queued or in flight. Submitting more votes
+         blocks, or raises queue.Full if block is False.
+        """
+        self.client = client
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.stats: Dict[str, int] = {"submitted": 0, "merged": 0, "sent": 0, "failed": 0}
+        self._pending: "OrderedDict[Tuple[str, str], _PendingVote]" = OrderedDict()
+        self._in_flight: Dict[Future, None] = {}
+        self._outstanding = 0
+        self._flush_requested = False
+        self._closed = False
+        self._condition = threading.Condition()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="pymeow-vote")
+        self._thread = threading.Thread(target=self._run, name="pymeow-vote-batcher", daemon=True)
+        self._thread.start()
+
+    def submit(self, image_id: str, sub_id: str, value: int, block: bool = True,
+               timeout: float = None) -> "Future[UserVote]":
+        """
+        Queue a vote.
+
+        Parameters:
+            image_id (str): The ID of the image to vote on.
+            sub_id (str): The sub ID of the user who votes.
+            value (int): The value of the vote.
+            block (bool): Whether to wait for room when max_pending votes are already queued or in flight.
+            timeout (float): The maximum time in seconds to wait for room.
+
+        Returns:
+            Future[UserVote]: A future that resolves to the UserVote returned by the API.
+        """
+        future = Future()
+        key = (sub_id, image_id)
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("VoteBatcher is closed")
+            pending = self._pending.get(key)
+            if pending is None:
+                if not self._condition.wait_for(lambda: self._outstanding < self.max_pending,
+                                                timeout=timeout if block else 0):
+                    raise queue.Full(f"{self.max_pending} votes are already queued or in flight")
+                if self._closed:
+                    raise RuntimeError("VoteBatcher is closed")
+                # Another caller may have queued the same vote while this one waited for room.
+                pending = self._pending.get(key)
+            if pending is None:
+                pending = self._pending[key] = _PendingVote(image_id, sub_id, value)
+                self._outstanding += 1
+            else:
+                pending.value = value
+                self.stats["merged"] += 1
+            pending.futures.append(future)
+            self.stats["submitted"] += 1
+            if len(self._pending) == 1 or len(self._pending) >= self.max_batch:
+                # The first vote starts the flush_interval timer of the idle background thread.
+                self._condition.notify_all()
+        return future
+
+    def flush(self, wait_for_results: bool = True) -> None:
+        """
+        Send all queued votes now.
+
+        Parameters:
+            wait_for_results (bool): Whether to wait until every vote submitted so far has been sent.
+        """
+        with self._condition:
+            futures = [future for pending in self._pending.values() for future in pending.futures]
+            futures.extend(self._in_flight)
+            self._flush_requested = True
+            self._condition.notify_all()
+        if wait_for_results:
+            wait(futures)
+
+    def close(self, wait_for_results: bool = True) -> None:
+        """
+        Send the queued votes and stop the background workers.
+        """
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify_all()
+        self._thread.join()
+        self._executor.shutdown(wait=wait_for_results)
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while True:
+                    if self._pending and (self._closed or self._flush_requested
+                                          or len(self._pending) >= self.max_batch):
+                        break
+                    if not self._pending:
+                        if self._closed:
+                            return
+                        self._flush_requested = False
+                        self._condition.wait()
+                        continue
+                    oldest = next(iter(self._pending.values()))
+                    remaining = self.flush_interval - (time.monotonic() - oldest.queued_at)
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+                drain = self._closed or self._flush_requested
+                batch = []
+                while self._pending and (drain or len(batch) < self.max_batch):
+                    batch.append(self._pending.popitem(last=False)[1])
+                if not self._pending:
+                    self._flush_requested = False
+                for pending in batch:
+                    for future in pending.futures:
+                        self._in_flight[future] = None
+            for pending in batch:
+                self._executor.submit(self._send, pending)
+
+    def _send(self, pending: _PendingVote) -> None:
+        futures = [future for future in pending.futures if future.set_running_or_notify_cancel()]
+        try:
+            if futures:
+                vote = self.client.vote(pending.image_id, pending.sub_id, pending.value)
+                for future in futures:
+                    future.set_result(vote)
+        except Exception as exc:
+            for future in futures:
+                future.set_exception(exc)
+            with self._condition:
+                self.stats["failed"] += 1
+        else:
+            with self._condition:
+                self.stats["sent"] += 1 if futures else 0
+        finally:
+            with self._condition:
+                for future in pending.futures:
+                    self._in_flight.pop(future, None)
+                self._outstanding -= 1
+                self._condition.notify_all()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def __repr__(self):
+        return f"VoteBatcher(max_batch={self.max_batch}, flush_interval={self.flush_interval}, stats={self.stats})"
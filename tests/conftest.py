@@ -0,0 +1,24 @@
+import os
+import sys
+
+import pytest
+
+# The mock Cat API lives with the benchmarks, which import their siblings directly.
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks"))
+
+from mock_server import MockCatAPI  # noqa: E402
+
+
+@pytest.fixture
+def api():
+    with MockCatAPI() as api:
+        yield api
+
+
+@pytest.fixture
+def client(api):
+    from pymeow.client import Client
+
+    with Client(api_key="test-key") as client:
+        client.uri = api.uri
+        yield client
@@ -0,0 +1,37 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from pymeow.async_client import AsyncClient  # noqa: E402
+from pymeow.exceptions import RequestException  # noqa: E402
+from pymeow.hooks import RequestMetrics  # noqa: E402
+
+
+def run(api, call, **options):
+    async def main():
+        async with AsyncClient(api_key="test-key", **options) as client:
+            client.uri = api.uri
+            return await call(client)
+
+    return asyncio.run(main())
+
+
+def test_get_all_breeds(api):
+    assert len(run(api, lambda client: client.get_all_breeds())) == 67
+
+
+@pytest.mark.parametrize("method", ["get_all_breeds", "get_breed_info"])
+def test_error_responses_raise(api, method):
+    api.error_rate = 1.0
+    with pytest.raises(RequestException):
+        run(api, lambda client: getattr(client, method)(*(["Breed 1"] if method == "get_breed_info" else [])))
+
+
+def test_timeouts_raise_request_exception_and_reach_the_hooks(api):
+    api.latency = 1.0
+    metrics = RequestMetrics()
+    with pytest.raises(RequestException):
+        run(api, lambda client: client.get_version(), timeout=0.2, hooks=[metrics])
+    assert metrics.stats()["GET /"]["errors"]
@@ -0,0 +1,95 @@
+import time
+
+from pymeow.cache import CacheEntry, ResponseCache, SQLiteCacheBackend
+
+
+class Loader:
+    """
+    A load function for ResponseCache.fetch that answers with the queued responses and records the validators.
+    """
+
+    def __init__(self, *responses) -> None:
+        self.responses = list(responses)
+        self.validators = []
+
+    def __call__(self, validators: dict) -> tuple:
+        self.validators.append(validators)
+        return self.responses.pop(0)
+
+
+def build(payload):
+    return {"built": payload}
+
+
+def expire(cache: ResponseCache, key: str) -> None:
+    cache.get(key).expires_at = time.time() - 1
+
+
+def test_fresh_entry_is_served_without_loading():
+    cache = ResponseCache()
+    load = Loader((200, [1], '"v1"', None))
+    first = cache.fetch("breeds", "k", load, build)
+    assert cache.fetch("breeds", "k", load, build) is first
+    assert len(load.validators) == 1
+    assert (cache.stats.misses, cache.stats.hits) == (1, 1)
+
+
+def test_stale_entry_is_revalidated_with_its_validators():
+    cache = ResponseCache()
+    load = Loader((200, [1], '"v1"', "Mon, 01 Jan 2024 00:00:00 GMT"), (304, None, None, None))
+    first = cache.fetch("breeds", "k", load, build)
+    expire(cache, "k")
+    assert cache.fetch("breeds", "k", load, build) is first
+    assert load.validators[1] == {"If-None-Match": '"v1"', "If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT"}
+    assert cache.stats.revalidations == 1
+    assert cache.get("k").fresh
+
+
+def test_stale_entry_is_replaced_when_it_changed():
+    cache = ResponseCache()
+    load = Loader((200, [1], '"v1"', None), (200, [2], '"v2"', None))
+    cache.fetch("breeds", "k", load, build)
+    expire(cache, "k")
+    assert cache.fetch("breeds", "k", load, build) == {"built": [2]}
+    assert cache.get("k").etag == '"v2"'
+    assert cache.stats.misses == 2
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = ResponseCache(maxsize=2)
+    for key in ("a", "b"):
+        cache.set(key, CacheEntry("breeds", key))
+    cache.get("a")
+    cache.set("c", CacheEntry("breeds", "c"))
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+    assert cache.stats.evictions == 1
+
+
+def test_invalidate_drops_the_endpoint_and_its_sub_endpoints():
+    cache = ResponseCache()
+    cache.set("1", CacheEntry("breeds", 1))
+    cache.set("2", CacheEntry("breeds/search", 2))
+    cache.set("3", CacheEntry("version", 3))
+    cache.invalidate("breeds")
+    assert [key for key in "123" if cache.get(key) is not None] == ["3"]
+
+
+def test_sqlite_backend_survives_a_restart(tmp_path):
+    path = str(tmp_path / "cache.db")
+    cache = ResponseCache(backend=SQLiteCacheBackend(path))
+    cache.fetch("breeds", "k", Loader((200, [1, 2], '"v1"', None)), build)
+    cache.backend.close()
+    restarted = ResponseCache(backend=SQLiteCacheBackend(path))
+    load = Loader()
+    assert restarted.fetch("breeds", "k", load, build) == {"built": [1, 2]}
+    assert load.validators == []
+    restarted.backend.close()
+
+
+def test_client_serves_cached_breeds_without_a_request(api, client):
+    client.cache = ResponseCache()
+    breeds = client.get_all_breeds()
+    requests = api.stats["requests"]
+    assert client.get_all_breeds() is breeds
+    assert api.stats["requests"] == requests
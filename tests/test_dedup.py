@@ -0,0 +1,83 @@
+import random
+
+import pytest
+
+from pymeow.dedup import BloomFilter, Harvester
+from pymeow.records import Cat, CatPic
+
+
+def test_bloom_filter_never_forgets_an_item():
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    added = sum(bloom.add(f"id{i}") for i in range(1000))
+    assert all(f"id{i}" in bloom for i in range(1000))
+    assert not bloom.add("id0")
+    # An item taken for a duplicate by mistake is not counted.
+    assert len(bloom) == added > 980
+
+
+def test_bloom_filter_false_positive_rate():
+    bloom = BloomFilter(capacity=5000, error_rate=0.01)
+    for i in range(5000):
+        bloom.add(f"id{i}")
+    false_positives = sum(f"other{i}" in bloom for i in range(20000))
+    assert false_positives / 20000 < 0.02
+    assert bloom.current_error_rate == pytest.approx(0.01, rel=0.2)
+
+
+def test_bloom_filter_save_and_load(tmp_path):
+    path = str(tmp_path / "seen.bloom")
+    bloom = BloomFilter.open(path, capacity=100)
+    bloom.add("abc")
+    bloom.save(path)
+    loaded = BloomFilter.open(path)
+    assert "abc" in loaded and "xyz" not in loaded
+    assert (loaded.size, loaded.hashes, len(loaded)) == (bloom.size, bloom.hashes, 1)
+    (tmp_path / "bad.bloom").write_bytes(b"nope")
+    with pytest.raises(ValueError):
+        BloomFilter.load(str(tmp_path / "bad.bloom"))
+
+
+class RandomClient:
+    """
+    Serves random samples of a fixed set of images, like images/search with order=RAND.
+    """
+    api_key = "test-key"
+
+    def __init__(self, images: int, ids=None) -> None:
+        self.ids = ids if ids is not None else [f"img{i}" for i in range(images)]
+        self.random = random.Random(0)
+        self.requests = 0
+
+    def get_cat(self, limit, has_breeds=False, breed_ids=None):
+        self.requests += 1
+        return [Cat(image_info=CatPic(id=image_id)) for image_id in self.random.sample(self.ids, limit)]
+
+
+def test_harvest_yields_each_image_once_and_stops_at_low_yield():
+    harvester = Harvester(RandomClient(300), min_yield=0.05, window=5, batch_size=20)
+    ids = [cat.image_info.id for cat in harvester.harvest()]
+    assert len(ids) == len(set(ids)) > 250
+    assert harvester.stats.stopped == "low_yield"
+    assert harvester.stats.new == len(ids)
+    assert harvester.stats.fetched == 20 * harvester.stats.requests
+
+
+def test_max_images_counts_only_the_examined_cats():
+    harvester = Harvester(RandomClient(1000), batch_size=100)
+    assert len(list(harvester.harvest(max_images=3))) == 3
+    assert harvester.stats.stopped == "max_images"
+    assert (harvester.stats.fetched, harvester.stats.duplicates) == (3, 0)
+
+
+def test_max_requests():
+    client = RandomClient(1000)
+    harvester = Harvester(client, batch_size=10)
+    list(harvester.harvest(max_requests=4))
+    assert (client.requests, harvester.stats.stopped) == (4, "max_requests")
+
+
+def test_cats_without_an_id_are_skipped():
+    harvester = Harvester(RandomClient(0, ids=[None, None, "a", "b"]), batch_size=4)
+    ids = [cat.image_info.id for cat in harvester.harvest(max_requests=2)]
+    assert sorted(ids) == ["a", "b"]
+    assert harvester.stats.fetched == 4
@@ -0,0 +1,119 @@
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from pymeow.downloader import ImageDownloader
+from pymeow.models import CatPic
+
+IMAGE = bytes(range(256)) * 40
+
+
+class _ImageHandler(BaseHTTPRequestHandler):
+    """
+    Serves IMAGE at any path and honours Range requests like a CDN.
+    """
+    protocol_version = "HTTP/1.1"
+    ranges = []
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        start = 0
+        header = self.headers.get("Range")
+        self.ranges.append(header)
+        if header:
+            start = int(header.split("=")[1].rstrip("-"))
+            if start >= len(IMAGE):
+                self.send_response(416)
+                self.send_header("Content-Range", f"bytes */{len(IMAGE)}")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+        body = IMAGE[start:]
+        self.send_response(206 if header else 200)
+        if header:
+            self.send_header("Content-Range", f"bytes {start}-{len(IMAGE) - 1}/{len(IMAGE)}")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def cdn():
+    handler = type("Handler", (_ImageHandler,), {"ranges": []})
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    server.ranges = handler.ranges
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def pic(cdn, image_id: str = "abc") -> CatPic:
+    host, port = cdn.server_address[:2]
+    return CatPic(id=image_id, url=f"http://{host}:{port}/images/{image_id}.jpg")
+
+
+def read(path: str) -> bytes:
+    with open(path, "rb") as file:
+        return file.read()
+
+
+@pytest.fixture
+def downloader(tmp_path):
+    with ImageDownloader(str(tmp_path), max_workers=4) as downloader:
+        yield downloader
+
+
+def test_download(cdn, downloader, tmp_path):
+    report = downloader.download([pic(cdn, "a"), pic(cdn, "b")])
+    assert report.downloaded == 2 and report.bytes == 2 * len(IMAGE)
+    assert read(tmp_path / "a.jpg") == IMAGE
+    assert not os.path.exists(tmp_path / "a.jpg.part")
+
+
+def test_saved_images_are_skipped(cdn, downloader, tmp_path):
+    downloader.download([pic(cdn)])
+    report = downloader.download([pic(cdn)])
+    assert report.skipped == 1 and cdn.ranges == [None]
+
+
+def test_partial_download_is_resumed(cdn, downloader, tmp_path):
+    (tmp_path / "abc.jpg.part").write_bytes(IMAGE[:1000])
+    result = downloader.download_one(pic(cdn))
+    assert (result.status, result.bytes) == ("resumed", len(IMAGE) - 1000)
+    assert cdn.ranges == ["bytes=1000-"]
+    assert read(tmp_path / "abc.jpg") == IMAGE
+
+
+def test_complete_partial_file_is_kept_on_416(cdn, downloader, tmp_path):
+    (tmp_path / "abc.jpg.part").write_bytes(IMAGE)
+    assert downloader.download_one(pic(cdn)).status == "resumed"
+    assert read(tmp_path / "abc.jpg") == IMAGE
+
+
+def test_oversized_partial_file_is_downloaded_again_on_416(cdn, downloader, tmp_path):
+    (tmp_path / "abc.jpg.part").write_bytes(IMAGE + b"garbage")
+    assert downloader.download_one(pic(cdn)).status == "downloaded"
+    assert cdn.ranges == [f"bytes={len(IMAGE) + 7}-", None]
+    assert read(tmp_path / "abc.jpg") == IMAGE
+
+
+def test_duplicate_images_are_downloaded_once(cdn, downloader, tmp_path):
+    (tmp_path / "abc.jpg.part").write_bytes(IMAGE[:1000])
+    report = downloader.download([pic(cdn)] * 4)
+    assert (report.downloaded, report.skipped) == (1, 3)
+    assert len(cdn.ranges) == 1
+    assert read(tmp_path / "abc.jpg") == IMAGE
+
+
+def test_records_are_accepted(cdn, downloader, tmp_path):
+    from pymeow import records
+
+    cat = records.Cat(image_info=records.CatPic(**pic(cdn).model_dump()))
+    assert downloader.download(cat).downloaded == 1
+    assert downloader.download([records.CatPic(**pic(cdn, "b").model_dump())]).downloaded == 1
@@ -0,0 +1,39 @@
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+
+def run(code: str) -> None:
+    # A fresh interpreter, since this one has imported everything already.
+    subprocess.run([sys.executable, "-c", textwrap.dedent(code)], check=True)
+
+
+def test_client_exceptions_import_before_any_client():
+    run("""
+        from pymeow.client import EmptyTokenException, RequestException
+        from pymeow.exceptions import RequestException as expected
+        assert RequestException is expected
+    """)
+
+
+def test_unknown_client_attribute_raises_attribute_error():
+    import pymeow.client
+
+    with pytest.raises(AttributeError):
+        pymeow.client.missing
+
+
+def test_helpers_do_not_import_pydantic_in_records_mode():
+    run("""
+        import sys
+        from pymeow import breed_index, client, leaderboard, vote_batcher
+        from pymeow.records import UserVote
+
+        board = leaderboard.VoteLeaderboard()
+        board.apply(UserVote(id=1, image_id="abc", sub_id="user-1", value=1))
+        assert board.top_images(1)[0][0] == "abc"
+        client.Client(records=True)
+        assert "pydantic" not in sys.modules, "pydantic was imported"
+    """)
@@ -0,0 +1,175 @@
+import time
+
+import pytest
+from requests.models import Response
+
+from pymeow.exceptions import RequestException
+from pymeow.hooks import RequestHook
+from pymeow.key_pool import KeyPool
+
+KEYS = ["key-aaaa", "key-bbbb", "key-cccc"]
+
+
+def make_response(status: int, **headers) -> Response:
+    response = Response()
+    response.status_code = status
+    response.headers.update({name.replace("_", "-"): value for name, value in headers.items()})
+    return response
+
+
+def test_requests_spread_over_the_least_busy_keys():
+    pool = KeyPool(KEYS)
+    assert sorted(pool.acquire() for _ in KEYS) == KEYS
+    pool.release("key-bbbb", make_response(200))
+    assert pool.acquire() == "key-bbbb"
+
+
+def test_pinned_requests_stick_to_one_key():
+    pool = KeyPool(KEYS)
+    owners = {pin: pool.acquire(pin) for pin in (f"sub_id:user-{i}" for i in range(30))}
+    assert len(set(owners.values())) == 3
+    assert all(pool.acquire(pin) == key for pin, key in owners.items())
+
+
+def test_disabling_a_key_only_moves_its_own_pins():
+    pool = KeyPool(KEYS)
+    owners = {pin: pool.acquire(pin) for pin in (f"sub_id:user-{i}" for i in range(30))}
+    pool.release("key-aaaa", make_response(401))
+    moved = {pin for pin, key in owners.items() if pool.acquire(pin) != key}
+    assert moved == {pin for pin, key in owners.items() if key == "key-aaaa"}
+
+
+def test_remembered_resources_use_their_key():
+    pool = KeyPool(KEYS)
+    pool.remember("votes/1", "key-cccc")
+    assert pool.acquire("votes/1") == "key-cccc"
+
+
+def test_throttled_key_is_benched_for_retry_after():
+    pool = KeyPool(KEYS[:2])
+    key = pool.acquire("sub_id:a")
+    assert pool.release(key, make_response(429, Retry_After="0.2"))
+    assert {pool.acquire() for _ in range(3)} == set(KEYS[:2]) - {key}
+    with pytest.raises(TimeoutError):
+        pool.acquire("sub_id:a", timeout=0.05)
+    started = time.monotonic()
+    assert pool.acquire("sub_id:a") == key
+    assert time.monotonic() - started >= 0.1
+
+
+def test_rejected_keys_are_dropped():
+    pool = KeyPool(KEYS[:1])
+    assert pool.release(pool.acquire(), make_response(401))
+    with pytest.raises(RequestException):
+        pool.acquire()
+    assert list(pool.stats().values())[0]["disabled"]
+
+
+def test_rate_and_quota_budgets():
+    pool = KeyPool(KEYS[:1], rate=20, burst=1, quota=3, quota_period=0.3)
+    started = time.monotonic()
+    for _ in range(3):
+        pool.release(pool.acquire(), make_response(200))
+    assert 0.09 <= time.monotonic() - started < 0.3
+    pool.acquire()
+    assert time.monotonic() - started >= 0.3
+
+
+def test_keys_are_masked():
+    pool = KeyPool(KEYS)
+    assert "key-" not in repr(pool) and "key-" not in str(pool.stats())
+    with pytest.raises(ValueError):
+        KeyPool([])
+
+
+@pytest.fixture
+def keyed_api(api):
+    """
+    The mock API answering 401 to key-aaaa and 429 to the first request of key-bbbb.
+    """
+    seen = []
+
+    def serve(handler, method):
+        key = handler.headers.get("x-api-key")
+        seen.append(key)
+        status = 401 if key == "key-aaaa" else 429 if key == "key-bbbb" and seen.count(key) == 1 else None
+        if status is None:
+            return type(handler).__mro__[1]._serve(handler, method)
+        handler.rfile.read(int(handler.headers.get("Content-Length") or 0))
+        handler.send_response(status)
+        handler.send_header("Content-Length", "2")
+        handler.send_header("Retry-After", "0.2")
+        handler.end_headers()
+        handler.wfile.write(b"{}")
+
+    handler_class = api.server.RequestHandlerClass
+    api.server.RequestHandlerClass = type("KeyedHandler", (handler_class,), {"_serve": serve})
+    api.seen = seen
+    return api
+
+
+@pytest.fixture
+def pooled_client(keyed_api):
+    from pymeow.client import Client
+
+    with Client(api_key=KeyPool(KEYS)) as client:
+        client.uri = keyed_api.uri
+        yield client
+
+
+def test_client_fails_over_to_another_key(keyed_api, pooled_client):
+    assert len(pooled_client.get_all_breeds()) == 67
+    for _ in range(5):
+        pooled_client.get_version()
+    stats = pooled_client.key_pool.stats()
+    assert [entry["disabled"] for entry in stats.values()] == [True, False, False]
+    assert sum(entry["throttled"] for entry in stats.values()) == 1
+    assert all(entry["in_flight"] == 0 for entry in stats.values())
+    assert keyed_api.seen.count("key-aaaa") == 1
+
+
+def test_client_deletes_a_vote_with_the_key_that_created_it(keyed_api, pooled_client):
+    vote = pooled_client.vote("abc", sub_id="user-1", value=1)
+    owner = keyed_api.seen[-1]
+    assert pooled_client.delete_vote(vote.id) == {"message": "SUCCESS"}
+    assert keyed_api.seen[-1] == owner
+
+
+def test_key_is_released_when_a_hook_fails(pooled_client):
+    class Failing(RequestHook):
+        def before_request(self, info) -> None:
+            raise RuntimeError("hook")
+
+    pooled_client.hooks.append(Failing())
+    with pytest.raises(RuntimeError):
+        pooled_client.get_version()
+    assert all(entry["in_flight"] == 0 for entry in pooled_client.key_pool.stats().values())
+
+
+def test_key_pool_is_not_leaked_in_repr(pooled_client):
+    assert "key-" not in repr(pooled_client)
+
+
+def test_async_client_rejects_a_key_pool():
+    pytest.importorskip("aiohttp")
+    from pymeow.async_client import AsyncClient
+
+    with pytest.raises(TypeError):
+        AsyncClient(api_key=KeyPool(KEYS))
+
+
+def test_throttled_pinned_request_waits_for_its_key(keyed_api, pooled_client):
+    sub_id = next(f"user-{i}" for i in range(100) if KeyPool(KEYS).acquire(f"sub_id:user-{i}") == "key-bbbb")
+    started = time.monotonic()
+    assert pooled_client.vote("abc", sub_id=sub_id, value=1).sub_id == sub_id
+    assert keyed_api.seen == ["key-bbbb", "key-bbbb"]
+    assert time.monotonic() - started >= 0.15
+
+
+def test_throttled_upload_is_sent_again_in_full(keyed_api, pooled_client, tmp_path):
+    sub_id = next(f"user-{i}" for i in range(100) if KeyPool(KEYS).acquire(f"sub_id:user-{i}") == "key-bbbb")
+    path = tmp_path / "cat.jpg"
+    path.write_bytes(b"\xff\xd8" + b"cat" * 50_000)
+    image = pooled_client.upload_image(str(path), sub_id=sub_id)
+    assert image.sub_id == sub_id and image.original_filename == "cat.jpg"
+    assert keyed_api.seen == ["key-bbbb", "key-bbbb"]
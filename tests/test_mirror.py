@@ -0,0 +1,125 @@
+import pytest
+
+from pymeow.hooks import RequestHook
+from pymeow.mirror import UploadMirror
+from pymeow.models import CatPic
+
+
+@pytest.fixture
+def api():
+    from mock_server import MockCatAPI
+
+    with MockCatAPI(images=1000) as api:
+        yield api
+
+
+@pytest.fixture
+def mirror(client, tmp_path):
+    with UploadMirror(str(tmp_path / "mirror.db"), client) as mirror:
+        mirror.sync()
+        yield mirror
+
+
+def new_image(image_id: str) -> dict:
+    return {"id": image_id, "url": f"https://cdn2.thecatapi.com/images/{image_id}.jpg", "width": 1, "height": 1,
+            "sub_id": "user-new", "breed_ids": None, "created_at": "2030-01-01T00:00:00.000Z"}
+
+
+class UploadDuringScan(RequestHook):
+    """
+    Uploads an image right before the given request, so the pages that follow shift by one.
+    """
+
+    def __init__(self, api, before: int) -> None:
+        self.api = api
+        self.before = before
+        self.sent = 0
+
+    def before_request(self, info) -> None:
+        self.sent += 1
+        if self.sent == self.before:
+            self.api.images.append(new_image(f"new{self.sent}"))
+
+
+def test_first_sync_downloads_everything(api, mirror):
+    assert len(mirror) == 1000
+    assert mirror.count(sub_id="user-3") == 100
+    assert {image.id for image in mirror.query(breed_id="b005")} == {
+        image["id"] for image in api.images if image["breed_ids"] == "b005"}
+
+
+def test_next_sync_downloads_only_new_images(api, mirror):
+    api.images.append(new_image("new"))
+    report = mirror.sync()
+    assert report.inserted == 1
+    assert report.fetched < 100
+    assert mirror.checkpoint == "2030-01-01T00:00:00.000Z"
+    assert mirror.query(sub_id="user-new")[0].id == "new"
+
+
+def test_full_check_deletes_images_missing_from_the_account(api, mirror):
+    deleted = {image["id"] for image in api.images[::7]}
+    api.images = [image for image in api.images if image["id"] not in deleted]
+    assert mirror.check_deletions().deleted == len(deleted)
+    assert len(mirror) == 1000 - len(deleted)
+
+
+def test_windows_cover_the_account_and_wrap_around(api, mirror):
+    deleted = {image["id"] for image in api.images[::50]}
+    api.images = [image for image in api.images if image["id"] not in deleted]
+    reports = [mirror.check_deletions(pages=3) for _ in range(4)]
+    # Every window also compares the images between it and the previous one: one pass finds every deletion.
+    assert sum(report.deleted for report in reports) == len(deleted)
+    assert mirror._get_state("deletion_cursor") == "0"
+    assert {image["id"] for image in api.images} == {image.id for image in mirror.query()}
+
+
+def listing(api) -> list:
+    return sorted(api.images, key=lambda image: image["created_at"], reverse=True)
+
+
+def test_deletion_between_two_windows_is_found(api, mirror):
+    deleted = listing(api)[300]["id"]
+    api.images = [image for image in api.images if image["id"] != deleted]
+    assert sum(mirror.check_deletions(pages=3).deleted for _ in range(3)) == 1
+    assert deleted not in {image.id for image in mirror.query()}
+
+
+@pytest.mark.parametrize("shift", [30, 150])
+def test_deletions_before_the_next_window_keep_the_images_between_them(api, mirror, shift):
+    mirror.check_deletions(pages=3)
+    deleted = {image["id"] for image in listing(api)[:shift]}
+    api.images = [image for image in api.images if image["id"] not in deleted]
+    mirror.check_deletions(pages=3)
+    # Pages 3 to 5 moved up by shift images: the ones now on page 2 must not be taken for deleted.
+    assert {image["id"] for image in api.images} <= {image.id for image in mirror.query()}
+
+
+@pytest.mark.parametrize("before", [2, 3, 5])
+def test_upload_during_a_windowed_check_deletes_nothing(api, client, mirror, before):
+    client.hooks.append(UploadDuringScan(api, before))
+    report = mirror.check_deletions(pages=5)
+    assert report.fetched == 500
+    assert report.deleted == 0
+    assert len(mirror) == 1000
+
+
+def test_upload_during_a_full_check_deletes_nothing(api, client, mirror):
+    client.hooks.append(UploadDuringScan(api, 4))
+    assert mirror.check_deletions().deleted == 0
+    assert len(mirror) == 1000
+
+
+class UndatedClient:
+    """
+    A client whose listing has no created_at: the window cannot be placed among the local images.
+    """
+
+    def iter_upload_images(self, limit, order, page=0, max_pages=None, prefetch=1):
+        return iter([CatPic(id=f"other{i}") for i in range(limit * (max_pages or 1))])
+
+
+def test_window_without_dates_deletes_nothing(mirror):
+    mirror.client = UndatedClient()
+    assert mirror.check_deletions(pages=2).deleted == 0
+    assert len(mirror) == 1000
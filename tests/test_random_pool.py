@@ -0,0 +1,44 @@
+import time
+
+import pytest
+
+from pymeow.random_pool import RandomCatPool
+
+
+class FakeClient:
+    """
+    A client whose get_cat returns nothing for unknown breed_ids, like the API.
+    """
+
+    api_key = "test-key"
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def get_cat(self, limit, has_breeds=False, breed_ids=None):
+        self.calls += 1
+        return [] if breed_ids == "nope" else [f"cat{self.calls}-{i}" for i in range(limit)]
+
+
+@pytest.fixture
+def fake():
+    return FakeClient()
+
+
+def test_empty_batch_returns_none_without_refilling_again(fake):
+    with RandomCatPool(fake, capacity=10) as pool:
+        started = time.monotonic()
+        assert pool.get(breed_ids="nope", timeout=1) is None
+        assert time.monotonic() - started < 0.5
+        assert pool.get(breed_ids="nope", timeout=1) is None
+        assert fake.calls == 1
+        assert pool.stats(breed_ids="nope").empty_batches == 1
+        assert pool.get() is not None
+
+
+def test_empty_pool_asks_again_after_the_backoff(fake):
+    with RandomCatPool(fake, capacity=10, empty_backoff=0.1) as pool:
+        assert pool.get(breed_ids="nope", timeout=1) is None
+        time.sleep(0.2)
+        assert pool.get(breed_ids="nope", timeout=1) is None
+        assert fake.calls == 2
@@ -0,0 +1,25 @@
+import pytest
+
+from pymeow import models, records
+from pymeow.utils import convert_json_to_obj
+
+CAT = {"id": "abc", "url": "https://cdn2.thecatapi.com/images/abc.jpg", "width": 10, "height": 20,
+       "breeds": [{"id": "beng", "name": "Bengal", "weight": {"metric": "3 - 7"}, "energy_level": 5}]}
+
+
+@pytest.mark.parametrize("name", ["CatPic", "Breed", "Cat", "UserVote", "Fact"])
+def test_records_have_the_fields_of_the_models(name):
+    # records.py must not import pydantic, so its fields are listed by hand: this catches any drift.
+    assert getattr(records, name).__slots__ == tuple(getattr(models, name).model_fields)
+
+
+def test_records_dump_like_the_models():
+    assert records.convert_json_to_obj([CAT]).model_dump() == convert_json_to_obj([CAT]).model_dump()
+
+
+def test_records_compare_by_value_and_copy():
+    pic = records.CatPic(id="abc", unknown=1)
+    assert pic == records.CatPic(id="abc") != records.CatPic(id="xyz")
+    assert pic.model_copy({"width": 5}).width == 5 and pic.width is None
+    with pytest.raises(TypeError):
+        hash(pic)
@@ -0,0 +1,109 @@
+import threading
+import time
+from email.utils import formatdate
+
+import pytest
+from requests.models import Response
+
+from pymeow.scheduler import Priority, RequestScheduler, TokenBucket, parse_retry_after
+
+
+def make_response(status: int, **headers) -> Response:
+    response = Response()
+    response.status_code = status
+    response.headers.update({name.replace("_", "-"): value for name, value in headers.items()})
+    return response
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after("-1") == 0.0
+    assert 8 < parse_retry_after(formatdate(time.time() + 10, usegmt=True)) <= 10
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+
+
+def test_token_bucket_delay():
+    bucket = TokenBucket(rate=10, burst=1)
+    now = time.monotonic()
+    assert bucket.delay(now) == 0.0
+    bucket.consume()
+    assert bucket.delay(bucket.updated) == pytest.approx(0.1)
+
+
+@pytest.mark.parametrize("attempt", [0, 1, 2])
+def test_retryable_status_backs_off_exponentially(attempt):
+    scheduler = RequestScheduler(backoff_base=0.5)
+    for _ in range(20):
+        delay = scheduler.retry_delay("GET", attempt, response=make_response(503))
+        assert 0 <= delay <= 0.5 * 2 ** attempt
+
+
+def test_backoff_is_capped():
+    scheduler = RequestScheduler(max_retries=10, backoff_base=1, backoff_max=2)
+    assert all(scheduler.retry_delay("GET", 8, response=make_response(503)) <= 2 for _ in range(20))
+
+
+def test_requests_that_must_not_be_retried():
+    scheduler = RequestScheduler(max_retries=2)
+    assert scheduler.retry_delay("GET", 0, response=make_response(200)) is None
+    assert scheduler.retry_delay("GET", 0, response=make_response(404)) is None
+    assert scheduler.retry_delay("POST", 0, response=make_response(503)) is None
+    assert scheduler.retry_delay("GET", 2, response=make_response(503)) is None
+    assert scheduler.retry_delay("GET", 0) is None
+
+
+def test_connection_errors_are_retried():
+    assert RequestScheduler().retry_delay("GET", 0, error=ConnectionError()) is not None
+
+
+def test_retry_after_is_honoured_and_blocks_the_queue():
+    scheduler = RequestScheduler(backoff_base=0.01)
+    assert scheduler.retry_delay("GET", 0, response=make_response(429, Retry_After="0.2")) >= 0.2
+    assert scheduler.acquire() >= 0.15
+    assert scheduler.metrics()["throttled"] == 1
+
+
+def test_throttling_halves_the_rate_down_to_min_rate():
+    scheduler = RequestScheduler(rate=8, min_rate=3)
+    scheduler.observe(make_response(429))
+    assert scheduler.metrics()["current_rate"] == 4
+    scheduler.observe(make_response(429))
+    assert scheduler.metrics()["current_rate"] == 3
+    scheduler.observe(make_response(200))
+    assert scheduler.metrics()["current_rate"] == pytest.approx(3.4)
+
+
+def test_acquire_paces_requests():
+    scheduler = RequestScheduler(rate=20, burst=1)
+    started = time.monotonic()
+    for _ in range(4):
+        scheduler.acquire(Priority.DEFAULT)
+    assert time.monotonic() - started >= 0.14
+
+
+def test_higher_priority_goes_first():
+    scheduler = RequestScheduler()
+    scheduler.observe(make_response(503, Retry_After="0.2"))
+    served = []
+
+    def send(level: Priority) -> None:
+        scheduler.acquire(level)
+        served.append(level)
+
+    threads = [threading.Thread(target=send, args=(level,)) for level in (Priority.BULK, Priority.INTERACTIVE)]
+    for thread in threads:
+        thread.start()
+        time.sleep(0.05)
+    for thread in threads:
+        thread.join()
+    assert served == [Priority.INTERACTIVE, Priority.BULK]
+
+
+def test_client_retries_failed_requests(api, client):
+    api.error_rate = 1.0
+    client.scheduler = RequestScheduler(max_retries=2, backoff_base=0.01)
+    with pytest.raises(Exception):
+        client.get_all_breeds()
+    assert api.stats["requests"] == 3
+    assert client.scheduler.metrics()["retries"] == 2
@@ -0,0 +1,123 @@
+import json
+
+import pytest
+
+from pymeow.hooks import RequestMetrics
+from pymeow.streaming import iter_json_array
+
+ITEMS = [1, -2, 1.5, -0.25, 1e-3, 2.5E+10, 0, True, False, None, "a,]\"\\", "chat é 🐱", [], {},
+         [1, [2.0, {"x": -3e2}]], {"id": "abc", "breeds": [{"weight": {"metric": "3 - 5"}}], "n": 12345}]
+BODY = json.dumps(ITEMS, ensure_ascii=False).encode()
+
+
+@pytest.mark.parametrize("indent", [None, 2])
+def test_every_split_point(indent):
+    body = json.dumps(ITEMS, ensure_ascii=False, indent=indent).encode()
+    for offset in range(len(body) + 1):
+        assert list(iter_json_array([body[:offset], body[offset:]])) == ITEMS, offset
+
+
+def test_every_pair_of_split_points():
+    body = json.dumps([1.5e3, -12, "é", {"a": 10}, 7]).encode()
+    for first in range(len(body) + 1):
+        for second in range(first, len(body) + 1):
+            chunks = [body[:first], body[first:second], body[second:]]
+            assert list(iter_json_array(chunks)) == [1.5e3, -12, "é", {"a": 10}, 7], (first, second)
+
+
+def test_one_byte_chunks():
+    assert list(iter_json_array(BODY[i:i + 1] for i in range(len(BODY)))) == ITEMS
+
+
+@pytest.mark.parametrize("chunks", [[b"[1.", b"5]"], [b"[1.5e", b"3]"], [b"[1e", b"-3]"], [b"[-", b"7]"]])
+def test_numbers_cut_inside(chunks):
+    assert list(iter_json_array(chunks)) == [json.loads(b"".join(chunks))[0]]
+
+
+def test_items_are_yielded_before_the_end_of_the_body():
+    def chunks():
+        yield b'[{"a": 1}, '
+        raise AssertionError("read too far")
+
+    assert next(iter_json_array(chunks())) == {"a": 1}
+
+
+@pytest.mark.parametrize("body", [b"", b"{}", b"[1,]", b"[1 2]", b"[1", b"[,1]", b"[1.]", b"[tru]", b"[1]x"])
+def test_invalid_arrays(body):
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_json_array([body]))
+
+
+def test_empty_array():
+    assert list(iter_json_array([b" [ ", b"] "])) == []
+
+
+def test_client_streams_the_same_objects(client):
+    assert list(client.stream_all_breeds(chunk_size=512)) == client.get_all_breeds()
+    assert list(client.stream_votes(limit=50, sub_id="user-1")) == client.get_votes(limit=50, sub_id="user-1")
+    cats = list(client.stream_cats(limit=20, order="ASC", has_breeds=True))
+    assert [cat.image_info.id for cat in cats] == [cat.image_info.id for cat in
+                                                   client.get_cat(limit=20, order="ASC", has_breeds=True)]
+
+
+def test_records_mode_streams_records(api):
+    from pymeow.client import Client
+    from pymeow.records import Breed
+
+    with Client(api_key="test-key", records=True) as client:
+        client.uri = api.uri
+        assert all(isinstance(breed, Breed) for breed in client.stream_all_breeds())
+
+
+def test_streamed_bodies_are_counted_once_read(client):
+    metrics = RequestMetrics()
+    client.hooks.append(metrics)
+    list(client.stream_all_breeds())
+    streamed = metrics.stats()["GET breeds"]["bytes_in"]
+    client.get_all_breeds()
+    assert metrics.stats()["GET breeds"]["count"] == 2
+    assert metrics.stats()["GET breeds"]["bytes_in"] == 2 * streamed > 0
+
+
+def test_stream_closed_early_reports_the_bytes_read(client):
+    metrics = RequestMetrics()
+    client.hooks.append(metrics)
+    stream = client.stream_all_breeds(chunk_size=1024)
+    next(stream)
+    stream.close()
+    partial = metrics.stats()["GET breeds"]["bytes_in"]
+    client.get_all_breeds()
+    assert 1024 <= partial < metrics.stats()["GET breeds"]["bytes_in"] - partial
+
+
+def test_gzip_bodies_are_decompressed_while_streaming(client):
+    import gzip
+    import threading
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    breeds = [{"id": f"b{i}", "name": f"Breed {i}"} for i in range(500)]
+    body = gzip.compress(json.dumps(breeds).encode())
+
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, format, *args) -> None:
+            pass
+
+        def do_GET(self) -> None:
+            assert "gzip" in self.headers.get("Accept-Encoding", "")
+            self.send_response(200)
+            self.send_header("Content-Encoding", "gzip")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True).start()
+    metrics = RequestMetrics()
+    client.hooks.append(metrics)
+    try:
+        client.uri = f"http://127.0.0.1:{server.server_address[1]}/v1/"
+        assert [breed.id for breed in client.stream_all_breeds(chunk_size=256)] == [b["id"] for b in breeds]
+        assert metrics.stats()["GET breeds"]["bytes_in"] == len(json.dumps(breeds))
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,112 @@
+import queue
+import threading
+import time
+
+import pytest
+
+from pymeow.records import UserVote
+from pymeow.vote_batcher import VoteBatcher
+
+
+class VotingClient:
+    """
+    Records the votes it receives. While gate is cleared, votes block until it is set.
+    """
+
+    def __init__(self) -> None:
+        self.votes = []
+        self.gate = threading.Event()
+        self.gate.set()
+        self.lock = threading.Lock()
+
+    def vote(self, image_id: str, sub_id: str, value: int) -> UserVote:
+        self.gate.wait()
+        if value == 0:
+            raise ValueError("bad vote")
+        with self.lock:
+            self.votes.append((image_id, sub_id, value))
+            return UserVote(id=len(self.votes), image_id=image_id, sub_id=sub_id, value=value)
+
+
+@pytest.fixture
+def client():
+    return VotingClient()
+
+
+def test_queued_votes_of_a_user_on_an_image_are_merged(client):
+    with VoteBatcher(client, flush_interval=10) as batcher:
+        first = batcher.submit("img", "user", 1)
+        second = batcher.submit("img", "user", -1)
+        other = batcher.submit("img", "other", 1)
+        batcher.flush()
+    assert sorted(client.votes) == [("img", "other", 1), ("img", "user", -1)]
+    assert first.result() is second.result()
+    assert other.result().sub_id == "other"
+    assert batcher.stats["merged"] == 1 and batcher.stats["sent"] == 2
+
+
+def test_full_batch_is_sent_without_waiting(client):
+    with VoteBatcher(client, max_batch=3, flush_interval=10) as batcher:
+        futures = [batcher.submit(f"img{i}", "user", 1) for i in range(3)]
+        assert all(future.result(timeout=2) for future in futures)
+
+
+def test_old_votes_are_sent_after_flush_interval(client):
+    with VoteBatcher(client, flush_interval=0.05) as batcher:
+        started = time.monotonic()
+        batcher.submit("img", "user", 1).result(timeout=2)
+        assert time.monotonic() - started >= 0.04
+
+
+def test_close_sends_the_queued_votes(client):
+    batcher = VoteBatcher(client, flush_interval=10)
+    future = batcher.submit("img", "user", 1)
+    batcher.close()
+    assert future.result(timeout=0).value == 1
+    with pytest.raises(RuntimeError):
+        batcher.submit("img", "user", 1)
+
+
+def test_failures_reach_the_futures(client):
+    with VoteBatcher(client, flush_interval=10) as batcher:
+        future = batcher.submit("img", "user", 0)
+        batcher.flush()
+    with pytest.raises(ValueError):
+        future.result()
+    assert batcher.stats["failed"] == 1
+
+
+def test_pending_votes_are_bounded(client):
+    client.gate.clear()
+    with VoteBatcher(client, flush_interval=10, max_pending=2) as batcher:
+        in_flight = [batcher.submit(f"img{i}", "user", 1) for i in range(2)]
+        batcher.flush(wait_for_results=False)
+        with pytest.raises(queue.Full):
+            batcher.submit("img9", "user", 1, block=False)
+        with pytest.raises(queue.Full):
+            batcher.submit("img9", "user", 1, timeout=0.05)
+        client.gate.set()
+        assert batcher.submit("img9", "user", 1, timeout=2)
+        batcher.flush()
+    assert all(future.done() for future in in_flight)
+
+
+def test_blocked_votes_on_the_same_image_are_merged(client):
+    client.gate.clear()
+    with VoteBatcher(client, flush_interval=10, max_pending=2) as batcher:
+        for i in range(2):
+            batcher.submit(f"img{i}", "user", 1)
+        batcher.flush(wait_for_results=False)
+        futures = []
+        threads = [threading.Thread(target=lambda value=value: futures.append(batcher.submit("img", "user", value)))
+                   for value in (1, -1)]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.05)
+        client.gate.set()
+        for thread in threads:
+            thread.join(timeout=2)
+        batcher.flush()
+        assert len(futures) == 2 and all(future.done() for future in futures)
+        assert batcher._outstanding == 0
+    assert [vote for vote in client.votes if vote[0] == "img"] in ([("img", "user", 1)], [("img", "user", -1)])